@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Memoized review analysis results
+Hält Ergebnisse von analyze_review_sentiment pro (Kategorie, Stadt, max_places, Sprache)
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+AnalysisKey = Tuple[str, str, int, str]
+
+
+def _restore_pairs(value):
+    """JSON turns (phrase, count) tuples into lists; turn them back"""
+    if isinstance(value, dict):
+        return {k: _restore_pairs(v) for k, v in value.items()}
+    if isinstance(value, list):
+        if value and all(isinstance(v, list) and len(v) == 2 for v in value):
+            return [tuple(v) for v in value]
+        return [_restore_pairs(v) for v in value]
+    return value
+
+
+class AnalysisCache:
+    """In-process cache of review analysis results with TTL
+
+    Entries are keyed on ``(category, city, max_places, language)`` (category
+    and city compared case-insensitively) and expire after ``ttl`` seconds.
+    With a ``path`` the cache is also written to a JSON file after every
+    change and reloaded on start, so later runs can reuse fresh results.
+    Callers always get a copy, never the stored object.
+    """
+
+    def __init__(self, ttl: Optional[float] = 6 * 3600, path: Optional[str] = None):
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[AnalysisKey, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._load()
+
+    @staticmethod
+    def make_key(
+        category: str, city: str, max_places: int, language: str = "de"
+    ) -> AnalysisKey:
+        return (
+            category.strip().lower(),
+            city.strip().lower(),
+            int(max_places),
+            language.strip().lower(),
+        )
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created > self.ttl
+
+    def get(self, key: AnalysisKey) -> Optional[Dict]:
+        """Cached result for ``key`` or None if missing/expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0], now):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(self, key: AnalysisKey, result: Dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), copy.deepcopy(result))
+            self._save()
+
+    def invalidate(
+        self,
+        category: Optional[str] = None,
+        city: Optional[str] = None,
+        max_places: Optional[int] = None,
+        language: Optional[str] = None,
+    ) -> int:
+        """Drop matching entries (None matches everything); returns the count
+
+        ``invalidate()`` clears the cache, ``invalidate(city="Berlin")`` drops
+        every Berlin analysis.
+        """
+        wanted = (
+            category.strip().lower() if category is not None else None,
+            city.strip().lower() if city is not None else None,
+            max_places,
+            language.strip().lower() if language is not None else None,
+        )
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if all(w is None or w == k for w, k in zip(wanted, key))
+            ]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._save()
+        return len(stale)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Analyse-Cache {self.path} unlesbar, starte leer: {e}")
+            return
+
+        now = time.time()
+        for item in stored.get("entries", []):
+            key = tuple(item["key"])
+            if len(key) == 4 and not self._expired(item["created"], now):
+                self._entries[key] = (item["created"], _restore_pairs(item["result"]))
+
+    def _save(self) -> None:
+        """Write all live entries atomically (caller holds the lock)"""
+        if not self.path:
+            return
+
+        now = time.time()
+        entries = [
+            {"key": list(key), "created": created, "result": result}
+            for key, (created, result) in self._entries.items()
+            if not self._expired(created, now)
+        ]
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
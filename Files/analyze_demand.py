@@ -17,7 +17,9 @@ from typing import Dict, List, Any
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
+from analysis_cache import AnalysisCache
 from niche_research import ReviewDemandAnalyzer
+from response_cache import ResponseCache
 
 
 def _print_detailed_report(analysis: Dict[str, Any], ideas: List[Dict[str, Any]], category: str, city: str):
@@ -143,6 +145,37 @@ Examples:
         help="Delay between API calls in seconds (default: 1.0)",
     )
 
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="SQLite response cache for search/details calls (e.g. data/places_cache.sqlite)",
+    )
+
+    parser.add_argument(
+        "--analysis-cache",
+        metavar="PATH",
+        help="JSON file with analysis results to reuse across runs (e.g. data/analysis_cache.json)",
+    )
+
+    parser.add_argument(
+        "--analysis-ttl",
+        type=float,
+        default=6.0,
+        help="Hours a cached analysis stays valid (default: 6)",
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore a cached analysis for this category/city and fetch again",
+    )
+
+    parser.add_argument(
+        "--keyword-background",
+        metavar="PATH",
+        help="JSON keyword counts of earlier runs used to rank distinctive keywords (e.g. data/keyword_background.json)",
+    )
+
     parser.add_argument("--output", "-o", help="Save results to JSON file (optional)")
 
     parser.add_argument(
@@ -183,14 +216,26 @@ Examples:
 
     # Initialize analyzer
     try:
-        analyzer = ReviewDemandAnalyzer(api_key=api_key, delay=args.delay)
+        cache = ResponseCache(args.cache) if args.cache else None
+        analysis_cache = AnalysisCache(
+            ttl=args.analysis_ttl * 3600, path=args.analysis_cache
+        )
+        analyzer = ReviewDemandAnalyzer(
+            api_key=api_key,
+            delay=args.delay,
+            cache=cache,
+            analysis_cache=analysis_cache,
+            keyword_background=args.keyword_background,
+        )
+        if args.refresh:
+            analyzer.invalidate_analysis(category=args.category, city=args.city)
     except Exception as e:
         print(f"❌ Error initializing analyzer: {e}")
         sys.exit(1)
 
     # Run analysis
     try:
-        # Always run analysis once and cache results to avoid redundant API calls
+        # generate_content_ideas reuses the memoized analysis (no second fetch)
         try:
             analysis = analyzer.analyze_review_sentiment(
                 category=args.category,
@@ -228,14 +273,14 @@ Examples:
             # Print full detailed report using cached data
             _print_detailed_report(analysis, ideas, args.category, args.city)
 
-        # Save to JSON if requested (reusing cached results)
+        # Save to JSON if requested
         if args.output:
 
             output_data = {
                 "category": args.category,
                 "city": args.city,
-                "analysis": cached_analysis,
-                "content_ideas": cached_ideas,
+                "analysis": analysis,
+                "content_ideas": ideas,
                 "parameters": {
                     "max_places": args.max_places,
                     "min_reviews": args.min_reviews,
@@ -250,6 +295,13 @@ Examples:
 
             print(f"💾 Results saved to: {output_path}")
 
+        if cache is not None and not args.quiet:
+            stats = cache.stats()
+            print(
+                f"🗄️  Cache: {stats['hits']} hits / {stats['misses']} misses "
+                f"(hit rate {stats['hit_rate']:.0%})"
+            )
+
         print("\n✅ Analysis complete!\n")
 
     except KeyboardInterrupt:
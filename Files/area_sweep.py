@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Quadtree area sweep for exhaustive place searches
+Teilt die Stadt in Kacheln, gesättigte Kacheln werden geviertelt
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from geo_index import haversine_m
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Tile:
+    """Lat/lng rectangle of the sweep; ``depth`` 0 is the whole area"""
+
+    south: float
+    west: float
+    north: float
+    east: float
+    depth: int = 0
+
+    @classmethod
+    def from_bounds(cls, bounds: Sequence[float]) -> "Tile":
+        """Tile from ``(south, west, north, east)``"""
+        south, west, north, east = (float(v) for v in bounds)
+        return cls(
+            min(south, north), min(west, east), max(south, north), max(west, east)
+        )
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return ((self.south + self.north) / 2, (self.west + self.east) / 2)
+
+    @property
+    def radius_m(self) -> float:
+        """Radius of the circle around the center that covers the whole tile"""
+        lat, lng = self.center
+        # The corners on the equator side are farther away
+        return max(
+            haversine_m(lat, lng, corner_lat, self.east)
+            for corner_lat in (self.south, self.north)
+        )
+
+    @property
+    def size_m(self) -> float:
+        """Longer side in meters (width measured at the center latitude)"""
+        lat, _ = self.center
+        height = haversine_m(self.south, self.west, self.north, self.west)
+        width = haversine_m(lat, self.west, lat, self.east)
+        return max(height, width)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        """True for points inside; the north/east edges belong to the neighbour"""
+        return self.south <= lat < self.north and self.west <= lng < self.east
+
+    def split(self) -> List["Tile"]:
+        """The four quadrants (SW, SE, NW, NE)"""
+        lat, lng = self.center
+        depth = self.depth + 1
+        return [
+            Tile(self.south, self.west, lat, lng, depth),
+            Tile(self.south, lng, lat, self.east, depth),
+            Tile(lat, self.west, self.north, lng, depth),
+            Tile(lat, lng, self.north, self.east, depth),
+        ]
+
+
+@dataclass
+class SweepStats:
+    """What a sweep cost and found"""
+
+    tiles: int = 0
+    saturated: int = 0
+    failed: int = 0
+    requests: int = 0
+    results: int = 0
+    places: int = 0
+    max_depth: int = 0
+    skipped: List[Tile] = field(default_factory=list)  # saturated at max depth
+
+
+class AreaSweep:
+    """Runs a tile search over an adaptive quadtree
+
+    ``search_tile(tile)`` returns ``(places, saturated, requests)``: the
+    places found in the tile, whether the search hit the API's result cap
+    or lost pages (so the tile may hold more places than were returned; an
+    exception marks the tile as failed) and how many API
+    requests it took. Saturated tiles are split into quadrants down to
+    ``max_depth`` / ``min_tile_m``; sparse tiles cost a single search, so
+    suburbs stay cheap while the center is refined. Up to ``max_workers``
+    tiles are searched at once (the search function does its own rate
+    limiting) and places are deduplicated by ``key`` as they arrive.
+    """
+
+    def __init__(
+        self,
+        search_tile: Callable[[Tile], Tuple[List, bool, int]],
+        max_depth: int = 5,
+        min_tile_m: float = 250.0,
+        max_workers: int = 8,
+        key: Callable = lambda place: getattr(place, "place_id", ""),
+    ):
+        self.search_tile = search_tile
+        self.max_depth = max_depth
+        self.min_tile_m = min_tile_m
+        self.max_workers = max(1, max_workers)
+        self.key = key
+        self.stats = SweepStats()
+
+    def _can_split(self, tile: Tile) -> bool:
+        return tile.depth < self.max_depth and tile.size_m / 2 >= self.min_tile_m
+
+    def run(
+        self,
+        area: Tile,
+        on_place: Optional[Callable] = None,
+        cancel_token=None,
+        progress: Optional[Callable[..., None]] = None,
+    ) -> List:
+        """Sweep ``area`` and return the unique places in discovery order
+
+        Args:
+            area: Root tile (e.g. the city's viewport)
+            on_place: Called once per new (not yet seen) place
+            cancel_token: task_runner.CancelToken; cancelling raises
+                TaskCancelled and drops the queued tiles
+            progress: Called as ``progress(done, total, places=...)`` with
+                finished and known tiles
+        """
+        self.stats = stats = SweepStats()
+        seen: Dict[str, object] = {}
+        places: List = []
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="sweep"
+        ) as executor:
+            pending = {executor.submit(self.search_tile, area): area}
+            known = 1
+            try:
+                while pending:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    finished, _ = wait(
+                        pending, timeout=0.2, return_when=FIRST_COMPLETED
+                    )
+
+                    for future in finished:
+                        tile = pending.pop(future)
+                        stats.tiles += 1
+                        stats.max_depth = max(stats.max_depth, tile.depth)
+                        try:
+                            found, saturated, requests = future.result()
+                        except Exception as e:
+                            stats.failed += 1
+                            logger.error(f"Tile {tile} failed: {e}")
+                            continue
+
+                        stats.requests += requests
+                        stats.results += len(found)
+                        for place in found:
+                            key = self.key(place)
+                            if key:
+                                if key in seen:
+                                    continue
+                                seen[key] = place
+                            places.append(place)
+                            if on_place is not None:
+                                on_place(place)
+
+                        if saturated:
+                            stats.saturated += 1
+                            if self._can_split(tile):
+                                for child in tile.split():
+                                    pending[
+                                        executor.submit(self.search_tile, child)
+                                    ] = child
+                                    known += 1
+                            else:
+                                stats.skipped.append(tile)
+                                logger.warning(
+                                    f"Tile at depth {tile.depth} is still saturated; "
+                                    "some places may be missing"
+                                )
+
+                    if progress is not None and finished:
+                        progress(stats.tiles, known, places=len(places))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        stats.places = len(places)
+        logger.info(
+            f"Area sweep: {stats.places} places from {stats.tiles} tiles "
+            f"({stats.requests} requests, {stats.saturated} saturated)"
+        )
+        return places
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Batch build for city × category pillar page matrices
+
+Usage:
+    python batch_build.py --spec build_matrix.json
+    python batch_build.py --spec build_matrix.json --workers 8 --force
+
+Example spec (JSON):
+    {
+      "csv": "data/locations.csv",
+      "domain": "your-domain.com",
+      "site_name": "Local Places Guide",
+      "cities": ["Berlin", "Potsdam"],
+      "categories": ["Parks", "Cafes"],
+      "output_dir": "generated",
+      "config": {"adsense_id": "ca-pub-...", "ga_id": "G-..."}
+    }
+
+Die CSV wird einmal geladen und per groupby(city, category) aufgeteilt,
+das Template einmal gelesen und die Seiten parallel gerendert.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from build_manifest import BuildManifest
+from data_pipeline import PillarPageGenerator
+from location_loader import load_location_data
+from seo_setup import SEOSetup
+
+DEFAULT_TEMPLATE = os.path.join(os.path.dirname(__file__), "pillar_page_skeleton.html")
+MANIFEST_NAME = ".build_manifest.json"
+
+# Per-process generator, set up once by _init_worker
+_WORKER_GENERATOR: Optional[PillarPageGenerator] = None
+
+
+@dataclass
+class PageJob:
+    """One city × category page of the matrix"""
+
+    city: str
+    category: str
+    output_path: str
+    canonical_url: str
+    sitemap_path: str
+    frame: pd.DataFrame = field(repr=False)
+
+
+@dataclass
+class PageResult:
+    city: str
+    category: str
+    output_path: str
+    locations: int
+    status: str  # "written", "skipped" or "empty"
+    seconds: float = 0.0
+    page_entry: Optional[Dict] = field(default=None, repr=False)
+    fragments: Dict[str, List[str]] = field(default_factory=dict, repr=False)
+
+
+def slugify(value: str) -> str:
+    """URL/file slug: lowercase ASCII, umlauts transliterated, dashes"""
+    text = str(value).lower()
+    for src, dst in (("ä", "ae"), ("ö", "oe"), ("ü", "ue"), ("ß", "ss")):
+        text = text.replace(src, dst)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+
+
+def load_spec(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    for key in ("csv", "domain"):
+        if not spec.get(key):
+            raise ValueError(f"Build-Spec {path} braucht '{key}'")
+    return spec
+
+
+def plan_pages(
+    df: pd.DataFrame, spec: Dict
+) -> Tuple[List[PageJob], List[Tuple[str, str]]]:
+    """Split the CSV into one job per city × category
+
+    Args:
+        df: All locations (one CSV)
+        spec: Matrix spec; ``cities``/``categories`` restrict the matrix,
+            without them every combination present in the data is built
+
+    Returns:
+        (jobs, combinations from the spec that have no data)
+    """
+    city_column = spec.get("city_column", "city")
+    category_column = spec.get("category_column", "category")
+    output_dir = spec.get("output_dir", "generated")
+    domain = spec["domain"]
+
+    df = df.copy()
+    if category_column not in df.columns:
+        # Single-category CSVs (like data/active.csv) build one page per city
+        df[category_column] = spec.get("default_category", "Parks")
+
+    cities = spec.get("cities")
+    categories = spec.get("categories")
+    if cities:
+        df = df[df[city_column].isin(cities)]
+    if categories:
+        df = df[df[category_column].isin(categories)]
+
+    jobs = []
+    for (city, category), frame in df.groupby(
+        [city_column, category_column], sort=False
+    ):
+        slug = f"{slugify(city)}-{slugify(category)}"
+        jobs.append(
+            PageJob(
+                city=str(city),
+                category=str(category),
+                output_path=os.path.join(output_dir, f"{slug}.html"),
+                canonical_url=f"https://{domain}/{slug}",
+                sitemap_path=f"/{slug}",
+                frame=frame,
+            )
+        )
+
+    missing = []
+    if cities and categories:
+        built = {(job.city, job.category) for job in jobs}
+        missing = [(c, k) for c in cities for k in categories if (c, k) not in built]
+
+    return jobs, missing
+
+
+def _init_worker(template_path: str, template_text: str, config: Dict) -> None:
+    global _WORKER_GENERATOR
+    _WORKER_GENERATOR = PillarPageGenerator(
+        template_path, config, template_text=template_text
+    )
+
+
+def _render_job(
+    job: PageJob, page_entry: Optional[Dict], fragments: Dict[str, List[str]]
+) -> PageResult:
+    """Render one page in a worker with the manifest state of that page"""
+    started = time.perf_counter()
+    generator = _WORKER_GENERATOR
+
+    # Per-page in-memory manifest seeded from the parent's manifest
+    manifest = BuildManifest()
+    if page_entry:
+        manifest.pages[os.path.abspath(job.output_path)] = page_entry
+    manifest.fragments = dict(fragments)
+    generator.manifest = manifest
+
+    locations = load_location_data(job.frame)
+    written = generator.generate_page(
+        data=locations,
+        city=job.city,
+        category=job.category,
+        output_path=job.output_path,
+        canonical_url=job.canonical_url,
+    )
+
+    entry = manifest.pages.get(os.path.abspath(job.output_path))
+    new_fragments = {}
+    if written:
+        new_fragments = {h: manifest.fragments[h] for h in entry["records"]}
+    return PageResult(
+        city=job.city,
+        category=job.category,
+        output_path=job.output_path,
+        locations=len(locations),
+        status="written" if written else "skipped",
+        seconds=time.perf_counter() - started,
+        page_entry=entry,
+        fragments=new_fragments,
+    )
+
+
+def build_matrix(
+    spec: Dict, workers: Optional[int] = None, force: bool = False
+) -> List[PageResult]:
+    """Build all pages of the matrix and write sitemap.xml
+
+    Args:
+        spec: Matrix spec (see module docstring)
+        workers: Worker processes (None = CPU count, 0 = render inline)
+        force: Ignore the build manifest and rebuild every page
+
+    Returns:
+        One PageResult per page (including empty matrix cells)
+    """
+    output_dir = spec.get("output_dir", "generated")
+    os.makedirs(output_dir, exist_ok=True)
+    template_path = spec.get("template", DEFAULT_TEMPLATE)
+    config = spec.get("config", {})
+
+    with open(template_path, "r", encoding="utf-8") as f:
+        template_text = f.read()
+
+    df = pd.read_csv(spec["csv"])
+    jobs, missing = plan_pages(df, spec)
+
+    manifest_path = spec.get("manifest", os.path.join(output_dir, MANIFEST_NAME))
+    manifest = BuildManifest(None if force else manifest_path)
+    manifest.path = manifest_path
+
+    def job_args(job: PageJob):
+        entry = manifest.pages.get(os.path.abspath(job.output_path))
+        fragments = {}
+        if entry:
+            fragments = {
+                h: manifest.fragments[h]
+                for h in entry["records"]
+                if h in manifest.fragments
+            }
+        return job, entry, fragments
+
+    results: List[PageResult] = []
+    if workers == 0 or len(jobs) <= 1:
+        _init_worker(template_path, template_text, config)
+        results = [_render_job(*job_args(job)) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(template_path, template_text, config),
+        ) as executor:
+            futures = [executor.submit(_render_job, *job_args(job)) for job in jobs]
+            results = [future.result() for future in futures]
+
+    for result in results:
+        if result.status == "written" and result.page_entry:
+            manifest.pages[os.path.abspath(result.output_path)] = result.page_entry
+            manifest.fragments.update(result.fragments)
+    manifest.save()
+
+    results.extend(
+        PageResult(
+            city=city, category=category, output_path="", locations=0, status="empty"
+        )
+        for city, category in missing
+    )
+
+    _write_sitemap(spec, jobs, output_dir)
+    return results
+
+
+def _write_sitemap(spec: Dict, jobs: List[PageJob], output_dir: str) -> str:
+    seo = SEOSetup(spec["domain"], spec.get("site_name", spec["domain"]))
+    pages = []
+    for job in jobs:
+        # lastmod follows the file, so skipped pages keep their date
+        modified = datetime.fromtimestamp(os.path.getmtime(job.output_path))
+        pages.append(
+            {
+                "path": job.sitemap_path,
+                "lastmod": modified.strftime("%Y-%m-%d"),
+                "changefreq": spec.get("changefreq", "weekly"),
+                "priority": spec.get("priority", 0.8),
+            }
+        )
+
+    sitemap_path = os.path.join(output_dir, "sitemap.xml")
+    with open(sitemap_path, "w", encoding="utf-8") as f:
+        f.write(seo.generate_sitemap(pages))
+    return sitemap_path
+
+
+def print_build_report(results: List[PageResult], total_seconds: float) -> None:
+    written = [r for r in results if r.status == "written"]
+    skipped = [r for r in results if r.status == "skipped"]
+    empty = [r for r in results if r.status == "empty"]
+
+    print(f"\n{'='*70}")
+    print("🏗️  BATCH BUILD REPORT")
+    print(f"{'='*70}")
+    print(f"{'Seite':<40} {'Orte':>6} {'Status':>9} {'Zeit':>9}")
+    print(f"{'-'*70}")
+    for r in sorted(results, key=lambda r: r.seconds, reverse=True):
+        label = f"{r.city} × {r.category}"
+        print(f"{label:<40} {r.locations:>6} {r.status:>9} {r.seconds*1000:>7.1f}ms")
+    print(f"{'-'*70}")
+    print(
+        f"✅ {len(written)} geschrieben, ⏭️  {len(skipped)} unverändert, "
+        f"⚠️  {len(empty)} ohne Daten – {total_seconds:.2f}s gesamt"
+    )
+    print(f"{'='*70}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build pillar pages for a city × category matrix from one CSV"
+    )
+    parser.add_argument("--spec", required=True, help="Matrix spec (JSON)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 0 = no subprocesses)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild all pages, ignore the manifest"
+    )
+    args = parser.parse_args()
+
+    try:
+        spec = load_spec(args.spec)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    results = build_matrix(spec, workers=args.workers, force=args.force)
+    print_build_report(results, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
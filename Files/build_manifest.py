@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental pillar page generation
+Speichert Hashes von Template, Config und Location-Records pro Seite
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+# Bump when the page/fragment serialization changes so old manifests rebuild
+MANIFEST_VERSION = 3
+
+
+def content_hash(value) -> str:
+    """Stable short hash of a string/bytes or any JSON-serializable value"""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    elif not isinstance(value, bytes):
+        value = json.dumps(
+            value, sort_keys=True, ensure_ascii=False, default=str
+        ).encode("utf-8")
+    return hashlib.blake2b(value, digest_size=16).hexdigest()
+
+
+def record_hash(record) -> str:
+    """Hash of a LocationData (or any dataclass/dict) record"""
+    fields = record if isinstance(record, dict) else vars(record)
+    return content_hash([MANIFEST_VERSION, fields])
+
+
+class BuildManifest:
+    """JSON manifest of generated pages and their serialized location fragments
+
+    For every output path the manifest stores the page hash (template,
+    config, page parameters and the ordered record hashes) plus the size and
+    mtime of the written file. Serialized fragments are stored per record
+    hash, so a page whose data changed only re-serializes the changed entries.
+    Call ``save()`` after a build; unreferenced fragments are pruned then.
+    A manifest without ``path`` lives in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.pages: Dict[str, Dict] = {}
+        self.fragments: Dict[str, List[str]] = {}
+        self.skipped = 0
+        self.written = 0
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Build-Manifest {path} unlesbar, baue alles neu: {e}")
+                stored = {}
+            if stored.get("version") == MANIFEST_VERSION:
+                self.pages = stored.get("pages", {})
+                self.fragments = stored.get("fragments", {})
+
+    @staticmethod
+    def page_hash(
+        template_hash: str, config: Dict, params: Dict, record_hashes: List[str]
+    ) -> str:
+        return content_hash(
+            [MANIFEST_VERSION, template_hash, config, params, record_hashes]
+        )
+
+    def is_current(self, output_path: str, page_hash: str) -> bool:
+        """True if ``output_path`` was built from ``page_hash`` and is untouched"""
+        entry = self.pages.get(os.path.abspath(output_path))
+        if not entry or entry["hash"] != page_hash:
+            return False
+        try:
+            stat = os.stat(output_path)
+        except OSError:
+            return False
+        if not all(os.path.exists(asset) for asset in entry.get("assets", [])):
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def record_page(
+        self,
+        output_path: str,
+        page_hash: str,
+        record_hashes: List[str],
+        assets: Optional[List[str]] = None,
+    ) -> None:
+        """Store a written page; ``assets`` are extra files it depends on
+
+        Assets of the previous build of this page that no page references
+        any more (e.g. an outdated data sidecar) are deleted.
+        """
+        key = os.path.abspath(output_path)
+        previous = self.pages.get(key, {}).get("assets", [])
+
+        stat = os.stat(output_path)
+        self.pages[key] = {
+            "hash": page_hash,
+            "records": record_hashes,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "assets": [os.path.abspath(asset) for asset in assets or []],
+        }
+
+        in_use = {a for entry in self.pages.values() for a in entry.get("assets", [])}
+        for asset in previous:
+            if asset not in in_use and os.path.exists(asset):
+                os.remove(asset)
+
+    def get_fragments(self, key: str) -> Optional[List[str]]:
+        return self.fragments.get(key)
+
+    def set_fragments(self, key: str, fragments: List[str]) -> None:
+        self.fragments[key] = fragments
+
+    def save(self) -> None:
+        """Write the manifest atomically, dropping fragments no page uses"""
+        if not self.path:
+            return
+
+        referenced = {h for entry in self.pages.values() for h in entry["records"]}
+        self.fragments = {
+            h: frag for h, frag in self.fragments.items() if h in referenced
+        }
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "pages": self.pages,
+                    "fragments": self.fragments,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
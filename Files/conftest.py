@@ -1,7 +1,88 @@
 """Pytest configuration ensuring project modules are importable."""
 
 from __future__ import annotations
+import json
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Callable, Dict, Mapping, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+class StubRequest(NamedTuple):
+    """What a local_server responder sees of a request"""
+
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Mapping[str, str]  # case-insensitive
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so connection reuse can be observed
+    protocol_version = "HTTP/1.1"
+
+    def _answer(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        url = urlsplit(self.path)
+        request = StubRequest(
+            self.command,
+            url.path,
+            {k: v[0] for k, v in parse_qs(url.query).items()},
+            self.headers,
+        )
+        status, body, *extra = self.server.respond(request)
+        headers = dict(extra[0]) if extra else {}
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _answer
+    do_POST = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    # Tests open dozens of connections at once; the default backlog of 5
+    # would make the kernel drop (and retry after 1 s) some of them
+    request_queue_size = 128
+
+
+@pytest.fixture
+def local_server():
+    """Start local HTTP stubs: ``local_server(respond)`` returns the base URL
+
+    ``respond(request)`` gets a StubRequest and returns ``(status, body)``
+    or ``(status, body, headers)``; bodies other than bytes are sent as
+    JSON. Handlers run concurrently, one thread per connection. All servers
+    are shut down after the test.
+    """
+    servers = []
+
+    def start(respond: Callable[[StubRequest], tuple]) -> str:
+        server = _StubServer(("127.0.0.1", 0), _StubHandler)
+        server.respond = respond
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -1,12 +1,19 @@
 import pandas as pd
+import csv
 import json
 import html
-import re
+import os
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-import requests
+from build_manifest import BuildManifest, content_hash, record_hash
+from http_session import create_session, resize_pool
+from page_template import CompiledTemplate, load_template
+from rate_limiter import RateLimiter, shared_rate_limiter
+from response_cache import ResponseCache
 
 
 @dataclass
@@ -42,6 +49,48 @@ class LocationData:
     tags: str = ""
 
 
+# Client-side filters of the pillar page (checkbox "f_<name>"):
+# (filter name, LocationData field, value that passes the filter)
+FEATURE_FILTERS = [
+    ("shade", "feature_shade", True),
+    ("water", "feature_water", True),
+    ("benches", "feature_benches", True),
+    ("parking", "feature_parking", True),
+    ("toilets", "feature_toilets", True),
+    ("wheelchair", "feature_wheelchair_accessible", True),
+    ("kids", "feature_kids_friendly", True),
+    ("dogs", "feature_dogs_allowed", True),
+    ("fee", "feature_fee", False),  # "Kostenfrei" = no fee
+    ("seasonal", "feature_seasonal", True),
+]
+
+
+def build_feature_index(data: List[LocationData]) -> Dict:
+    """Columnar feature index for client-side filtering
+
+    Returns per-location bitmasks (bit j = passes FEATURE_FILTERS[j]) and,
+    per filter, a list of Uint32 words (bit i of word i // 32 = location i
+    passes), so the page can filter with a bitwise AND over the bitsets.
+    """
+    count = len(data)
+    masks = [0] * count
+    bitsets = []
+    for bit, (_, field_name, expected) in enumerate(FEATURE_FILTERS):
+        words = [0] * ((count + 31) // 32)
+        for i, location in enumerate(data):
+            if bool(getattr(location, field_name)) == expected:
+                words[i >> 5] |= 1 << (i & 31)
+                masks[i] |= 1 << bit
+        bitsets.append(words)
+
+    return {
+        "features": [name for name, _, _ in FEATURE_FILTERS],
+        "count": count,
+        "masks": masks,
+        "bitsets": bitsets,
+    }
+
+
 class DataEnrichment:
     """Extract features from reviews and descriptions"""
 
@@ -138,66 +187,235 @@ class DataEnrichment:
 class DataScraper:
     """Base class for data scraping from various sources"""
 
-    def __init__(self, delay: float = 1.0):
+    # Columns of the streamed CSV (text search fields + details)
+    PLACE_COLUMNS = [
+        "name",
+        "address",
+        "rating",
+        "review_count",
+        "lat",
+        "lng",
+        "place_id",
+        "phone",
+        "website",
+        "opening_hours",
+        "reviews_text",
+    ]
+    # A next_page_token only becomes valid a moment after it is issued
+    PAGE_TOKEN_DELAY = 2.0
+    PAGE_TOKEN_RETRIES = 5
+
+    def __init__(
+        self,
+        delay: float = 1.0,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-        )
+        # Shared per-host quota with retries; ``delay`` sets the starting rate
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        self.session = create_session(cache=cache, rate_limiter=self.rate_limiter)
+        self.places_url = "https://maps.googleapis.com/maps/api/place"
+        self.bytes_received = 0
+        self._bytes_lock = threading.Lock()
+
+    @property
+    def places_url(self) -> str:
+        return self._places_url
+
+    @places_url.setter
+    def places_url(self, url: str) -> None:
+        self._places_url = url
+        self.rate_limiter.configure(url, 1.0 / self.delay if self.delay > 0 else None)
+
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        with self._bytes_lock:
+            self.bytes_received += len(response.content)
+        return response.json()
 
     def scrape_google_places(
-        self, query: str, location: str, api_key: str
+        self,
+        query: str,
+        location: str,
+        api_key: str,
+        cancel_token=None,
+        progress: Optional[Callable[..., None]] = None,
+        enrich: bool = True,
+        max_pages: int = 3,
+        max_workers: int = 8,
+        output_path: Optional[str] = None,
+        on_place: Optional[Callable[[Dict], None]] = None,
     ) -> List[Dict]:
         """
         Scrape Google Places API (requires API key)
         Example: scrape_google_places("parks", "Berlin", "YOUR_API_KEY")
+
+        Pipelined: text search pages are followed via ``next_page_token``
+        (up to ``max_pages``, i.e. 60 results) on a background thread, and
+        the next page is already requested while the details of the current
+        page are fetched concurrently (``max_workers`` requests in flight).
+        Every place is handed to ``on_place`` and appended to the CSV at
+        ``output_path`` as soon as it is complete.
+
+        Args:
+            query: Search term ("parks")
+            location: City or area
+            api_key: Google Places API key
+            cancel_token: task_runner.CancelToken, checked while waiting;
+                cancelling raises TaskCancelled and drops pending requests
+            progress: Called as ``progress(done, total, bytes=...)``; total
+                grows as pages arrive
+            enrich: Fetch Place Details (phone, website, hours, reviews)
+            max_pages: Text search pages to follow
+            max_workers: Concurrent details requests
+            output_path: CSV the places are streamed to (completion order)
+            on_place: Callback per completed place (completion order)
+
+        Returns:
+            Place dicts in search result order
         """
         if not api_key or api_key == "YOUR_API_KEY":
             print("⚠️  Google Places API key required")
             return []
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
 
-        url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-        params = {
+        search_params = {
             "query": f"{query} in {location}",
             "key": api_key,
             "fields": "name,formatted_address,geometry,rating,user_ratings_total,place_id",
         }
-
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            places = []
-            for place in data.get("results", []):
-                places.append(
-                    {
-                        "name": place.get("name", ""),
-                        "address": place.get("formatted_address", ""),
-                        "rating": place.get("rating", 0),
-                        "review_count": place.get("user_ratings_total", 0),
-                        "lat": place.get("geometry", {})
-                        .get("location", {})
-                        .get("lat", 0),
-                        "lng": place.get("geometry", {})
-                        .get("location", {})
-                        .get("lng", 0),
-                        "place_id": place.get("place_id", ""),
-                    }
+        places: List[Dict] = []
+        pending = {}
+        completed = 0
+        pages = 0
+        start_bytes = self.bytes_received
+
+        sink = None
+        if output_path:
+            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            sink_file = open(output_path, "w", encoding="utf-8", newline="")
+            sink = csv.DictWriter(sink_file, fieldnames=self.PLACE_COLUMNS)
+            sink.writeheader()
+
+        def complete(index: int) -> None:
+            nonlocal completed
+            completed += 1
+            place = places[index]
+            if sink is not None:
+                sink.writerow({c: place.get(c, "") for c in self.PLACE_COLUMNS})
+                sink_file.flush()
+            if on_place is not None:
+                on_place(place)
+            if progress is not None:
+                progress(
+                    completed, len(places), bytes=self.bytes_received - start_bytes
                 )
 
-            time.sleep(self.delay)
-            return places
-
+        # One pooled connection per concurrent request
+        resize_pool(self.session, self.places_url, max_workers + 1, self.rate_limiter)
+        page_pool = ThreadPoolExecutor(max_workers=1)
+        detail_pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            page_future = page_pool.submit(
+                self._fetch_places_page, search_params, None, cancel_token
+            )
+            while page_future is not None or pending:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                waiting = set(pending)
+                if page_future is not None:
+                    waiting.add(page_future)
+                finished, _ = wait(waiting, timeout=0.2, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    if future is not page_future:
+                        index = pending.pop(future)
+                        places[index].update(future.result())
+                        complete(index)
+                        continue
+
+                    data = future.result()
+                    pages += 1
+                    page_token = data.get("next_page_token")
+                    # Prefetch the next page while this page is enriched
+                    if page_token and pages < max_pages:
+                        page_future = page_pool.submit(
+                            self._fetch_places_page, search_params, page_token, cancel_token
+                        )
+                    else:
+                        page_future = None
+
+                    for result in data.get("results", []):
+                        places.append(self._parse_search_result(result))
+                        index = len(places) - 1
+                        if enrich and places[index]["place_id"]:
+                            detail = detail_pool.submit(
+                                self.get_place_details, places[index]["place_id"], api_key
+                            )
+                            pending[detail] = index
+                        else:
+                            complete(index)
         except Exception as e:
+            if cancel_token is not None and cancel_token.cancelled:
+                raise
             print(f"❌ Error scraping Google Places: {e}")
-            return []
+        finally:
+            # Drop queued requests (shutdown's cancel_futures needs Python 3.9)
+            for future in pending:
+                future.cancel()
+            if page_future is not None:
+                page_future.cancel()
+            page_pool.shutdown(wait=False)
+            detail_pool.shutdown(wait=False)
+            if sink is not None:
+                sink_file.close()
+
+        return places
+
+    def _fetch_places_page(
+        self, params: Dict, page_token: Optional[str], cancel_token=None
+    ) -> Dict:
+        """One text search page; {} when the search failed"""
+        url = f"{self.places_url}/textsearch/json"
+        if page_token is None:
+            data = self._get_json(url, params)
+        else:
+            page_params = {"key": params["key"], "pagetoken": page_token}
+            for _ in range(self.PAGE_TOKEN_RETRIES):
+                if cancel_token is not None:
+                    if cancel_token.wait(self.PAGE_TOKEN_DELAY):
+                        return {}
+                else:
+                    time.sleep(self.PAGE_TOKEN_DELAY)
+                data = self._get_json(url, page_params)
+                # INVALID_REQUEST: token not active yet, try again
+                if data.get("status") != "INVALID_REQUEST":
+                    break
+
+        if data.get("status") not in ("OK", "ZERO_RESULTS"):
+            print(f"⚠️  Places API status: {data.get('status')}")
+            return {}
+        return data
+
+    @staticmethod
+    def _parse_search_result(place: Dict) -> Dict:
+        location = place.get("geometry", {}).get("location", {})
+        return {
+            "name": place.get("name", ""),
+            "address": place.get("formatted_address", ""),
+            "rating": place.get("rating", 0),
+            "review_count": place.get("user_ratings_total", 0),
+            "lat": location.get("lat", 0),
+            "lng": location.get("lng", 0),
+            "place_id": place.get("place_id", ""),
+        }
 
     def get_place_details(self, place_id: str, api_key: str) -> Dict:
         """Get detailed information for a place"""
-        url = "https://maps.googleapis.com/maps/api/place/details/json"
+        url = f"{self.places_url}/details/json"
         params = {
             "place_id": place_id,
             "key": api_key,
@@ -205,9 +423,7 @@ class DataScraper:
         }
 
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(url, params)
 
             result = data.get("result", {})
             reviews_text = " ".join(
@@ -232,10 +448,27 @@ class PillarPageGenerator:
     """Generate pillar pages from data"""
 
     def __init__(
-        self, template_path: str = "pillar_page_skeleton.html", config: Optional[Dict] = None
+        self,
+        template_path: str = "pillar_page_skeleton.html",
+        config: Optional[Dict] = None,
+        manifest: Optional[BuildManifest] = None,
+        template_text: Optional[str] = None,
     ):
         self.template_path = template_path
         self.config = config or {}
+        # Optional build manifest: skip unchanged pages, reuse serialized entries
+        self.manifest = manifest
+        # Preloaded template (batch builds read the file once for all pages)
+        self.template_text = template_text
+        self._compiled_text = None
+
+    def _load_template(self) -> CompiledTemplate:
+        """Compiled template (from template_text or the cached template file)"""
+        if self.template_text is None:
+            return load_template(self.template_path)
+        if self._compiled_text is None or self._compiled_text[0] is not self.template_text:
+            self._compiled_text = (self.template_text, CompiledTemplate(self.template_text))
+        return self._compiled_text[1]
 
     @staticmethod
     def _sanitize_text(value: str) -> str:
@@ -244,6 +477,106 @@ class PillarPageGenerator:
             return ""
         return html.escape(str(value))
 
+    def _location_fragments(self, location: LocationData) -> List[str]:
+        """Serialize one location as [DATA entry, schema.org item, compact entry]
+
+        The first two are json.dumps(indent=2) output, indented for their
+        position in the DATA array and the ItemList so they can be joined
+        without re-serializing the whole document; the compact entry is used
+        for data sidecar files.
+        """
+        safe_name = self._sanitize_text(location.name)
+        safe_street = self._sanitize_text(location.street)
+        safe_city = self._sanitize_text(location.city)
+
+        data_item = {
+            "name": safe_name,
+            "street": safe_street,
+            "city": safe_city,
+            "rating": location.rating,
+            "feature_shade": location.feature_shade,
+            "feature_water": location.feature_water,
+            "feature_benches": location.feature_benches,
+            "feature_parking": location.feature_parking,
+            "feature_toilets": location.feature_toilets,
+            "feature_wheelchair_accessible": location.feature_wheelchair_accessible,
+            "feature_kids_friendly": location.feature_kids_friendly,
+            "feature_dogs_allowed": location.feature_dogs_allowed,
+            "feature_fee": location.feature_fee,
+            "feature_seasonal": location.feature_seasonal,
+            "url": self._sanitize_text(location.url),
+        }
+
+        # schema.org LocalBusiness (wrapped in a ListItem in _schema_string)
+        schema_item = {
+            "@type": "LocalBusiness",
+            "name": safe_name,
+            "address": {
+                "@type": "PostalAddress",
+                "streetAddress": safe_street,
+                "addressLocality": safe_city,
+                "postalCode": self._sanitize_text(location.postcode),
+                "addressCountry": self._sanitize_text(location.country),
+            },
+            "geo": {
+                "@type": "GeoCoordinates",
+                "latitude": location.latitude,
+                "longitude": location.longitude,
+            },
+            "url": self._sanitize_text(location.url),
+            "telephone": self._sanitize_text(location.phone),
+            "aggregateRating": (
+                {
+                    "@type": "AggregateRating",
+                    "ratingValue": location.rating,
+                    "reviewCount": location.review_count,
+                }
+                if location.rating > 0
+                else None
+            ),
+        }
+
+        return [
+            _indent_json(json.dumps(data_item, ensure_ascii=False, indent=2), 2),
+            _indent_json(json.dumps(schema_item, ensure_ascii=False, indent=2), 6, first=False),
+            json.dumps(data_item, ensure_ascii=False, separators=(",", ":")),
+        ]
+
+    def _serialize_locations(
+        self, data: List[LocationData], record_hashes: Optional[List[str]]
+    ) -> List[List[str]]:
+        if record_hashes is None:
+            return [self._location_fragments(location) for location in data]
+
+        fragments = []
+        for location, key in zip(data, record_hashes):
+            cached = self.manifest.get_fragments(key)
+            if cached is None:
+                cached = self._location_fragments(location)
+                self.manifest.set_fragments(key, cached)
+            fragments.append(cached)
+        return fragments
+
+    @staticmethod
+    def _schema_string(name: str, item_fragments: List[str]) -> str:
+        """Equivalent of json.dumps(ItemList, indent=2) from item fragments"""
+        list_items = [
+            "    {\n"
+            '      "@type": "ListItem",\n'
+            f'      "position": {i + 1},\n'
+            f'      "item": {fragment}\n'
+            "    }"
+            for i, fragment in enumerate(item_fragments)
+        ]
+        return (
+            "{\n"
+            '  "@context": "https://schema.org",\n'
+            '  "@type": "ItemList",\n'
+            f'  "name": {json.dumps(name, ensure_ascii=False)},\n'
+            f'  "itemListElement": {_join_json_array(list_items, 2)}\n'
+            "}"
+        )
+
     def generate_page(
         self,
         data: List[LocationData],
@@ -251,110 +584,52 @@ class PillarPageGenerator:
         category: str,
         output_path: str,
         canonical_url: str,
-    ) -> None:
-        """Generate a complete pillar page"""
-
-        # Read template
-        with open(self.template_path, "r", encoding="utf-8") as f:
-            template = f.read()
+    ) -> bool:
+        """Generate a complete pillar page
 
-        # Generate JSON data for JavaScript
-        json_data = []
-        schema_items = []
+        Returns False if a build manifest is set and the page is unchanged
+        (nothing written), True otherwise.
+        """
 
-        for i, location in enumerate(data):
-            safe_name = self._sanitize_text(location.name)
-            safe_street = self._sanitize_text(location.street)
-            safe_city = self._sanitize_text(location.city)
+        template = self._load_template()
 
-            json_data.append(
-                {
-                    "name": safe_name,
-                    "street": safe_street,
-                    "city": safe_city,
-                    "rating": location.rating,
-                    "feature_shade": location.feature_shade,
-                    "feature_water": location.feature_water,
-                    "feature_benches": location.feature_benches,
-                    "feature_parking": location.feature_parking,
-                    "feature_toilets": location.feature_toilets,
-                    "feature_wheelchair_accessible": location.feature_wheelchair_accessible,
-                    "feature_kids_friendly": location.feature_kids_friendly,
-                    "feature_dogs_allowed": location.feature_dogs_allowed,
-                    "feature_fee": location.feature_fee,
-                    "feature_seasonal": location.feature_seasonal,
-                    "url": self._sanitize_text(location.url),
-                }
+        record_hashes = None
+        if self.manifest is not None:
+            record_hashes = [record_hash(location) for location in data]
+            page_hash = self.manifest.page_hash(
+                template.hash,
+                self.config,
+                {"city": city, "category": category, "canonical_url": canonical_url},
+                record_hashes,
             )
+            if self.manifest.is_current(output_path, page_hash):
+                self.manifest.skipped += 1
+                print(f"⏭️  Unverändert, übersprungen: {output_path}")
+                return False
+
+        # Generate JSON data for JavaScript and schema.org items
+        fragments = self._serialize_locations(data, record_hashes)
+
+        # Fill template slots (placeholders, DATA, JSON-LD, AdSense, GA) in one pass
+        slots = {
+            "city": self._sanitize_text(city),
+            "category": self._sanitize_text(category),
+            "canonical_url": self._sanitize_text(canonical_url),
+        }
 
-            # Generate schema.org data
-            schema_items.append(
-                {
-                    "@type": "ListItem",
-                    "position": i + 1,
-                    "item": {
-                        "@type": "LocalBusiness",
-                        "name": safe_name,
-                        "address": {
-                            "@type": "PostalAddress",
-                            "streetAddress": safe_street,
-                            "addressLocality": safe_city,
-                            "postalCode": self._sanitize_text(location.postcode),
-                            "addressCountry": self._sanitize_text(location.country),
-                        },
-                        "geo": {
-                            "@type": "GeoCoordinates",
-                            "latitude": location.latitude,
-                            "longitude": location.longitude,
-                        },
-                        "url": self._sanitize_text(location.url),
-                        "telephone": self._sanitize_text(location.phone),
-                        "aggregateRating": (
-                            {
-                                "@type": "AggregateRating",
-                                "ratingValue": location.rating,
-                                "reviewCount": location.review_count,
-                            }
-                            if location.rating > 0
-                            else None
-                        ),
-                    },
-                }
-        )
-
-        # Replace placeholders
-        page_content = template.replace("{{CITY}}", self._sanitize_text(city))
-        page_content = page_content.replace("{{CATEGORY}}", self._sanitize_text(category))
-        page_content = page_content.replace(
-            "{{CANONICAL_URL}}", self._sanitize_text(canonical_url)
-        )
+        # Insert JSON data (already sanitized) into template, or write a sidecar
+        data_slot, assets = self._data_slot(fragments, output_path)
+        feature_index = json.dumps(build_feature_index(data), separators=(",", ":"))
+        slots["data"] = f"window.FEATURE_INDEX = {feature_index};\n{data_slot}"
 
-        # Insert JSON data (already sanitized) into template
-        json_string = json.dumps(json_data, ensure_ascii=False, indent=2)
-        # Replace the DATA array in the template (works with existing "const DATA = [" syntax)
-        page_content = page_content.replace(
-            "const DATA = [",
-            f"const DATA = {json_string}; // Original: ["
+        # Replace the first schema.org JSON-LD script block
+        schema_string = self._schema_string(
+            f"{category} in {city}", [f[1] for f in fragments]
         )
-
-        # Update schema.org JSON-LD
-        schema_string = json.dumps(
-            {
-                "@context": "https://schema.org",
-                "@type": "ItemList",
-                "name": f"{category} in {city}",
-                "itemListElement": schema_items,
-            },
-            ensure_ascii=False,
-            indent=2,
+        slots["schema"] = (
+            f'<script type="application/ld+json">\n  {schema_string}\n  </script>'
         )
 
-        # Replace the schema.org placeholder section in the template
-        # Find and replace the entire JSON-LD script block
-        schema_pattern = r'<script type="application/ld\+json">\s*\{[^<]*\}\s*</script>'
-        schema_replacement = f'<script type="application/ld+json">\n  {schema_string}\n  </script>'
-        page_content = re.sub(schema_pattern, schema_replacement, page_content, count=1, flags=re.DOTALL)
-
         # Replace AdSense IDs if configured
         adsense_id = self.config.get("adsense_id", "")
         if adsense_id:
@@ -364,7 +639,7 @@ class PillarPageGenerator:
             elif adsense_id.startswith("pub-"):
                 adsense_id = adsense_id[4:]  # Remove 'pub-' prefix
             # Replace placeholder with actual AdSense ID
-            page_content = page_content.replace("ca-pub-XXXXXXXXXXXXXXXX", f"ca-pub-{adsense_id}")
+            slots["adsense"] = f"ca-pub-{adsense_id}"
 
         # Add Google Analytics if configured
         ga_id = self.config.get("ga_id", "")
@@ -380,13 +655,117 @@ class PillarPageGenerator:
     </script>
 """
             # Insert GA code before </head>
-            page_content = page_content.replace("</head>", f"{ga_code}\n</head>")
+            slots["head_end"] = f"{ga_code}\n</head>"
+
+        page_content = template.render(slots)
 
         # Write output
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(page_content)
 
+        if self.manifest is not None:
+            self.manifest.record_page(output_path, page_hash, record_hashes, assets)
+            self.manifest.written += 1
+
         print(f"✅ Generated pillar page: {output_path}")
+        return True
+
+    def _data_mode(self, count: int) -> str:
+        """"inline", "json" or "ndjson" for a page with ``count`` locations
+
+        config["data_mode"]: "inline" (default), "sidecar" or "auto" (sidecar
+        only above config["sidecar_threshold"] locations). Sidecars switch to
+        NDJSON above config["ndjson_threshold"] locations.
+        """
+        mode = self.config.get("data_mode", "inline")
+        if mode == "inline":
+            return "inline"
+        if mode == "auto" and count <= self.config.get("sidecar_threshold", 500):
+            return "inline"
+        if count > self.config.get("ndjson_threshold", 5000):
+            return "ndjson"
+        return "json"
+
+    def _data_slot(
+        self, fragments: List[List[str]], output_path: str
+    ) -> Tuple[str, List[str]]:
+        """JS for the DATA slot plus the sidecar files written for it
+
+        In sidecar mode only the first config["inline_items"] locations are
+        inlined (first paint); the rest goes to a content-hashed
+        data.<hash>.json / .ndjson next to the page, which the page fetches
+        via window.DATA_SRC and which can be cached as immutable.
+        """
+        mode = self._data_mode(len(fragments))
+        # The template's own example array stays valid JS after the slot
+        example_tail = "\nconst DATA_EXAMPLE = ["
+
+        if mode == "inline":
+            json_string = _join_json_array([f[0] for f in fragments], 0)
+            return f"const DATA = {json_string};{example_tail}", []
+
+        inline_count = self.config.get("inline_items", 24)
+        rest = [f[2] for f in fragments[inline_count:]]
+        if mode == "ndjson":
+            body = "\n".join(rest) + "\n"
+        else:
+            body = "[" + ",".join(rest) + "]"
+
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        file_name = f"data.{content_hash(body)[:12]}.{mode}"
+        sidecar_path = os.path.join(output_dir, file_name)
+        if not os.path.exists(sidecar_path):
+            with open(sidecar_path, "w", encoding="utf-8") as f:
+                f.write(body)
+        write_cache_headers(output_dir)
+
+        source = json.dumps(
+            {"url": file_name, "format": mode, "total": len(fragments)}
+        )
+        inline_json = _join_json_array([f[0] for f in fragments[:inline_count]], 0)
+        return (
+            f"window.DATA_SRC = {source};\n"
+            f"const DATA = {inline_json};{example_tail}",
+            [sidecar_path],
+        )
+
+
+# Long-lived caching for content-hashed data sidecars (Netlify/Cloudflare Pages)
+CACHE_HEADERS_RULES = """/data.*
+  Cache-Control: public, max-age=31536000, immutable
+/*/data.*
+  Cache-Control: public, max-age=31536000, immutable
+"""
+
+
+def write_cache_headers(output_dir: str) -> None:
+    """Add the sidecar cache rules to output_dir/_headers (idempotent)"""
+    headers_path = os.path.join(output_dir, "_headers")
+    existing = ""
+    if os.path.exists(headers_path):
+        with open(headers_path, "r", encoding="utf-8") as f:
+            existing = f.read()
+    if "/data.*" in existing:
+        return
+    with open(headers_path, "a", encoding="utf-8") as f:
+        if existing and not existing.endswith("\n"):
+            f.write("\n")
+        f.write(CACHE_HEADERS_RULES)
+
+
+def _indent_json(text: str, spaces: int, first: bool = True) -> str:
+    """Indent every line of a json.dumps block (optionally except the first)"""
+    pad = " " * spaces
+    lines = text.split("\n")
+    head = pad + lines[0] if first else lines[0]
+    return "\n".join([head] + [pad + line for line in lines[1:]])
+
+
+def _join_json_array(items: List[str], spaces: int) -> str:
+    """Join pre-indented item blocks the way json.dumps(indent=2) lays out a list"""
+    if not items:
+        return "[]"
+    return "[\n" + ",\n".join(items) + "\n" + " " * spaces + "]"
 
 
 def example_usage():
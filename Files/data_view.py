@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Virtualized DataFrame preview for the GUI
+Zeigt nur die sichtbaren Zeilen im Treeview; Sortieren und Filtern in pandas
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+import pandas as pd
+
+from frame_window import FrameWindow
+
+DEFAULT_ROW_HEIGHT = 20
+
+
+class DataFrameView(ttk.Frame):
+    """Treeview that renders only the visible rows of a DataFrame
+
+    The Treeview holds one item per visible line; scrolling rewrites the
+    values of those items from ``FrameWindow.rows`` instead of inserting
+    the whole frame. A click on a heading sorts by that column (again to
+    reverse), the entry above the table filters.
+    """
+
+    def __init__(self, master, height: int = 12, column_width: int = 100, **kwargs):
+        super().__init__(master, **kwargs)
+        self.model = FrameWindow()
+        self.column_width = column_width
+        self.visible_rows = height
+        self.first_row = 0
+
+        filter_bar = ttk.Frame(self)
+        filter_bar.pack(fill="x")
+        ttk.Label(filter_bar, text="Filter:").pack(side="left")
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *_: self._apply_filter())
+        ttk.Entry(filter_bar, textvariable=self.filter_var, width=30).pack(
+            side="left", padx=5
+        )
+        self.count_label = ttk.Label(filter_bar, text="")
+        self.count_label.pack(side="left", padx=10)
+
+        self.tree = ttk.Treeview(self, height=height, show="headings")
+        self.scrollbar = ttk.Scrollbar(
+            self, orient="vertical", command=self._on_scrollbar
+        )
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda _: self.scroll_to(self.first_row - 3))
+        self.tree.bind("<Button-5>", lambda _: self.scroll_to(self.first_row + 3))
+
+    def set_frame(self, df: pd.DataFrame) -> None:
+        self.model.set_frame(df)
+        self.tree["columns"] = self.model.columns
+        for column in self.model.columns:
+            self.tree.heading(
+                column, text=column, command=lambda c=column: self._sort(c)
+            )
+            self.tree.column(column, width=self.column_width)
+        self.filter_var.set("")
+        self.first_row = 0
+        self._render()
+
+    def view_frame(self) -> pd.DataFrame:
+        return self.model.view_frame()
+
+    def __len__(self) -> int:
+        return len(self.model)
+
+    def _sort(self, column: str) -> None:
+        self.model.sort(column)
+        for name in self.model.columns:
+            arrow = (" ▲" if self.model.ascending else " ▼") if name == column else ""
+            self.tree.heading(name, text=name + arrow)
+        self._render()
+
+    def _apply_filter(self) -> None:
+        if self.model.filter_text == self.filter_var.get().strip():
+            return
+        self.model.filter(self.filter_var.get())
+        self.first_row = 0
+        self._render()
+
+    def scroll_to(self, row: int) -> None:
+        last = max(0, len(self.model) - self.visible_rows)
+        row = min(max(0, row), last)
+        if row != self.first_row:
+            self.first_row = row
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None) -> None:
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.model)))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(amount) * step)
+
+    def _on_wheel(self, event) -> str:
+        self.scroll_to(self.first_row - int(event.delta / 120) * 3)
+        return "break"
+
+    def _on_resize(self, event) -> None:
+        style = ttk.Style()
+        row_height = int(style.lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        # One line is taken by the headings
+        rows = max(1, event.height // row_height - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.scroll_to(self.first_row)
+            self._render()
+
+    def _render(self) -> None:
+        """Write the visible window into the (reused) Treeview items"""
+        rows = self.model.rows(self.first_row, self.visible_rows)
+        items = self.tree.get_children()
+        for index, values in enumerate(rows):
+            if index < len(items):
+                self.tree.item(items[index], values=values)
+            else:
+                self.tree.insert("", "end", values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows) :])
+
+        total = len(self.model)
+        if total:
+            first = self.first_row / total
+            last = min(1.0, (self.first_row + len(rows)) / total)
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+        self.count_label.config(text=f"{total} von {len(self.model.df)} Zeilen")
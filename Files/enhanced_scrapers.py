@@ -4,17 +4,28 @@ Enhanced Data Scrapers for ADS Pillar
 Unterstützt multiple Datenquellen und automatische Feature-Extraktion
 """
 
-import requests
+import asyncio
 import pandas as pd
 import json
+import math
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import re
 from urllib.parse import quote
 from bs4 import BeautifulSoup
 import logging
 
+from area_sweep import AreaSweep, Tile
+from geo_index import find_duplicates
+from location_loader import SCRAPED_LOCATION_ALIASES, records_from_frame
+from location_store import LocationStore
+from http_session import connection_stats, create_session
+from rate_limiter import RateLimiter, shared_rate_limiter
+from rate_limiter import TokenBucket  # noqa: F401 - lived here before rate_limiter, still imported from here
+from response_cache import ResponseCache
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,12 +61,59 @@ class ScrapedLocation:
 class GooglePlacesScraper:
     """Enhanced Google Places API scraper"""
 
-    def __init__(self, api_key: str, delay: float = 1.0):
+    GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+    # Nearby Search returns at most 3 pages of 20 results
+    PAGE_SIZE = 20
+    MAX_PAGES = 3
+    MAX_RADIUS_M = 50000
+    # A next_page_token only becomes valid a moment after it is issued
+    PAGE_TOKEN_DELAY = 2.0
+    PAGE_TOKEN_RETRIES = 5
+
+    def __init__(
+        self,
+        api_key: str,
+        delay: float = 1.0,
+        max_concurrency: int = 8,
+        requests_per_second: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http2: bool = False,
+    ):
         self.api_key = api_key
         self.delay = delay
-        self.session = requests.Session()
+
+        # Requests are paced by quota (requests/second) instead of a fixed
+        # sleep; without an explicit quota we start at 1/delay. The limiter is
+        # shared by all sessions of the process and retries 429/5xx and
+        # OVER_QUERY_LIMIT responses (see rate_limiter.RateLimiter).
+        if requests_per_second is None and delay > 0:
+            requests_per_second = 1.0 / delay
+        self.requests_per_second = requests_per_second
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        # One kept-alive connection per worker; text search and details
+        # responses are served from the cache if given
+        self.session = create_session(
+            cache=cache,
+            rate_limiter=self.rate_limiter,
+            pool_maxsize=self.max_concurrency,
+            http2=http2,
+        )
         self.base_url = "https://maps.googleapis.com/maps/api/place"
 
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, url: str) -> None:
+        # The quota belongs to the host the requests go to
+        self._base_url = url
+        self.rate_limiter.configure(
+            url, self.requests_per_second, capacity=self.max_concurrency
+        )
+
     def search_places(
         self, query: str, location: str, radius: int = 50000
     ) -> List[ScrapedLocation]:
@@ -74,7 +132,7 @@ class GooglePlacesScraper:
         while True:
             if next_page_token:
                 params["pagetoken"] = next_page_token
-                time.sleep(2)  # Required delay for page token
+                time.sleep(self.PAGE_TOKEN_DELAY)  # Required delay for page token
 
             try:
                 response = self.session.get(url, params=params)
@@ -104,46 +162,248 @@ class GooglePlacesScraper:
                 logger.error(f"Error searching places: {e}")
                 break
 
-            time.sleep(self.delay)
-
         logger.info(f"Total places found: {len(all_places)}")
         return all_places
 
-    def enrich_places(self, places: List[ScrapedLocation]) -> List[ScrapedLocation]:
-        """Enrich places with detailed information from Google Places Details API"""
+    def geocode_bounds(self, location: str) -> Optional[Tile]:
+        """Bounding box of ``location`` (its geocoded bounds or viewport)"""
+
+        try:
+            response = self.session.get(
+                self.GEOCODE_URL, params={"address": location, "key": self.api_key}
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            logger.error(f"Error geocoding {location}: {e}")
+            return None
+
+        if data.get("status") != "OK" or not data.get("results"):
+            logger.warning(f"Geocoding API returned status: {data.get('status')}")
+            return None
+        geometry = data["results"][0].get("geometry", {})
+        box = geometry.get("bounds") or geometry.get("viewport")
+        if not box:
+            return None
+        return Tile.from_bounds(
+            (
+                box["southwest"]["lat"],
+                box["southwest"]["lng"],
+                box["northeast"]["lat"],
+                box["northeast"]["lng"],
+            )
+        )
+
+    def search_tile(
+        self, query: str, tile: Tile, cancel_token=None
+    ) -> Tuple[List[ScrapedLocation], bool, int]:
+        """Nearby search for ``query`` in the circle around ``tile``
+
+        Follows ``next_page_token`` up to MAX_PAGES. Only places inside the tile are returned (the
+        circle overlaps the neighbours, which report their own places).
+
+        Returns:
+            (places, saturated, requests): ``saturated`` is True when the
+            result cap was reached or a page of the chain could not be
+            fetched, i.e. the tile needs to be split
+
+        Raises:
+            RuntimeError: The first page failed (the tile counts as failed)
+        """
+
+        url = f"{self.base_url}/nearbysearch/json"
+        lat, lng = tile.center
+        params = {
+            "location": f"{lat:.6f},{lng:.6f}",
+            "radius": min(self.MAX_RADIUS_M, int(math.ceil(tile.radius_m))),
+            "keyword": query,
+            "key": self.api_key,
+        }
+
+        places = []
+        results = 0
+        requests_made = 0
+        page_token = None
+        for page in range(self.MAX_PAGES):
+            if page_token:
+                page_params = {"pagetoken": page_token, "key": self.api_key}
+            else:
+                page_params = params
+            data = {}
+            for attempt in range(self.PAGE_TOKEN_RETRIES if page_token else 1):
+                if page_token:
+                    # Tokens are not valid right away; cancellable wait
+                    if cancel_token is not None:
+                        cancel_token.wait(self.PAGE_TOKEN_DELAY)
+                        cancel_token.raise_if_cancelled()
+                    else:
+                        time.sleep(self.PAGE_TOKEN_DELAY)
+                requests_made += 1
+                response = self.session.get(url, params=page_params)
+                response.raise_for_status()
+                data = response.json()
+                if data.get("status") != "INVALID_REQUEST":
+                    break
+
+            status = data.get("status")
+            if status not in ("OK", "ZERO_RESULTS"):
+                if not page_token:
+                    raise RuntimeError(f"Nearby search returned status {status}")
+                # The chain broke off: the missing pages are searched again
+                # in the smaller child tiles
+                logger.warning(f"Page {page + 1} returned status {status}, splitting tile")
+                return places, True, requests_made
+
+            for result in data.get("results", []):
+                results += 1
+                result.setdefault("formatted_address", result.get("vicinity", ""))
+                location_obj = self._parse_place_basic(result)
+                if location_obj and tile.contains(
+                    location_obj.latitude, location_obj.longitude
+                ):
+                    places.append(location_obj)
+
+            page_token = data.get("next_page_token")
+            if not page_token:
+                break
+
+        saturated = results >= self.PAGE_SIZE * self.MAX_PAGES
+        return places, saturated, requests_made
+
+    def sweep_area(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        max_depth: int = 5,
+        min_tile_m: float = 250.0,
+        on_place=None,
+        cancel_token=None,
+        progress=None,
+    ) -> List[ScrapedLocation]:
+        """Search a whole city instead of the top 60 text search results
+
+        The area (``bounds`` as ``(south, west, north, east)`` or the
+        geocoded ``location``) is covered by an adaptive quadtree of Nearby
+        searches, see area_sweep.AreaSweep. Tiles run concurrently, paced by
+        the shared rate limiter, and places are deduplicated by place_id.
+
+        Args:
+            query: Search term ("parks")
+            location: City to geocode when no ``bounds`` are given
+            bounds: Explicit bounding box
+            max_depth: Deepest quadtree level (tile side = area / 2**depth)
+            min_tile_m: Tiles are not split below this side length
+            on_place: Called once per new place as it is found
+            cancel_token: task_runner.CancelToken
+            progress: Called as ``progress(done, total, places=...)`` in tiles
+
+        Returns:
+            Unique places; ``self.last_sweep`` holds the SweepStats
+        """
+
+        area = Tile.from_bounds(bounds) if bounds else self.geocode_bounds(location)
+        if area is None:
+            logger.warning(f"No bounding box for {location}, falling back to text search")
+            return self.search_places(query, location)
+
+        sweep = AreaSweep(
+            lambda tile: self.search_tile(query, tile, cancel_token),
+            max_depth=max_depth,
+            min_tile_m=min_tile_m,
+            max_workers=self.max_concurrency,
+        )
+        places = sweep.run(
+            area, on_place=on_place, cancel_token=cancel_token, progress=progress
+        )
+        self.last_sweep = sweep.stats
+        return places
+
+    def enrich_places(
+        self, places: List[ScrapedLocation], concurrent: bool = False
+    ) -> List[ScrapedLocation]:
+        """Enrich places with detailed information from Google Places Details API
+
+        Args:
+            places: Places returned by search_places
+            concurrent: Fetch details concurrently (see enrich_places_async)
+                instead of one place at a time
+
+        Returns:
+            Enriched places in input order; places whose enrichment fails are
+            returned unchanged
+        """
+
+        if concurrent:
+            return asyncio.run(self.enrich_places_async(places))
 
         enriched_places = []
 
         for i, place in enumerate(places):
             logger.info(f"Enriching place {i+1}/{len(places)}: {place.name}")
+            enriched_places.append(self._enrich_place(place))
 
-            try:
-                # Only enrich if we have a place_id
-                if not place.place_id:
-                    logger.warning(f"No place_id for {place.name}, skipping enrichment")
-                    enriched_places.append(place)
-                    continue
+        return enriched_places
 
-                # Call Google Places Details API
-                details = self._get_place_details(place.place_id)
+    async def enrich_places_async(
+        self, places: List[ScrapedLocation]
+    ) -> List[ScrapedLocation]:
+        """Enrich places concurrently
 
-                if details:
-                    # Update place with detailed information
-                    place.phone = details.get("phone", place.phone)
-                    place.website = details.get("website", place.website)
-                    place.opening_hours = details.get("opening_hours", place.opening_hours)
-                    place.reviews_text = details.get("reviews_text", place.reviews_text)
-                    place.photos = details.get("photos", place.photos)
+        At most ``max_concurrency`` Details requests are in flight at once and
+        the session's rate limiter releases them, so throughput is bounded by
+        the host quota rather than by a sequential loop.
+        """
 
-                enriched_places.append(place)
+        if not places:
+            return []
 
-            except Exception as e:
-                logger.error(f"Error enriching place {place.name}: {e}")
-                enriched_places.append(place)  # Add original if enrichment fails
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            time.sleep(self.delay)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
 
-        return enriched_places
+            async def enrich_one(index: int, place: ScrapedLocation):
+                if not place.place_id:
+                    return self._enrich_place(place)
+
+                async with semaphore:
+                    logger.info(f"Enriching place {index+1}/{len(places)}: {place.name}")
+                    return await loop.run_in_executor(
+                        executor, self._enrich_place, place
+                    )
+
+            # gather() keeps results in input order
+            return list(
+                await asyncio.gather(
+                    *(enrich_one(i, place) for i, place in enumerate(places))
+                )
+            )
+
+    def _enrich_place(self, place: ScrapedLocation) -> ScrapedLocation:
+        """Enrich a single place, returning it unchanged on failure"""
+
+        try:
+            # Only enrich if we have a place_id
+            if not place.place_id:
+                logger.warning(f"No place_id for {place.name}, skipping enrichment")
+                return place
+
+            # Call Google Places Details API
+            details = self._get_place_details(place.place_id)
+
+            if details:
+                # Update place with detailed information
+                place.phone = details.get("phone", place.phone)
+                place.website = details.get("website", place.website)
+                place.opening_hours = details.get("opening_hours", place.opening_hours)
+                place.reviews_text = details.get("reviews_text", place.reviews_text)
+                place.photos = details.get("photos", place.photos)
+
+        except Exception as e:
+            logger.error(f"Error enriching place {place.name}: {e}")
+
+        return place  # Original is kept if enrichment fails
 
     def _get_place_details(self, place_id: str) -> Optional[Dict]:
         """Get detailed information for a specific place"""
@@ -267,13 +527,12 @@ class GooglePlacesScraper:
 class WebScraper:
     """Generic web scraper for location data"""
 
-    def __init__(self, delay: float = 2.0):
+    def __init__(self, delay: float = 2.0, rate_limiter: Optional[RateLimiter] = None):
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        self.session = create_session(
+            rate_limiter=self.rate_limiter,
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         )
 
     def scrape_yelp_style(
@@ -284,6 +543,8 @@ class WebScraper:
         places = []
         page = 1
         max_pages = 10
+        # One page per ``delay`` seconds for this site, across all scrapers
+        self.rate_limiter.configure(base_url, 1.0 / self.delay if self.delay > 0 else None)
 
         while page <= max_pages:
             try:
@@ -303,7 +564,6 @@ class WebScraper:
                 logger.info(f"Scraped page {page}: {len(page_places)} places")
 
                 page += 1
-                time.sleep(self.delay)
 
             except Exception as e:
                 logger.error(f"Error scraping page {page}: {e}")
@@ -391,22 +651,7 @@ class CSVDataLoader:
 
         try:
             df = pd.read_csv(filepath)
-            places = []
-
-            for _, row in df.iterrows():
-                place = ScrapedLocation(
-                    name=row.get("name", ""),
-                    address=row.get("address", ""),
-                    city=row.get("city", ""),
-                    latitude=float(row.get("latitude", 0.0)),
-                    longitude=float(row.get("longitude", 0.0)),
-                    rating=float(row.get("rating", 0.0)),
-                    review_count=int(row.get("review_count", 0)),
-                    phone=row.get("phone", ""),
-                    website=row.get("website", ""),
-                    opening_hours=row.get("opening_hours", ""),
-                )
-                places.append(place)
+            places = records_from_frame(df, ScrapedLocation, SCRAPED_LOCATION_ALIASES)
 
             logger.info(f"Loaded {len(places)} places from CSV")
             return places
@@ -505,6 +750,59 @@ class SmartFeatureExtractor:
         ],
     }
 
+    # Compiled lazily from FEATURE_PATTERNS (see _feature_regex)
+    _compiled_regex = None
+    _compiled_from = None
+
+    @classmethod
+    def _feature_regex(cls) -> "re.Pattern":
+        """Compile FEATURE_PATTERNS into one alternation with a named group per feature
+
+        The alternation sits inside a lookahead so every start position is
+        tried and a match for one feature never consumes the text of another
+        (e.g. "dog" hiding "garage" in "dogarage"). A trailing ``\\w*`` only
+        changes how much text a pattern consumes, not whether it matches, so it
+        is dropped.
+
+        Only one group can match per start position, so this equals the
+        per-pattern loop only while no two features match at the same offset
+        (one feature's keyword a prefix of another's, say "park" and "parken"
+        in different features); test_feature_patterns_are_collision_free
+        guards that for the current patterns.
+        """
+        if cls._compiled_from is not cls.FEATURE_PATTERNS:
+            groups = []
+            for feature_name, patterns in cls.FEATURE_PATTERNS.items():
+                stripped = [re.sub(r"\\w\*$", "", pattern) for pattern in patterns]
+                groups.append(f"(?P<{feature_name}>{'|'.join(stripped)})")
+            cls._compiled_regex = re.compile(
+                f"(?=(?:{'|'.join(groups)}))", re.IGNORECASE
+            )
+            cls._compiled_from = cls.FEATURE_PATTERNS
+        return cls._compiled_regex
+
+    @classmethod
+    def _matched_features(cls, combined_text: str) -> set:
+        """Names of all features whose patterns occur in the text (single scan)"""
+        found = set()
+        total = len(cls.FEATURE_PATTERNS)
+        for match in cls._feature_regex().finditer(combined_text):
+            found.add(match.lastgroup)
+            if len(found) == total:
+                break
+        return found
+
+    @staticmethod
+    def _feature_flag(feature_name: str, found: bool, price_level: int):
+        """Map a feature match to its standard (key, value) pair"""
+        if feature_name != "free":
+            return f"feature_{feature_name}", found
+
+        # Use price_level if available (Google's authoritative data).
+        # "free" keywords mean no fee, and without price_level or keywords we
+        # assume free (optimistic for public places).
+        return "feature_fee", price_level > 0
+
     @classmethod
     def extract_features(
         cls, text: str, reviews: str = "", price_level: int = 0
@@ -520,34 +818,59 @@ class SmartFeatureExtractor:
             Dictionary of feature flags
         """
 
-        combined_text = f"{text} {reviews}".lower()
+        found = cls._matched_features(f"{text} {reviews}".lower())
         features = {}
 
-        for feature_name, patterns in cls.FEATURE_PATTERNS.items():
-            feature_found = False
+        for feature_name in cls.FEATURE_PATTERNS:
+            key, value = cls._feature_flag(
+                feature_name, feature_name in found, price_level
+            )
+            features[key] = value
 
-            for pattern in patterns:
-                if re.search(pattern, combined_text, re.IGNORECASE):
-                    feature_found = True
-                    break
+        return features
 
-            # Map to standard feature names
-            feature_key = f"feature_{feature_name}"
-            if feature_name == "free":
-                feature_key = "feature_fee"
-                # Use price_level if available (Google's authoritative data)
-                if price_level > 0:
-                    feature_found = True  # Has fee (price_level indicates paid)
-                elif feature_found:
-                    # Found "free" keywords in text
-                    feature_found = False  # No fee
-                else:
-                    # No price_level and no keywords → assume free (optimistic for public places)
-                    feature_found = False
-
-            features[feature_key] = feature_found
+    @classmethod
+    def extract_features_batch(
+        cls,
+        texts: List[str],
+        reviews: Optional[List[str]] = None,
+        price_levels: Optional[List[int]] = None,
+    ) -> Dict[str, List[bool]]:
+        """Extract features for many places at once
 
-        return features
+        Args:
+            texts: Name/description per place
+            reviews: Reviews text per place (optional)
+            price_levels: Google price_level per place (optional)
+
+        Returns:
+            Columnar result {feature_key: [flag per place]} with the same flags
+            extract_features returns for each place; ready for pd.DataFrame()
+        """
+
+        texts = list(texts)
+        count = len(texts)
+        reviews = list(reviews) if reviews is not None else [""] * count
+        price_levels = (
+            list(price_levels) if price_levels is not None else [0] * count
+        )
+
+        columns: Dict[str, List[bool]] = {
+            cls._feature_flag(name, False, 0)[0]: [False] * count
+            for name in cls.FEATURE_PATTERNS
+        }
+
+        for i, (text, review, price_level) in enumerate(
+            zip(texts, reviews, price_levels)
+        ):
+            found = cls._matched_features(f"{text} {review}".lower())
+            for feature_name in cls.FEATURE_PATTERNS:
+                key, value = cls._feature_flag(
+                    feature_name, feature_name in found, price_level or 0
+                )
+                columns[key][i] = value
+
+        return columns
 
     @classmethod
     def analyze_sentiment(cls, reviews: str) -> Dict[str, float]:
@@ -609,16 +932,36 @@ class UniversalScraper:
     def __init__(self, config: Dict):
         self.config = config
 
+        # Optional persistent response cache shared by all API calls
+        if config.get("cache_path"):
+            self.cache = ResponseCache(
+                config["cache_path"], ttl=config.get("cache_ttl", 7 * 24 * 3600)
+            )
+        else:
+            self.cache = None
+
+        # Optional Parquet store every collection run is appended to
+        if config.get("store_path"):
+            self.store = LocationStore(config["store_path"])
+        else:
+            self.store = None
+
         # Initialize scrapers based on config
         if config.get("google_api_key"):
             self.google_scraper = GooglePlacesScraper(
-                api_key=config["google_api_key"], delay=config.get("delay", 1.0)
+                api_key=config["google_api_key"],
+                delay=config.get("delay", 1.0),
+                max_concurrency=config.get("max_concurrency", 8),
+                requests_per_second=config.get("requests_per_second"),
+                cache=self.cache,
+                http2=config.get("http2", False),
             )
         else:
             self.google_scraper = None
 
         self.web_scraper = WebScraper(delay=config.get("delay", 2.0))
         self.feature_extractor = SmartFeatureExtractor()
+        self.last_merge_report = []
 
     def collect_all_data(self, query: str, location: str) -> List[Dict]:
         """Collect data from all available sources"""
@@ -628,7 +971,17 @@ class UniversalScraper:
         # Google Places API
         if self.google_scraper:
             logger.info("Collecting from Google Places API...")
-            google_places = self.google_scraper.search_places(query, location)
+            if self.config.get("area_sweep"):
+                # Quadtree sweep over the whole city instead of the top 60
+                google_places = self.google_scraper.sweep_area(
+                    query,
+                    location,
+                    bounds=self.config.get("sweep_bounds"),
+                    max_depth=self.config.get("sweep_max_depth", 5),
+                    min_tile_m=self.config.get("sweep_min_tile_m", 250.0),
+                )
+            else:
+                google_places = self.google_scraper.search_places(query, location)
             all_places.extend(google_places)
 
         # CSV files (if specified)
@@ -641,15 +994,16 @@ class UniversalScraper:
         # Deduplicate based on name and address
         unique_places = self._deduplicate_places(all_places)
 
-        # Extract features for all places
-        enriched_places = []
-        for place in unique_places:
-            features = self.feature_extractor.extract_features(
-                f"{place.name} {place.address}",
-                place.reviews_text,
-                place.price_level,  # Pass price_level for accurate fee detection
-            )
+        # Extract features for all places in one batch
+        feature_columns = self.feature_extractor.extract_features_batch(
+            [f"{place.name} {place.address}" for place in unique_places],
+            [place.reviews_text for place in unique_places],
+            # Pass price_level for accurate fee detection
+            [place.price_level for place in unique_places],
+        )
 
+        enriched_places = []
+        for i, place in enumerate(unique_places):
             # Convert to dictionary format
             place_dict = {
                 "name": place.name,
@@ -663,46 +1017,61 @@ class UniversalScraper:
                 "website": place.website,
                 "opening_hours": place.opening_hours,
                 "price_level": place.price_level,
-                **features,
+                "place_id": place.place_id,
+                **{key: values[i] for key, values in feature_columns.items()},
             }
 
             enriched_places.append(place_dict)
 
         logger.info(f"Collected and processed {len(enriched_places)} unique places")
+        if self.store and enriched_places:
+            written = self.store.append(enriched_places, category=query)
+            logger.info(f"Appended {written} places to {self.store.directory}")
+        if self.cache:
+            logger.info(f"Response cache: {self.cache.stats()}")
+        if self.google_scraper:
+            logger.info(f"HTTP connections: {connection_stats(self.google_scraper.session)}")
         return enriched_places
 
     def _deduplicate_places(
         self, places: List[ScrapedLocation]
     ) -> List[ScrapedLocation]:
-        """Remove duplicate places based on name, address, and coordinate similarity"""
+        """Remove duplicate places based on name, address, and coordinate similarity
 
-        unique_places = []
-        seen_names = set()
-        seen_coords = set()
-
-        for place in places:
-            # Create a normalized key for name+address deduplication
-            name_key = f"{place.name.lower().strip()}_{place.address.lower().strip()}"
-            name_key = re.sub(r"\s+", " ", name_key)  # Normalize whitespace
+        Uses a spatial grid so each place is only compared with neighbours
+        within ``dedupe_radius_m`` (config, default 50 m); names are compared
+        by trigram similarity (``dedupe_name_threshold``, default 0.5). The
+        merges are kept in ``self.last_merge_report``.
+        """
 
-            # Create coordinate key (rounded to 4 decimal places for ~11m precision)
-            coord_key = (round(place.latitude, 4), round(place.longitude, 4))
+        kept, matches = find_duplicates(
+            places,
+            radius_m=self.config.get("dedupe_radius_m", 50.0),
+            name_threshold=self.config.get("dedupe_name_threshold", 0.5),
+        )
 
-            # Check if duplicate by name/address OR by coordinates
-            is_duplicate = name_key in seen_names or (
-                coord_key in seen_coords and coord_key != (0.0, 0.0)
+        for match in matches:
+            self._merge_place(places[match.kept_index], places[match.merged_index])
+            logger.debug(
+                f"Duplicate found: {match.merged_name} -> {match.kept_name} "
+                f"({match.reason}, {match.distance_m} m, sim={match.similarity})"
             )
 
-            if not is_duplicate:
-                seen_names.add(name_key)
-                if coord_key != (0.0, 0.0):
-                    seen_coords.add(coord_key)
-                unique_places.append(place)
-            else:
-                logger.debug(f"Duplicate found: {place.name}")
+        self.last_merge_report = matches
+        logger.info(f"Removed {len(matches)} duplicates")
+        return [places[i] for i in kept]
 
-        logger.info(f"Removed {len(places) - len(unique_places)} duplicates")
-        return unique_places
+    @staticmethod
+    def _merge_place(target: ScrapedLocation, duplicate: ScrapedLocation) -> None:
+        """Fill fields missing on the kept place from its duplicate"""
+        for field_name in ("address", "phone", "website", "opening_hours", "place_id"):
+            if not getattr(target, field_name) and getattr(duplicate, field_name):
+                setattr(target, field_name, getattr(duplicate, field_name))
+        if duplicate.review_count > target.review_count:
+            target.rating = duplicate.rating or target.rating
+            target.review_count = duplicate.review_count
+        if not target.reviews_text:
+            target.reviews_text = duplicate.reviews_text
 
 
 # Example usage and testing
@@ -714,6 +1083,8 @@ def main():
         "google_api_key": "YOUR_API_KEY_HERE",  # Replace with real key
         "delay": 1.0,
         "csv_files": ["data/sample_data.csv"],  # Optional CSV files
+        "cache_path": "data/places_cache.sqlite",  # Optional response cache
+        "store_path": "data/locations",  # Optional Parquet store (needs pyarrow)
     }
 
     # Initialize scraper
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Sorted and filtered row window over a DataFrame
+Pandas-Modell der virtualisierten GUI-Vorschau (ohne tkinter testbar)
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class FrameWindow:
+    """Sorted/filtered view of a DataFrame, read window by window
+
+    The frame itself is never copied or modified: the view is an array of
+    row positions. Filtering searches case-insensitive substrings in the
+    string form of the cells (built once per column and cached), sorting
+    is a stable pandas sort of the filtered positions.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None):
+        self.set_frame(df if df is not None else pd.DataFrame())
+
+    def set_frame(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self.sort_column: Optional[str] = None
+        self.ascending = True
+        self.filter_text = ""
+        self.filter_column: Optional[str] = None
+        self._text: Dict[str, pd.Series] = {}
+        self.positions = np.arange(len(df))
+
+    @property
+    def columns(self) -> List[str]:
+        return [str(c) for c in self.df.columns]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def _column_text(self, column) -> pd.Series:
+        text = self._text.get(column)
+        if text is None:
+            series = self.df[column]
+            text = series.astype(str).where(series.notna(), "").str.lower()
+            self._text[column] = text
+        return text
+
+    def _refresh(self) -> None:
+        mask = np.ones(len(self.df), dtype=bool)
+        if self.filter_text:
+            needle = self.filter_text.lower()
+            columns = [self.filter_column] if self.filter_column else self.df.columns
+            mask[:] = False
+            for column in columns:
+                mask |= (
+                    self._column_text(column)
+                    .str.contains(needle, regex=False)
+                    .to_numpy()
+                )
+        positions = np.flatnonzero(mask)
+
+        if self.sort_column is not None:
+            values = self.df[self.sort_column].iloc[positions].reset_index(drop=True)
+            try:
+                ordered = values.sort_values(
+                    ascending=self.ascending, kind="stable", na_position="last"
+                )
+            except TypeError:
+                # Mixed types (e.g. numbers and text) sort by their string form
+                text = self._column_text(self.sort_column).iloc[positions]
+                ordered = text.reset_index(drop=True).sort_values(
+                    ascending=self.ascending, kind="stable"
+                )
+            order = ordered.index.to_numpy()
+            positions = positions[order]
+        self.positions = positions
+
+    def sort(self, column: str, ascending: Optional[bool] = None) -> None:
+        """Sort by ``column``; without ``ascending`` a second call flips the order"""
+        if ascending is None:
+            ascending = not (self.sort_column == column and self.ascending)
+        self.sort_column = column
+        self.ascending = ascending
+        self._refresh()
+
+    def filter(self, text: str, column: Optional[str] = None) -> None:
+        """Keep rows containing ``text`` (in ``column`` or any column)"""
+        self.filter_text = text.strip()
+        self.filter_column = column
+        self._refresh()
+
+    def rows(self, start: int, count: int) -> List[List]:
+        """Display values of the view rows ``start`` .. ``start + count``"""
+        window = self.df.iloc[self.positions[start : start + count]]
+        return window.astype(object).where(window.notna(), "").values.tolist()
+
+    def view_frame(self) -> pd.DataFrame:
+        """The filtered and sorted rows as a DataFrame"""
+        return self.df.iloc[self.positions]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Spatial grid index and fuzzy near-duplicate detection for places
+Findet Dubletten (Google vs. CSV) über ein Gitter + Trigramm-Ähnlichkeit in O(n)
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in meters"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents/punctuation and collapse whitespace"""
+    text = unicodedata.normalize("NFKD", str(name or "").lower().replace("ß", "ss"))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def name_trigrams(name: str) -> Set[str]:
+    """Character trigrams of the normalized name (word boundaries padded)"""
+    text = normalize_name(name)
+    if not text:
+        return set()
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two trigram sets (0.0 - 1.0)"""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+class GridIndex:
+    """Uniform lat/lng grid whose cells are at least ``cell_m`` wide
+
+    Longitude cells are sized for the highest latitude the index will hold
+    (``max_abs_lat``), so cells are never narrower than ``cell_m`` anywhere
+    below it and all points within ``cell_m`` of a query lie in the 3x3 block
+    around the query cell.
+    """
+
+    def __init__(self, cell_m: float, max_abs_lat: float = 0.0):
+        self.cell_m = cell_m
+        self.lat_step = cell_m / METERS_PER_DEGREE_LAT
+        cos_lat = math.cos(math.radians(min(abs(max_abs_lat), 89.0)))
+        self.lng_step = cell_m / (METERS_PER_DEGREE_LAT * cos_lat)
+        self._cells: Dict[Tuple[int, int], List] = defaultdict(list)
+
+    def cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.lat_step), math.floor(lng / self.lng_step))
+
+    def add(self, lat: float, lng: float, item) -> None:
+        self._cells[self.cell(lat, lng)].append(item)
+
+    def neighbours(self, lat: float, lng: float) -> Iterator:
+        """Items in the query cell and the 8 adjacent cells"""
+        row, col = self.cell(lat, lng)
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                yield from self._cells.get((row + d_row, col + d_col), ())
+
+
+@dataclass
+class DuplicateMatch:
+    """One record folded into an earlier one during deduplication"""
+
+    kept_index: int
+    merged_index: int
+    kept_name: str
+    merged_name: str
+    reason: str  # "name_address", "nearby" or "same_spot"
+    distance_m: Optional[float] = None
+    similarity: Optional[float] = None
+
+
+def _has_coordinates(place) -> bool:
+    return bool(place.latitude or place.longitude)
+
+
+def find_duplicates(
+    places: List,
+    radius_m: float = 50.0,
+    name_threshold: float = 0.5,
+    same_spot_m: float = 2.0,
+) -> Tuple[List[int], List[DuplicateMatch]]:
+    """Detect near-duplicate places in expected O(n)
+
+    A place duplicates an earlier kept place when
+      * normalized name + address are identical ("name_address"), or
+      * it lies within ``radius_m`` and the name trigram similarity is at
+        least ``name_threshold`` ("nearby"), or
+      * it lies within ``same_spot_m`` regardless of name ("same_spot").
+
+    Args:
+        places: Objects with name, address, latitude and longitude attributes
+        radius_m: Search radius for fuzzy name matches in meters
+        name_threshold: Minimum trigram Jaccard similarity for "nearby"
+        same_spot_m: Distance below which places always count as one
+
+    Returns:
+        (indices of kept places in input order, list of DuplicateMatch)
+    """
+    max_abs_lat = max(
+        (abs(p.latitude) for p in places if _has_coordinates(p)), default=0.0
+    )
+    grid = GridIndex(max(radius_m, same_spot_m), max_abs_lat)
+
+    kept: List[int] = []
+    matches: List[DuplicateMatch] = []
+    seen_keys: Dict[str, int] = {}
+    trigrams: Dict[int, Set[str]] = {}
+
+    for index, place in enumerate(places):
+        name_key = normalize_name(f"{place.name} | {place.address}")
+        match = None
+
+        if name_key in seen_keys:
+            original = seen_keys[name_key]
+            match = DuplicateMatch(
+                original, index, places[original].name, place.name, "name_address"
+            )
+        elif _has_coordinates(place):
+            grams = name_trigrams(place.name)
+            best = None
+            for candidate in grid.neighbours(place.latitude, place.longitude):
+                other = places[candidate]
+                distance = haversine_m(
+                    place.latitude, place.longitude, other.latitude, other.longitude
+                )
+                if distance > radius_m and distance > same_spot_m:
+                    continue
+                similarity = trigram_similarity(grams, trigrams[candidate])
+                if distance <= same_spot_m:
+                    reason = "same_spot"
+                elif similarity >= name_threshold:
+                    reason = "nearby"
+                else:
+                    continue
+                rank = (similarity, -distance)
+                if best is None or rank > best[0]:
+                    best = (rank, candidate, distance, similarity, reason)
+
+            if best is not None:
+                _, candidate, distance, similarity, reason = best
+                match = DuplicateMatch(
+                    candidate,
+                    index,
+                    places[candidate].name,
+                    place.name,
+                    reason,
+                    round(distance, 1),
+                    round(similarity, 3),
+                )
+
+        if match is not None:
+            matches.append(match)
+            continue
+
+        kept.append(index)
+        seen_keys[name_key] = index
+        if _has_coordinates(place):
+            trigrams[index] = name_trigrams(place.name)
+            grid.add(place.latitude, place.longitude, index)
+
+    return kept, matches
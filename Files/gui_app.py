@@ -9,15 +9,20 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import pandas as pd
 import json
 import os
-import threading
 from pathlib import Path
 import webbrowser
 import shutil
 import requests
 import re
 
+from data_view import DataFrameView
+from task_runner import TaskRunner
+
 try:
     from data_pipeline import DataScraper, PillarPageGenerator, LocationData
+    from location_loader import load_location_data
+    from location_store import DEFAULT_STORE_PATH, LocationStore, read_location_frame
+    from location_repository import DEFAULT_REPOSITORY_PATH, LocationRepository
 
     MODULES_AVAILABLE = True
     IMPORT_ERROR_MSG = None
@@ -40,9 +45,31 @@ except Exception as e:
         def __init__(self, *_, **__): ...
     class DataEnrichment: ...
 
+    def load_location_data(*_, **__):
+        return []
+
+    DEFAULT_STORE_PATH = "data/locations"
+
+    def read_location_frame(path):
+        return pd.read_csv(path)
+
+    class LocationStore:
+        def __init__(self, *_, **__): ...
+        def read(self, *_, **__):
+            return pd.DataFrame()
+
+    DEFAULT_REPOSITORY_PATH = "data/locations.sqlite"
+
+    class LocationRepository:
+        def __init__(self, *_, **__): ...
+
 
 try:
-    from niche_research import NicheValidator, ReviewDemandAnalyzer
+    from niche_research import (
+        NicheValidator,
+        NicheValidatorService,
+        ReviewDemandAnalyzer,
+    )
 
     NICHE_AVAILABLE = True
 except Exception as e:
@@ -54,6 +81,8 @@ except Exception as e:
 
     class NicheValidator:
         def __init__(self, *_, **__): ...
+    class NicheValidatorService:
+        def __init__(self, *_, **__): ...
     class ReviewDemandAnalyzer:
         def __init__(self, *_, **__): ...
 
@@ -103,6 +132,19 @@ class ADSPillarGUI:
 
         self.current_df = None
         self._user_csv_path = ""
+        # Frame behind the data preview (exported as-is by save_csv)
+        self.preview_df = None
+        # SQLite repository of collected locations, opened on first use
+        self._location_repo = None
+        # One validator for all clicks; rebuilt only when the CSVs change
+        self.niche_service = NicheValidatorService()
+        # Review analyses are reused across runs of the same category/city
+        self.review_analysis_cache = None
+        # Long actions run here; results come back through root.after()
+        self.tasks = TaskRunner(max_workers=4)
+        self.tasks.attach(self.root)
+        # Closing the window cancels running tasks instead of waiting for them
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # New: Ortsseite Formular-Status
         self.location_form = {
@@ -165,11 +207,17 @@ class ADSPillarGUI:
         self.notebook.add(self.location_tab, text="📝 Ortsseite erstellen")
         self.create_location_page_tab()
 
-        # Status bar
+        # Status bar with a cancel button for running tasks
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.cancel_button = ttk.Button(
+            status_frame, text="⏹ Abbrechen", command=self.cancel_tasks, state="disabled"
+        )
+        self.cancel_button.pack(side=tk.RIGHT)
         self.status_bar = ttk.Label(
-            self.root, text="Bereit", relief=tk.SUNKEN, anchor=tk.W
+            status_frame, text="Bereit", relief=tk.SUNKEN, anchor=tk.W
         )
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
     def create_setup_tab(self):
         """Create project setup tab"""
@@ -365,8 +413,8 @@ class ADSPillarGUI:
             side="left"
         )
 
-        # Data preview
-        self.data_preview = ttk.Treeview(main_frame, height=12)
+        # Data preview (renders only the visible rows, see data_view)
+        self.data_preview = DataFrameView(main_frame, height=12)
         self.data_preview.pack(fill="both", expand=True)
 
     def create_generate_tab(self):
@@ -554,19 +602,70 @@ class ADSPillarGUI:
         if widget is None:
             widget = self.setup_output
 
+        if not self.tasks.in_ui_thread():
+            self.tasks.post(self.log_message, message, widget)
+            return
+
         widget.insert(tk.END, f"{message}\n")
         widget.see(tk.END)
-        self.root.update()
+        self.root.update_idletasks()
 
     def update_status(self, status):
-        """Update status bar"""
+        """Update status bar (safe to call from task threads)"""
+        if not self.tasks.in_ui_thread():
+            self.tasks.post(self.update_status, status)
+            return
+
         self.status_bar.config(text=status)
-        self.root.update()
+        self.root.update_idletasks()
+
+    def run_task(self, name, fn, *args, group=None, **callbacks):
+        """Start ``fn(context, *args)`` on the task runner
+
+        ``group`` defaults to ``name``, so the same action cannot run twice
+        at the same time. Progress reports are shown in the status bar.
+        """
+        callbacks.setdefault("on_progress", self._show_progress)
+        handle = self.tasks.submit(name, fn, *args, group=group or name, **callbacks)
+        if handle is None:
+            messagebox.showinfo("Läuft bereits", f"'{name}' läuft bereits.")
+            return None
+        self.cancel_button.config(state="normal")
+        self.tasks.post(self._watch_tasks)
+        return handle
+
+    def _watch_tasks(self):
+        """Disable the cancel button once no task is running any more"""
+        if self.tasks.running():
+            self.root.after(200, self._watch_tasks)
+        else:
+            self.cancel_button.config(state="disabled")
+
+    def _show_progress(self, progress):
+        self.update_status(progress.describe())
+
+    def cancel_tasks(self):
+        if self.tasks.cancel_all():
+            self.update_status("Abbruch angefordert...")
+
+    def _task_cancelled(self, name):
+        self.update_status(f"{name} abgebrochen")
+
+    def on_close(self):
+        """Cancel all tasks and close the window
+
+        The pool's worker threads are joined at interpreter exit, so a
+        running collection would otherwise keep the process alive headless.
+        """
+        self.tasks.shutdown()
+        self.root.destroy()
 
     def run_full_setup(self):
         """Run complete project setup"""
 
-        def setup_thread():
+        config_data = {key: var.get() for key, var in self.project_config.items()}
+
+        def setup_task(ctx):
             try:
                 self.update_status("Setup läuft...")
                 self.log_message("🚀 Starte vollständiges Setup...")
@@ -577,17 +676,14 @@ class ADSPillarGUI:
                 self.log_message("✅ Verzeichnisse erstellt")
 
                 # Save configuration
-                config_data = {
-                    key: var.get() for key, var in self.project_config.items()
-                }
                 with open("project_config.json", "w") as f:
                     json.dump(config_data, f, indent=2)
                 self.log_message("✅ Konfiguration gespeichert")
 
                 # Run niche analysis
+                ctx.check()
                 self.log_message("🔍 Führe Nischen-Analyse durch...")
-                validator = NicheValidator()
-                recommendations = validator.get_niche_recommendations()
+                recommendations = self.niche_service.get_niche_recommendations()
 
                 self.log_message(f"✅ {len(recommendations)} Nischen analysiert")
                 for rec in recommendations[:3]:
@@ -595,18 +691,23 @@ class ADSPillarGUI:
                         f"   • {rec['niche']['name']} (Score: {rec['opportunity_score']})"
                     )
 
-                # Create sample data
-                self.create_sample_data()
+                # Create sample data (asks in a dialog, so it runs in the Tk thread)
+                ctx.check()
+                ctx.call_sync(self.create_sample_data)
                 self.log_message("✅ Beispieldaten erstellt")
 
                 self.log_message("🎉 Setup erfolgreich abgeschlossen!")
                 self.update_status("Setup abgeschlossen")
 
             except Exception as e:
+                if ctx.token.cancelled:
+                    raise
                 self.log_message(f"❌ Fehler beim Setup: {str(e)}")
                 self.update_status("Setup fehlgeschlagen")
 
-        threading.Thread(target=setup_thread, daemon=True).start()
+        self.run_task(
+            "Setup", setup_task, on_cancel=lambda: self._task_cancelled("Setup")
+        )
 
     def create_sample_data(self):
         """
@@ -679,36 +780,39 @@ class ADSPillarGUI:
     def analyze_niches(self):
         """Analyze available niches"""
 
-        def analyze_thread():
-            try:
-                self.update_status("Analysiere Nischen...")
-
-                validator = NicheValidator()
-                recommendations = validator.get_niche_recommendations()
-
-                # Clear existing data
-                for item in self.niche_tree.get_children():
-                    self.niche_tree.delete(item)
-
-                # Populate tree
-                for rec in recommendations:
-                    niche = rec["niche"]
-                    values = (
-                        niche["name"],
-                        rec["opportunity_score"],
-                        f"{rec['total_estimated_volume']:,}",
-                        niche["monetization_potential"],
-                        f"€{niche.get('estimated_rpm', '12-20')}",
-                    )
-                    self.niche_tree.insert("", "end", values=values)
+        def analyze_task(ctx):
+            self.update_status("Analysiere Nischen...")
+            return self.niche_service.get_niche_recommendations()
+
+        def show_recommendations(recommendations):
+            # Clear existing data
+            for item in self.niche_tree.get_children():
+                self.niche_tree.delete(item)
+
+            # Populate tree
+            for rec in recommendations:
+                niche = rec["niche"]
+                values = (
+                    niche["name"],
+                    rec["opportunity_score"],
+                    f"{rec['total_estimated_volume']:,}",
+                    niche["monetization_potential"],
+                    f"€{niche.get('estimated_rpm', '12-20')}",
+                )
+                self.niche_tree.insert("", "end", values=values)
 
-                self.update_status("Nischen-Analyse abgeschlossen")
+            self.update_status("Nischen-Analyse abgeschlossen")
 
-            except Exception as e:
-                messagebox.showerror("Fehler", f"Fehler bei Nischen-Analyse: {str(e)}")
-                self.update_status("Bereit")
+        def show_error(e):
+            messagebox.showerror("Fehler", f"Fehler bei Nischen-Analyse: {str(e)}")
+            self.update_status("Bereit")
 
-        threading.Thread(target=analyze_thread, daemon=True).start()
+        self.run_task(
+            "Nischen-Analyse",
+            analyze_task,
+            on_done=show_recommendations,
+            on_error=show_error,
+        )
 
     def collect_data(self):
         """Collect data from selected sources"""
@@ -719,64 +823,84 @@ class ADSPillarGUI:
             )
             return
 
-        def collect_thread():
-            try:
-                self.update_status("Sammle Daten...")
+        query = self.search_query.get()
+        city = self.project_config["city"].get()
+        category = self.project_config["category"].get()
+        api_key = self.google_api_key.get()
+
+        def collect_task(ctx):
+            self.update_status("Sammle Daten...")
+
+            # Each place is upserted as soon as its details arrive, so a
+            # cancelled or failed run keeps what it already collected
+            repo = self.location_repository()
+            scraper = DataScraper(delay=1.0)
+            places = scraper.scrape_google_places(
+                query=query,
+                location=city,
+                api_key=api_key,
+                cancel_token=ctx.token,
+                progress=lambda done, total, **info: ctx.progress(
+                    done, total, unit="Orte", **info
+                ),
+                on_place=lambda place: repo.upsert([place], category=category, city=city),
+            )
+            if not places:
+                return 0, None
+            return len(places), repo.query(city=city, category=category)
 
-                scraper = DataScraper(delay=1.0)
-                places = scraper.scrape_google_places(
-                    query=self.search_query.get(),
-                    location=self.project_config["city"].get(),
-                    api_key=self.google_api_key.get(),
+        def show_collected(result):
+            count, df = result
+            if not count:
+                messagebox.showwarning(
+                    "Keine Daten",
+                    "Keine Daten gefunden. API Key oder Query prüfen.",
                 )
-
-                if places:
-                    # Convert to DataFrame and save
-                    df = pd.DataFrame(places)
-                    df.to_csv("data/collected_data.csv", index=False)
-
-                    # Update preview
-                    self.update_data_preview(df)
-
-                    self.update_status(f"{len(places)} Orte gesammelt")
-                    messagebox.showinfo(
-                        "Erfolg", f"{len(places)} Orte erfolgreich gesammelt!"
-                    )
-                else:
-                    messagebox.showwarning(
-                        "Keine Daten",
-                        "Keine Daten gefunden. API Key oder Query prüfen.",
-                    )
-                    self.update_status("Bereit")
-
-            except Exception as e:
-                messagebox.showerror("Fehler", f"Fehler beim Datensammeln: {str(e)}")
                 self.update_status("Bereit")
+                return
 
-        threading.Thread(target=collect_thread, daemon=True).start()
-
-    def update_data_preview(self, df):
-        """Update data preview table"""
-        # Clear existing columns
-        self.data_preview["columns"] = list(df.columns)
-        self.data_preview["show"] = "headings"
+            self.update_data_preview(df)
+            self.update_status(f"{count} Orte gesammelt")
+            messagebox.showinfo("Erfolg", f"{count} Orte erfolgreich gesammelt!")
+
+        def show_error(e):
+            messagebox.showerror("Fehler", f"Fehler beim Datensammeln: {str(e)}")
+            self.update_status("Bereit")
+
+        # One collection at a time: runs write the same repository
+        self.run_task(
+            "Daten sammeln",
+            collect_task,
+            group="collect",
+            on_done=show_collected,
+            on_error=show_error,
+            on_cancel=lambda: self._task_cancelled("Datensammlung"),
+        )
 
-        for col in df.columns:
-            self.data_preview.heading(col, text=col)
-            self.data_preview.column(col, width=100)
+    def location_repository(self):
+        if self._location_repo is None:
+            self._location_repo = LocationRepository(DEFAULT_REPOSITORY_PATH)
+        return self._location_repo
 
-        # Clear existing data
-        for item in self.data_preview.get_children():
-            self.data_preview.delete(item)
+    def store_locations(self, city, category):
+        """Newest store rows for ``city``/``category`` (empty without a store)"""
+        if not os.path.isdir(DEFAULT_STORE_PATH):
+            return pd.DataFrame()
+        return LocationStore(DEFAULT_STORE_PATH).read(city=city, category=category)
 
-        # Add new data
-        for _, row in df.head(50).iterrows():  # Show first 50 rows
-            self.data_preview.insert("", "end", values=list(row))
+    def update_data_preview(self, df):
+        """Show ``df`` in the data preview (the frame stays the source of truth)"""
+        self.preview_df = df
+        self.data_preview.set_frame(df)
 
     def generate_page(self):
         """Generate pillar page"""
 
-        def generate_thread():
+        config = {key: var.get() for key, var in self.project_config.items()}
+        template = self.template_var.get()
+        include_analytics = self.gen_options.get("include_analytics").get()
+
+        def generate_task(ctx):
             try:
                 self.update_status("Generiere Seite...")
                 self.log_message("🏗️ Starte Seiten-Generierung...", self.gen_log)
@@ -785,67 +909,44 @@ class ADSPillarGUI:
                 if getattr(self, "current_df", None) is not None:
                     df = self.current_df.copy()
                     data_source = self._user_csv_path or "Benutzer-Upload"
+                elif os.path.exists(DEFAULT_REPOSITORY_PATH) and self.location_repository().count(
+                    city=config["city"],
+                    category=config["category"],
+                ):
+                    df = self.location_repository().query(
+                        city=config["city"],
+                        category=config["category"],
+                    ).rename(columns={"place_id": "id"})
+                    data_source = DEFAULT_REPOSITORY_PATH
                 elif os.path.exists("data/active.csv"):
                     df = pd.read_csv("data/active.csv")
                     data_source = "data/active.csv"
                 else:
-                    if not os.path.exists("data/sample_data.csv"):
-                        self.create_sample_data()
-                    df = pd.read_csv("data/sample_data.csv")
-                    data_source = "data/sample_data.csv"
+                    df = self.store_locations(config["city"], config["category"])
+                    data_source = DEFAULT_STORE_PATH
+                    if df.empty:
+                        if not os.path.exists("data/sample_data.csv"):
+                            ctx.call_sync(self.create_sample_data)
+                        df = pd.read_csv("data/sample_data.csv")
+                        data_source = "data/sample_data.csv"
 
                 self.log_message(
                     f"✅ {len(df)} Locations geladen ({data_source})", self.gen_log
                 )
 
-                # Convert to LocationData objects
-                locations = []
-                for _, row in df.iterrows():
-                    loc = LocationData(
-                        id=str(row["id"]),
-                        name=row["name"],
-                        street=row["street"],
-                        city=row["city"],
-                        region=row.get("region", ""),
-                        country=row.get("country", "Deutschland"),
-                        postcode=str(row.get("postcode", "")),
-                        latitude=float(row.get("latitude", 0)),
-                        longitude=float(row.get("longitude", 0)),
-                        url=row.get("url", ""),
-                        phone=row.get("phone", ""),
-                        email=row.get("email", ""),
-                        opening_hours=row.get("opening_hours", ""),
-                        rating=float(row.get("rating", 0)),
-                        review_count=int(row.get("review_count", 0)),
-                        feature_shade=bool(row.get("feature_shade", False)),
-                        feature_benches=bool(row.get("feature_benches", False)),
-                        feature_water=bool(row.get("feature_water", False)),
-                        feature_parking=bool(row.get("feature_parking", False)),
-                        feature_toilets=bool(row.get("feature_toilets", False)),
-                        feature_wheelchair_accessible=bool(
-                            row.get("feature_wheelchair_accessible", False)
-                        ),
-                        feature_kids_friendly=bool(
-                            row.get("feature_kids_friendly", False)
-                        ),
-                        feature_dogs_allowed=bool(
-                            row.get("feature_dogs_allowed", False)
-                        ),
-                        feature_fee=bool(row.get("feature_fee", True)),
-                        feature_seasonal=bool(row.get("feature_seasonal", False)),
-                        tags=row.get("tags", ""),
-                    )
-                    locations.append(loc)
+                # Convert to LocationData objects (vectorized, see location_loader)
+                ctx.check()
+                locations = load_location_data(df)
 
                 # Generate page
-                generator = PillarPageGenerator(self.template_var.get())
-                output_path = f"generated/{self.project_config['city'].get().lower()}_{self.project_config['category'].get().lower()}.html"
-                canonical_url = f"https://{self.project_config['domain'].get()}/{self.project_config['city'].get().lower()}-{self.project_config['category'].get().lower()}"
+                generator = PillarPageGenerator(template)
+                output_path = f"generated/{config['city'].lower()}_{config['category'].lower()}.html"
+                canonical_url = f"https://{config['domain']}/{config['city'].lower()}-{config['category'].lower()}"
 
                 generator.generate_page(
                     data=locations,
-                    city=self.project_config["city"].get(),
-                    category=self.project_config["category"].get(),
+                    city=config["city"],
+                    category=config["category"],
                     output_path=output_path,
                     canonical_url=canonical_url,
                 )
@@ -854,11 +955,11 @@ class ADSPillarGUI:
                 try:
                     with open(output_path, "r", encoding="utf-8") as _f:
                         _html = _f.read()
-                    _ads = self.project_config["adsense_id"].get()
+                    _ads = config["adsense_id"]
                     if _ads:
                         _html = _html.replace("ca-pub-XXXXXXXXXXXXXXXX", _ads)
-                    _ga = self.project_config["ga_id"].get()
-                    if self.gen_options.get("include_analytics").get() and _ga:
+                    _ga = config["ga_id"]
+                    if include_analytics and _ga:
                         _ga_snippet = (
                             f'<script async src="https://www.googletagmanager.com/gtag/js?id={_ga}"></script>'
                             f"<script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}"
@@ -877,18 +978,28 @@ class ADSPillarGUI:
                 self.log_message(f"✅ Seite generiert: {output_path}", self.gen_log)
                 self.update_status("Seite erfolgreich generiert")
 
-                messagebox.showinfo(
-                    "Erfolg", f"Seite erfolgreich generiert!\n{output_path}"
+                ctx.call(
+                    messagebox.showinfo,
+                    "Erfolg",
+                    f"Seite erfolgreich generiert!\n{output_path}",
                 )
 
             except Exception as e:
+                if ctx.token.cancelled:
+                    raise
                 self.log_message(f"❌ Fehler: {str(e)}", self.gen_log)
                 self.update_status("Generierung fehlgeschlagen")
-                messagebox.showerror(
-                    "Fehler", f"Fehler bei Seiten-Generierung: {str(e)}"
+                ctx.call(
+                    messagebox.showerror,
+                    "Fehler",
+                    f"Fehler bei Seiten-Generierung: {str(e)}",
                 )
 
-        threading.Thread(target=generate_thread, daemon=True).start()
+        self.run_task(
+            "Seiten-Generierung",
+            generate_task,
+            on_cancel=lambda: self._task_cancelled("Seiten-Generierung"),
+        )
 
     def preview_page(self):
         """Open generated page in browser"""
@@ -957,11 +1068,15 @@ class ADSPillarGUI:
     def load_csv(self):
         """Load CSV data"""
         filename = filedialog.askopenfilename(
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[
+                ("CSV files", "*.csv"),
+                ("Parquet files", "*.parquet"),
+                ("All files", "*.*"),
+            ]
         )
         if filename:
             try:
-                df = pd.read_csv(filename)
+                df = read_location_frame(filename)
                 self.current_df = df
                 self._user_csv_path = filename
                 self.update_data_preview(df)
@@ -972,7 +1087,7 @@ class ADSPillarGUI:
     def save_csv(self):
         """Save current data as CSV"""
         try:
-            if not self.data_preview.get_children():
+            if self.preview_df is None or self.preview_df.empty:
                 messagebox.showwarning(
                     "Keine Daten", "Keine Daten zum Exportieren vorhanden."
                 )
@@ -987,14 +1102,8 @@ class ADSPillarGUI:
             if not filename:
                 return
 
-            columns = self.data_preview["columns"]
-            rows = []
-
-            for item in self.data_preview.get_children():
-                values = self.data_preview.item(item)["values"]
-                rows.append(values)
-
-            df = pd.DataFrame(rows, columns=columns)
+            # Export the rows as filtered/sorted in the preview
+            df = self.data_preview.view_frame()
             df.to_csv(filename, index=False)
             try:
                 os.makedirs("data", exist_ok=True)
@@ -1011,72 +1120,54 @@ class ADSPillarGUI:
     def keyword_research(self):
         """Run keyword research"""
 
-        def research_thread():
+        city = self.project_config["city"].get()
+        category = self.project_config["category"].get()
+        self.niche_details.delete("1.0", tk.END)
+        self.niche_details.insert(tk.END, "🔍 Keyword Research läuft...\n\n")
+
+        def write(text):
+            self.tasks.call(self.niche_details.insert, tk.END, text)
+
+        def research_task(ctx):
             try:
                 self.update_status("Führe Keyword Research durch...")
-                self.niche_details.delete("1.0", tk.END)
-                self.niche_details.insert(tk.END, "🔍 Keyword Research läuft...\n\n")
 
                 from niche_research import KeywordResearch
 
                 researcher = KeywordResearch()
 
-                city = self.project_config["city"].get()
-                category = self.project_config["category"].get()
-
                 keywords = researcher.generate_keyword_variations(category, [city])
 
-                self.niche_details.insert(
-                    tk.END, f"📊 Keyword Analyse für: {category} in {city}\n"
-                )
-                self.niche_details.insert(tk.END, "=" * 60 + "\n\n")
+                write(f"📊 Keyword Analyse für: {category} in {city}\n")
+                write("=" * 60 + "\n\n")
 
                 low_comp = [kw for kw in keywords if kw["competition"] == "Low"]
                 med_comp = [kw for kw in keywords if kw["competition"] == "Medium"]
                 high_comp = [kw for kw in keywords if kw["competition"] == "High"]
 
-                self.niche_details.insert(
-                    tk.END, f"✅ Niedrige Competition ({len(low_comp)} Keywords):\n"
-                )
+                write(f"✅ Niedrige Competition ({len(low_comp)} Keywords):\n")
                 for kw in low_comp[:10]:
-                    self.niche_details.insert(
-                        tk.END,
-                        f"   • {kw['keyword']} (Vol: {kw['estimated_volume']:,})\n",
-                    )
+                    write(f"   • {kw['keyword']} (Vol: {kw['estimated_volume']:,})\n")
 
-                self.niche_details.insert(
-                    tk.END, f"\n⚠️  Mittlere Competition ({len(med_comp)} Keywords):\n"
-                )
+                write(f"\n⚠️  Mittlere Competition ({len(med_comp)} Keywords):\n")
                 for kw in med_comp[:5]:
-                    self.niche_details.insert(
-                        tk.END,
-                        f"   • {kw['keyword']} (Vol: {kw['estimated_volume']:,})\n",
-                    )
+                    write(f"   • {kw['keyword']} (Vol: {kw['estimated_volume']:,})\n")
 
-                self.niche_details.insert(
-                    tk.END, f"\n🔴 Hohe Competition ({len(high_comp)} Keywords):\n"
-                )
+                write(f"\n🔴 Hohe Competition ({len(high_comp)} Keywords):\n")
                 for kw in high_comp[:3]:
-                    self.niche_details.insert(
-                        tk.END,
-                        f"   • {kw['keyword']} (Vol: {kw['estimated_volume']:,})\n",
-                    )
+                    write(f"   • {kw['keyword']} (Vol: {kw['estimated_volume']:,})\n")
 
                 total_volume = sum(kw["estimated_volume"] for kw in keywords)
-                self.niche_details.insert(
-                    tk.END, f"\n📈 Gesamt Suchvolumen: {total_volume:,}\n"
-                )
-                self.niche_details.insert(
-                    tk.END, f"💡 Empfehlung: Fokus auf Low-Competition Keywords\n"
-                )
+                write(f"\n📈 Gesamt Suchvolumen: {total_volume:,}\n")
+                write(f"💡 Empfehlung: Fokus auf Low-Competition Keywords\n")
 
                 self.update_status("Keyword Research abgeschlossen")
 
             except Exception as e:
-                self.niche_details.insert(tk.END, f"\n❌ Fehler: {str(e)}\n")
+                write(f"\n❌ Fehler: {str(e)}\n")
                 self.update_status("Bereit")
 
-        threading.Thread(target=research_thread, daemon=True).start()
+        self.run_task("Keyword Research", research_task)
 
     def analyze_demand(self):
         """Run Review-Based Demand Analysis"""
@@ -1092,82 +1183,86 @@ class ADSPillarGUI:
             # Save API key for future use
             self.google_api_key.set(api_key)
 
-        def demand_thread():
+        # Get configuration
+        city = self.project_config["city"].get()
+        category = self.project_config["category"].get()
+
+        # Clear details area
+        self.niche_details.delete("1.0", tk.END)
+        self.niche_details.insert(tk.END, "🔍 Review Demand Analyse läuft...\n\n")
+
+        def write(text):
+            self.tasks.call(self.niche_details.insert, tk.END, text)
+
+        def demand_task(ctx):
             try:
-                # Clear details area
-                self.niche_details.delete("1.0", tk.END)
-                self.niche_details.insert(
-                    tk.END, "🔍 Review Demand Analyse läuft...\n\n"
-                )
                 self.update_status("Analysiere Google Places Reviews...")
 
-                # Get configuration
-                city = self.project_config["city"].get()
-                category = self.project_config["category"].get()
-
                 # Validate API key format (basic check)
                 if len(api_key) < 20 or not api_key.startswith("AIza"):
-                    response = messagebox.askyesno(
+                    response = ctx.call_sync(
+                        messagebox.askyesno,
                         "API Key Warnung",
                         "Der API-Key scheint ungültig zu sein (zu kurz oder falsches Format).\n\n"
                         "Google Places API-Keys beginnen normalerweise mit 'AIza' und sind mindestens 20 Zeichen lang.\n\n"
                         "Möchten Sie trotzdem fortfahren?",
                     )
                     if not response:
-                        self.niche_details.insert(
-                            tk.END, "❌ Abgebrochen: Ungültiger API Key\n"
-                        )
+                        write("❌ Abgebrochen: Ungültiger API Key\n")
                         self.update_status("Bereit")
                         return
                 elif not self._validate_api_key_format(api_key):
-                    self.niche_details.insert(tk.END, "⚠️  Warnung: API Key Format erscheint ungültig\n")
-                    self.niche_details.insert(tk.END, "   Google API Keys beginnen normalerweise mit 'AIza'\n")
-                    self.niche_details.insert(tk.END, "   Versuche trotzdem...\n\n")
+                    write("⚠️  Warnung: API Key Format erscheint ungültig\n")
+                    write("   Google API Keys beginnen normalerweise mit 'AIza'\n")
+                    write("   Versuche trotzdem...\n\n")
 
-                self.niche_details.insert(
-                    tk.END, f"📍 Analysiere: {category} in {city}\n"
-                )
-                self.niche_details.insert(tk.END, "=" * 60 + "\n\n")
+                write(f"📍 Analysiere: {category} in {city}\n")
+                write("=" * 60 + "\n\n")
 
                 # Validate API key with a test request
-                self.niche_details.insert(tk.END, "🔑 Validiere API Key...\n")
+                write("🔑 Validiere API Key...\n")
                 api_status = self._test_api_key(api_key)
                 
                 if api_status != "OK":
-                    self.niche_details.insert(tk.END, f"\n❌ API KEY FEHLER: {api_status}\n")
-                    self.niche_details.insert(tk.END, "=" * 60 + "\n\n")
+                    write(f"\n❌ API KEY FEHLER: {api_status}\n")
+                    write("=" * 60 + "\n\n")
                     
                     if api_status == "REQUEST_DENIED":
-                        self.niche_details.insert(tk.END, "Der API Key wurde abgelehnt.\n\n")
-                        self.niche_details.insert(tk.END, "Mögliche Gründe:\n")
-                        self.niche_details.insert(tk.END, "  • API Key ist ungültig oder abgelaufen\n")
-                        self.niche_details.insert(tk.END, "  • Places API ist nicht aktiviert in Google Cloud Console\n")
-                        self.niche_details.insert(tk.END, "  • Billing ist nicht aktiviert im Google Cloud Projekt\n")
-                        self.niche_details.insert(tk.END, "  • API Key hat keine Berechtigung für Places API\n")
+                        write("Der API Key wurde abgelehnt.\n\n")
+                        write("Mögliche Gründe:\n")
+                        write("  • API Key ist ungültig oder abgelaufen\n")
+                        write("  • Places API ist nicht aktiviert in Google Cloud Console\n")
+                        write("  • Billing ist nicht aktiviert im Google Cloud Projekt\n")
+                        write("  • API Key hat keine Berechtigung für Places API\n")
                     elif api_status == "INVALID_REQUEST":
-                        self.niche_details.insert(tk.END, "Ungültiger API Request.\n\n")
-                        self.niche_details.insert(tk.END, "Mögliche Gründe:\n")
-                        self.niche_details.insert(tk.END, "  • API Key Format ist falsch\n")
-                        self.niche_details.insert(tk.END, "  • API Key enthält ungültige Zeichen\n")
+                        write("Ungültiger API Request.\n\n")
+                        write("Mögliche Gründe:\n")
+                        write("  • API Key Format ist falsch\n")
+                        write("  • API Key enthält ungültige Zeichen\n")
                     elif api_status == "OVER_QUERY_LIMIT":
-                        self.niche_details.insert(tk.END, "API Limit überschritten.\n\n")
-                        self.niche_details.insert(tk.END, "  • Tägliches/Monatliches Limit erreicht\n")
-                        self.niche_details.insert(tk.END, "  • Warte oder erhöhe dein Google Cloud Quota\n")
+                        write("API Limit überschritten.\n\n")
+                        write("  • Tägliches/Monatliches Limit erreicht\n")
+                        write("  • Warte oder erhöhe dein Google Cloud Quota\n")
                     else:
-                        self.niche_details.insert(tk.END, f"Unerwarteter Fehler: {api_status}\n")
+                        write(f"Unerwarteter Fehler: {api_status}\n")
                     
-                    self.niche_details.insert(tk.END, "\n💡 So behebst du das Problem:\n")
-                    self.niche_details.insert(tk.END, "  1. Gehe zu https://console.cloud.google.com/apis/\n")
-                    self.niche_details.insert(tk.END, "  2. Aktiviere 'Places API (New)'\n")
-                    self.niche_details.insert(tk.END, "  3. Stelle sicher, dass Billing aktiviert ist\n")
-                    self.niche_details.insert(tk.END, "  4. Erstelle einen neuen API Key unter 'Credentials'\n")
+                    write("\n💡 So behebst du das Problem:\n")
+                    write("  1. Gehe zu https://console.cloud.google.com/apis/\n")
+                    write("  2. Aktiviere 'Places API (New)'\n")
+                    write("  3. Stelle sicher, dass Billing aktiviert ist\n")
+                    write("  4. Erstelle einen neuen API Key unter 'Credentials'\n")
                     self.update_status("API Authentifizierung fehlgeschlagen")
                     return
                 
-                self.niche_details.insert(tk.END, "✅ API Key gültig\n\n")
+                write("✅ API Key gültig\n\n")
 
                 # Initialize analyzer
-                analyzer = ReviewDemandAnalyzer(api_key=api_key, delay=1.0)
+                analyzer = ReviewDemandAnalyzer(
+                    api_key=api_key,
+                    delay=1.0,
+                    analysis_cache=self.review_analysis_cache,
+                )
+                self.review_analysis_cache = getattr(analyzer, "analysis_cache", None)
 
                 # Run analysis
                 analysis = analyzer.analyze_review_sentiment(
@@ -1175,108 +1270,82 @@ class ADSPillarGUI:
                     city=city,
                     min_reviews=50,  # Lower threshold for GUI
                     max_places=20,  # Limit to avoid long waits
+                    cancel_token=ctx.token,
+                    progress=lambda done, total: ctx.progress(done, total, unit="Orte"),
                 )
 
                 if analysis["total_reviews_analyzed"] == 0:
-                    self.niche_details.insert(tk.END, "❌ Keine Reviews gefunden\n")
-                    self.niche_details.insert(
-                        tk.END, "   Tipp: Prüfe API Key und Kategorie/Stadt\n"
-                    )
+                    write("❌ Keine Reviews gefunden\n")
+                    write("   Tipp: Prüfe API Key und Kategorie/Stadt\n")
                     self.update_status("Bereit")
                     return
 
                 # Display results
-                self.niche_details.insert(tk.END, f"📊 ANALYSEERGEBNIS\n")
-                self.niche_details.insert(tk.END, f"{'='*60}\n\n")
+                write(f"📊 ANALYSEERGEBNIS\n")
+                write(f"{'='*60}\n\n")
 
-                self.niche_details.insert(tk.END, f"📈 Zusammenfassung:\n")
-                self.niche_details.insert(
-                    tk.END,
-                    f"   Reviews analysiert: {analysis['total_reviews_analyzed']}\n",
-                )
-                self.niche_details.insert(
-                    tk.END,
-                    f"   Durchschnittliche Bewertung: {analysis['avg_rating']:.2f}/5.0\n",
-                )
-                self.niche_details.insert(
-                    tk.END, f"   Sentiment Score: {analysis['sentiment_score']:.2f}\n\n"
-                )
+                write(f"📈 Zusammenfassung:\n")
+                write(f"   Reviews analysiert: {analysis['total_reviews_analyzed']}\n")
+                write(f"   Durchschnittliche Bewertung: {analysis['avg_rating']:.2f}/5.0\n")
+                write(f"   Sentiment Score: {analysis['sentiment_score']:.2f}\n\n")
 
                 # Top complaints
-                self.niche_details.insert(tk.END, "🔴 TOP BESCHWERDEN (Was fehlt):\n")
+                write("🔴 TOP BESCHWERDEN (Was fehlt):\n")
                 for i, (phrase, count) in enumerate(analysis["top_complaints"][:7], 1):
-                    self.niche_details.insert(
-                        tk.END, f"   {i}. '{phrase}' ({count}x)\n"
-                    )
-                self.niche_details.insert(tk.END, "\n")
+                    write(f"   {i}. '{phrase}' ({count}x)\n")
+                write("\n")
 
                 # Unmet needs
-                self.niche_details.insert(
-                    tk.END, "💡 UNERFÜLLTE BEDÜRFNISSE (Opportunities!):\n"
-                )
+                write("💡 UNERFÜLLTE BEDÜRFNISSE (Opportunities!):\n")
                 if analysis["unmet_needs"]:
                     for i, (feature, count) in enumerate(
                         analysis["unmet_needs"][:5], 1
                     ):
-                        self.niche_details.insert(
-                            tk.END,
-                            f"   {i}. {feature.upper()} ({count} Erwähnungen) ⭐\n",
-                        )
+                        write(f"   {i}. {feature.upper()} ({count} Erwähnungen) ⭐\n")
                 else:
-                    self.niche_details.insert(
-                        tk.END, "   Keine erkannt - alle Bedürfnisse gedeckt\n"
-                    )
-                self.niche_details.insert(tk.END, "\n")
+                    write("   Keine erkannt - alle Bedürfnisse gedeckt\n")
+                write("\n")
 
                 # Top praise
-                self.niche_details.insert(tk.END, "🟢 TOP LOB (Was Nutzer lieben):\n")
+                write("🟢 TOP LOB (Was Nutzer lieben):\n")
                 for i, (phrase, count) in enumerate(analysis["top_praise"][:5], 1):
-                    self.niche_details.insert(
-                        tk.END, f"   {i}. '{phrase}' ({count}x)\n"
-                    )
-                self.niche_details.insert(tk.END, "\n")
+                    write(f"   {i}. '{phrase}' ({count}x)\n")
+                write("\n")
 
                 # Generate content ideas
+                ctx.check()
                 self.update_status("Generiere Content-Ideen...")
                 ideas = analyzer.generate_content_ideas(category, city, max_places=20)
 
-                self.niche_details.insert(
-                    tk.END, "🎯 CONTENT-IDEEN (Sofort umsetzbar!):\n"
-                )
-                self.niche_details.insert(tk.END, f"{'='*60}\n\n")
+                write("🎯 CONTENT-IDEEN (Sofort umsetzbar!):\n")
+                write(f"{'='*60}\n\n")
 
                 for i, idea in enumerate(ideas[:4], 1):  # Show top 4 ideas
-                    self.niche_details.insert(
-                        tk.END, f"{i}. [{idea['priority']}] {idea['title']}\n"
-                    )
-                    self.niche_details.insert(tk.END, f"   Typ: {idea['type']}\n")
-                    self.niche_details.insert(
-                        tk.END, f"   Impact: {idea['estimated_impact']}\n"
-                    )
-                    self.niche_details.insert(
-                        tk.END, f"   Beschreibung: {idea['description']}\n\n"
-                    )
+                    write(f"{i}. [{idea['priority']}] {idea['title']}\n")
+                    write(f"   Typ: {idea['type']}\n")
+                    write(f"   Impact: {idea['estimated_impact']}\n")
+                    write(f"   Beschreibung: {idea['description']}\n\n")
 
-                self.niche_details.insert(tk.END, f"{'='*60}\n")
-                self.niche_details.insert(tk.END, "✅ Analyse abgeschlossen!\n")
-                self.niche_details.insert(
-                    tk.END,
-                    "\nTipp: Nutze die Unmet Needs als Filter-Features für deine Pillar Page!\n",
-                )
+                write(f"{'='*60}\n")
+                write("✅ Analyse abgeschlossen!\n")
+                write("\nTipp: Nutze die Unmet Needs als Filter-Features für deine Pillar Page!\n")
 
                 self.update_status("Review Demand Analyse abgeschlossen")
 
             except Exception as e:
+                if ctx.token.cancelled:
+                    raise
                 import traceback
 
                 error_msg = str(e)
-                self.niche_details.insert(tk.END, f"\n❌ Fehler: {error_msg}\n")
-                self.niche_details.insert(
-                    tk.END, f"\nDetails:\n{traceback.format_exc()}\n"
-                )
+                write(f"\n❌ Fehler: {error_msg}\n")
+                write(f"\nDetails:\n{traceback.format_exc()}\n")
                 self.update_status("Bereit")
 
-        threading.Thread(target=demand_thread, daemon=True).start()
+        self.run_task(
+            "Review Demand Analyse",
+            demand_task,
+            on_cancel=lambda: write("\n⏹ Analyse abgebrochen\n"))
 
     def _prompt_api_key(self):
         """Prompt user for Google Places API key"""
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session factory for all scrapers
+Verbindungs-Pools pro Host, gzip, optional HTTP/2 (httpx) und Reuse-Metriken
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+
+from rate_limiter import RateLimiter, install_rate_limiter, shared_rate_limiter
+from response_cache import CachedSession, ResponseCache
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+)
+# Connections kept open per host; concurrent workers beyond this size open
+# throwaway connections ("Connection pool is full, discarding connection")
+DEFAULT_POOL_MAXSIZE = 10
+POOL_SIZES = {"maps.googleapis.com": 32}
+# Hosts whose pools are kept at once
+POOL_CONNECTIONS = 20
+DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+
+
+class SessionMetrics:
+    """Response counters of a session, filled by a response hook"""
+
+    def __init__(self):
+        self.responses = 0
+        self.compressed = 0
+        self.http2 = 0
+        self.wire_bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, response, *args, **kwargs):
+        encoding = response.headers.get("Content-Encoding", "")
+        length = response.headers.get("Content-Length", "")
+        http2 = getattr(response, "http_version", "") == "HTTP/2"
+        with self._lock:
+            self.responses += 1
+            self.compressed += encoding in ("gzip", "deflate")
+            self.http2 += http2
+            self.wire_bytes += int(length) if length.isdigit() else 0
+        return response
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "responses": self.responses,
+                "compressed": self.compressed,
+                "http2": self.http2,
+                "wire_bytes": self.wire_bytes,
+            }
+
+
+class Http2Session:
+    """requests-like session on an httpx HTTP/2 client
+
+    Offers the part of the requests API the scrapers use (``get``,
+    ``request``, ``headers``); requests to a host are multiplexed over one
+    connection. Every request goes through ``rate_limiter`` like the
+    RateLimitedAdapter of a requests session.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        headers: Dict[str, str],
+        max_connections: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float = 30.0,
+    ):
+        if not HTTPX_AVAILABLE:
+            raise ImportError("HTTP/2 needs httpx and h2: pip install 'httpx[http2]'")
+        self.rate_limiter = rate_limiter
+        self.metrics = SessionMetrics()
+        self.client = httpx.Client(
+            http2=True,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def request(self, method: str, url: str, params=None, **kwargs):
+        response = self.rate_limiter.send(
+            method,
+            url,
+            lambda: self.client.request(method, url, params=params, **kwargs),
+            transport_errors=(httpx.TransportError,),
+        )
+        return self.metrics.record(response)
+
+    def get(self, url: str, params=None, **kwargs):
+        return self.request("GET", url, params=params, **kwargs)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def create_session(
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    pool_maxsize: Optional[int] = None,
+    pool_sizes: Optional[Dict[str, int]] = None,
+    user_agent: str = DEFAULT_USER_AGENT,
+    http2: bool = False,
+):
+    """Session for a scraper: pooled keep-alive connections, gzip, rate limit
+
+    Args:
+        cache: Response cache (returns a CachedSession)
+        rate_limiter: Shared limiter (default: the process-wide one)
+        pool_maxsize: Connections kept per host, e.g. the worker count
+        pool_sizes: Per-host pool sizes on top of POOL_SIZES
+        user_agent: User-Agent header
+        http2: Use an httpx HTTP/2 client if installed (not with ``cache``)
+
+    Returns:
+        A requests.Session (or CachedSession / Http2Session) whose
+        ``metrics`` counts responses; see ``connection_stats``
+    """
+    limiter = rate_limiter or shared_rate_limiter()
+    headers = {**DEFAULT_HEADERS, "User-Agent": user_agent}
+    pool_maxsize = max(DEFAULT_POOL_MAXSIZE, pool_maxsize or 0)
+
+    if http2:
+        if cache is not None:
+            logger.info("Response cache in use, staying on HTTP/1.1")
+        elif not HTTPX_AVAILABLE:
+            logger.warning("httpx[http2] not installed, staying on HTTP/1.1")
+        else:
+            return Http2Session(limiter, headers, max_connections=pool_maxsize)
+
+    session = CachedSession(cache) if cache else requests.Session()
+    session.headers.update(headers)
+    install_rate_limiter(
+        session, limiter, pool_maxsize=pool_maxsize, pool_connections=POOL_CONNECTIONS
+    )
+    for host, size in {**POOL_SIZES, **(pool_sizes or {})}.items():
+        resize_pool(session, host, size, limiter)
+
+    session.metrics = SessionMetrics()
+    session.hooks["response"].append(session.metrics.record)
+    return session
+
+
+def resize_pool(
+    session,
+    url_or_host: str,
+    pool_maxsize: int,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> None:
+    """Keep ``pool_maxsize`` connections open to one host (no-op on HTTP/2)"""
+    if not isinstance(session, requests.Session):
+        return
+    host = url_or_host.split("://", 1)[-1].split("/", 1)[0]
+    prefixes = (f"https://{host}/", f"http://{host}/")
+    if "://" in url_or_host:
+        # Mount on the exact prefix so a custom (e.g. test) url is covered too
+        prefixes = (url_or_host,)
+    install_rate_limiter(
+        session,
+        rate_limiter,
+        pool_maxsize=pool_maxsize,
+        prefixes=prefixes,
+        pool_connections=POOL_CONNECTIONS,
+    )
+
+
+def connection_stats(session) -> Dict[str, Dict]:
+    """Connection reuse per host plus the session's response counters
+
+    For every pooled host: ``requests`` sent, new ``connections`` opened,
+    ``reused`` (requests on an already open connection) and ``reuse_rate``.
+    Pools that were evicted (more than POOL_CONNECTIONS hosts) are not
+    counted.
+    """
+    hosts: Dict[str, Dict] = {}
+    adapters = getattr(session, "adapters", {})
+    for adapter in {id(a): a for a in adapters.values()}.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            entry = hosts.setdefault(
+                f"{pool.host}:{pool.port}", {"requests": 0, "connections": 0}
+            )
+            entry["requests"] += pool.num_requests
+            entry["connections"] += pool.num_connections
+
+    for entry in hosts.values():
+        entry["reused"] = max(0, entry["requests"] - entry["connections"])
+        entry["reuse_rate"] = (
+            round(entry["reused"] / entry["requests"], 3) if entry["requests"] else 0.0
+        )
+
+    metrics = getattr(session, "metrics", None)
+    return {
+        "hosts": hosts,
+        "responses": metrics.snapshot() if metrics is not None else {},
+    }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Distinctive keyword scoring for review corpora
+Log-Odds mit informativem Dirichlet-Prior (Beschwerden vs. Lob vs. Hintergrund-Korpus)
+"""
+
+import json
+import os
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+BACKGROUND_VERSION = 2
+
+
+class KeywordScorer:
+    """Ranks the keywords that set one corpus apart from another
+
+    ``distinctive(target, reference)`` computes the log-odds ratio of every
+    term between the two term-count vectors with an informative Dirichlet
+    prior (Monroe et al., "Fightin' Words") and returns the terms with the
+    highest z-scores for each side. The prior comes from a background
+    corpus: the counts of earlier runs (persisted at ``background_path``)
+    plus the current corpora, so words that are frequent everywhere ("park",
+    "wetter") are shrunk towards zero and words that are just rare are not
+    over-rated. Earlier runs are kept per analysed corpus (e.g. category and
+    city), so analysing the same places again replaces their counts instead
+    of adding them a second time.
+    """
+
+    def __init__(
+        self,
+        background_path: Optional[str] = None,
+        prior_strength: float = 500.0,
+        max_background_terms: int = 100_000,
+    ):
+        self.background_path = background_path
+        self.prior_strength = prior_strength
+        self.max_background_terms = max_background_terms
+        self.background: Counter = Counter()
+        self.background_documents = 0
+        # corpus key -> {"documents": int, "counts": Counter}
+        self.corpora: Dict[str, Dict] = {}
+
+        if background_path and os.path.exists(background_path):
+            try:
+                with open(background_path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Keyword-Hintergrund {background_path} unlesbar: {e}")
+                stored = {}
+            if stored.get("version") == BACKGROUND_VERSION:
+                self.corpora = {
+                    key: {
+                        "documents": corpus.get("documents", 0),
+                        "counts": Counter(corpus.get("counts", {})),
+                    }
+                    for key, corpus in stored.get("corpora", {}).items()
+                }
+                self._merge_corpora()
+
+    def log_odds(
+        self, target: Mapping[str, int], reference: Mapping[str, int]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """z-scored log-odds of target vs reference for the union vocabulary
+
+        Returns:
+            (terms, z-scores, 2×V count matrix [target, reference]);
+            z > 0 means the term is typical for ``target``
+        """
+        terms = list(target) + [t for t in reference if t not in target]
+        size = len(terms)
+        if not size:
+            return [], np.zeros(0), np.zeros((2, 0))
+
+        counts = np.empty((2, size))
+        counts[0] = np.fromiter((target.get(t, 0) for t in terms), float, size)
+        counts[1] = np.fromiter((reference.get(t, 0) for t in terms), float, size)
+        background = np.fromiter(
+            (self.background.get(t, 0) for t in terms), float, size
+        )
+
+        # Informative prior: background + current corpora, Laplace smoothed;
+        # the more background evidence, the stronger the shrinkage
+        pooled = background + counts.sum(axis=0) + 1.0
+        alpha_total = self.prior_strength + background.sum()
+        alpha = alpha_total * pooled / pooled.sum()
+
+        totals = counts.sum(axis=1, keepdims=True)
+        smoothed = counts + alpha
+        log_odds = np.log(smoothed) - np.log(totals + alpha_total - smoothed)
+        delta = log_odds[0] - log_odds[1]
+        variance = (1.0 / smoothed).sum(axis=0)
+        return terms, delta / np.sqrt(variance), counts
+
+    def distinctive(
+        self,
+        target: Mapping[str, int],
+        reference: Mapping[str, int],
+        top_n: int = 20,
+        min_count: int = 1,
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """Most distinctive keywords of each corpus as (keyword, count)
+
+        Returns:
+            (keywords typical for target, keywords typical for reference),
+            each sorted by z-score and carrying the raw mention count
+        """
+        terms, z, counts = self.log_odds(target, reference)
+        if not terms:
+            return [], []
+
+        def ranked(side: int, scores: np.ndarray) -> List[Tuple[str, int]]:
+            eligible = np.flatnonzero((counts[side] >= min_count) & (scores > 0))
+            # Stable sort on -score keeps vocabulary order for ties
+            order = eligible[np.argsort(-scores[eligible], kind="stable")][:top_n]
+            return [(terms[i], int(counts[side, i])) for i in order]
+
+        return ranked(0, z), ranked(1, -z)
+
+    def update_background(
+        self, key: str, *corpora: Mapping[str, int], documents: int = 0
+    ) -> None:
+        """Store the term counts of corpus ``key`` in the background and persist it
+
+        Counts stored earlier under the same ``key`` are replaced, so
+        re-analysing a corpus does not shift the prior towards it.
+        """
+        counts: Counter = Counter()
+        for corpus in corpora:
+            counts.update(corpus)
+        self.corpora[key] = {"documents": documents, "counts": counts}
+        self._merge_corpora()
+        self.save()
+
+    def _merge_corpora(self) -> None:
+        self.background = Counter()
+        for corpus in self.corpora.values():
+            self.background.update(corpus["counts"])
+        self.background_documents = sum(
+            corpus["documents"] for corpus in self.corpora.values()
+        )
+
+        if len(self.background) > self.max_background_terms:
+            self.background = Counter(
+                dict(self.background.most_common(self.max_background_terms))
+            )
+
+    def save(self) -> None:
+        if not self.background_path:
+            return
+
+        os.makedirs(
+            os.path.dirname(os.path.abspath(self.background_path)), exist_ok=True
+        )
+        tmp_path = f"{self.background_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": BACKGROUND_VERSION,
+                    "corpora": {
+                        key: {
+                            "documents": corpus["documents"],
+                            "counts": dict(corpus["counts"]),
+                        }
+                        for key, corpus in self.corpora.items()
+                    },
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.background_path)
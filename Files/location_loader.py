@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Vectorized CSV ingestion for location data
+Lädt CSVs spaltenweise (ohne iterrows) in LocationData/ScrapedLocation Listen
+"""
+
+import dataclasses
+from typing import Dict, List, Optional, Type, Union
+
+import pandas as pd
+
+from data_pipeline import LocationData
+
+# Values accepted as "true" in feature columns (case-insensitive)
+TRUE_VALUES = {"TRUE", "1", "JA", "YES", "Y"}
+
+# Alternative column names used by the different CSV exports in data/
+LOCATION_DATA_ALIASES = {
+    "street": ["address"],
+    "url": ["website"],
+    "latitude": ["lat"],
+    "longitude": ["lng", "lon"],
+}
+
+SCRAPED_LOCATION_ALIASES = {
+    "address": ["street"],
+    "website": ["url"],
+    "latitude": ["lat"],
+    "longitude": ["lng", "lon"],
+}
+
+# Defaults for columns that are missing entirely (beyond the dataclass defaults)
+LOCATION_DATA_DEFAULTS = {"country": "Deutschland"}
+
+_TYPE_DEFAULTS = {str: "", float: 0.0, int: 0, bool: False}
+
+
+def normalize_bool(series: pd.Series, default: bool = False) -> pd.Series:
+    """Coerce a column to bool: TRUE/1/JA/YES/Y (any case) are True
+
+    Numeric columns are True when non-zero; empty cells take ``default``.
+    Unlike ``bool("False")`` this never treats arbitrary strings as True.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return series.fillna(default).astype(bool)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(int(default)) != 0
+
+    filled = series.where(series.notna(), str(default))
+    return filled.astype(str).str.strip().str.upper().isin(TRUE_VALUES)
+
+
+def _string_column(series: pd.Series, default: str) -> List[str]:
+    # Integral floats (e.g. postcodes in a column with gaps) lose their ".0"
+    if pd.api.types.is_float_dtype(series):
+        values = series.dropna()
+        if (values % 1 == 0).all():
+            series = series.astype("Int64")
+    return series.astype(object).where(series.notna(), default).astype(str).tolist()
+
+
+def _column(df: pd.DataFrame, field: dataclasses.Field, aliases: Dict) -> Optional[str]:
+    for name in [field.name] + aliases.get(field.name, []):
+        if name in df.columns:
+            return name
+    return None
+
+
+def _coerced_columns(
+    df: pd.DataFrame,
+    record_cls: Type,
+    aliases: Optional[Dict[str, List[str]]] = None,
+    defaults: Optional[Dict] = None,
+) -> Dict[str, List]:
+    """One coerced value list per dataclass field, in field order"""
+    aliases = aliases or {}
+    defaults = defaults or {}
+    count = len(df)
+    columns = {}
+
+    for field in dataclasses.fields(record_cls):
+        if field.name in defaults:
+            default = defaults[field.name]
+        elif field.default is not dataclasses.MISSING:
+            default = field.default
+        else:
+            default = _TYPE_DEFAULTS.get(field.type)
+
+        source = _column(df, field, aliases)
+        if source is None or field.type not in _TYPE_DEFAULTS:
+            if field.name == "id":
+                columns[field.name] = [str(i) for i in df.index]
+            else:
+                columns[field.name] = [default] * count
+            continue
+
+        series = df[source]
+        if field.type is bool:
+            values = normalize_bool(series, default).tolist()
+        elif field.type is float:
+            values = pd.to_numeric(series, errors="coerce").fillna(default)
+            values = values.astype(float).tolist()
+        elif field.type is int:
+            values = pd.to_numeric(series, errors="coerce").fillna(default)
+            values = values.astype("int64").tolist()
+        else:
+            values = _string_column(series, default)
+        columns[field.name] = values
+
+    return columns
+
+
+def records_from_frame(
+    df: pd.DataFrame,
+    record_cls: Type,
+    aliases: Optional[Dict[str, List[str]]] = None,
+    defaults: Optional[Dict] = None,
+) -> List:
+    """Build dataclass instances from a DataFrame, coercing column by column
+
+    Args:
+        df: Source frame (any subset of the dataclass fields / aliases)
+        record_cls: Dataclass to build (LocationData, ScrapedLocation, ...)
+        aliases: Alternative column names per field
+        defaults: Values for fields whose column is missing
+
+    Returns:
+        List of ``record_cls`` instances in row order
+    """
+    columns = _coerced_columns(df, record_cls, aliases, defaults)
+    return [record_cls(*row) for row in zip(*columns.values())]
+
+
+def canonical_frame(
+    df: pd.DataFrame,
+    record_cls: Type = LocationData,
+    aliases: Optional[Dict[str, List[str]]] = LOCATION_DATA_ALIASES,
+    defaults: Optional[Dict] = LOCATION_DATA_DEFAULTS,
+) -> pd.DataFrame:
+    """Frame with exactly the dataclass fields as columns, coerced to their types
+
+    Same coercion as ``records_from_frame`` (aliases, defaults, bool
+    parsing), but columnar: ``lat``/``lng`` become ``latitude``/``longitude``,
+    ``address`` becomes ``street`` and columns outside the schema are dropped.
+    """
+    columns = _coerced_columns(df, record_cls, aliases, defaults)
+    dtypes = {str: object, float: "float64", int: "int64", bool: bool}
+    return pd.DataFrame(
+        {
+            field.name: pd.Series(
+                columns[field.name], dtype=dtypes.get(field.type, object)
+            )
+            for field in dataclasses.fields(record_cls)
+        }
+    )
+
+
+def load_location_data(source: Union[str, pd.DataFrame]) -> List[LocationData]:
+    """Load LocationData objects for page generation from a CSV path or frame
+
+    A path may also point to a LocationStore directory, a Parquet file or a
+    LocationRepository database (.sqlite/.db).
+    """
+    if isinstance(source, str):
+        from location_store import read_location_frame
+
+        df = read_location_frame(source)
+    else:
+        df = source
+    return records_from_frame(
+        df, LocationData, LOCATION_DATA_ALIASES, LOCATION_DATA_DEFAULTS
+    )
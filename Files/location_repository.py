@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+SQLite repository for collected locations and their reviews
+Upsert per place_id, Indizes auf Stadt/Kategorie/Features, FTS5-Suche in Reviews
+"""
+
+import dataclasses
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import pandas as pd
+
+from data_pipeline import LocationData
+from location_loader import canonical_frame, records_from_frame
+
+DEFAULT_REPOSITORY_PATH = "data/locations.sqlite"
+
+_SQL_TYPES = {str: "TEXT", float: "REAL", int: "INTEGER", bool: "INTEGER"}
+
+# LocationData columns stored per place (the place_id replaces LocationData.id)
+LOCATION_FIELDS = [f for f in dataclasses.fields(LocationData) if f.name != "id"]
+FEATURE_COLUMNS = [f.name for f in LOCATION_FIELDS if f.name.startswith("feature_")]
+
+# Upserts never blank out these columns with an empty value
+_KEEP_IF_EMPTY = ("category", "reviews_text", "tags")
+
+
+def place_key(place_id: str, name: str, street: str, city: str) -> str:
+    """The Google place_id, or a stable key from name/street/city for other sources"""
+    if place_id:
+        return place_id
+    normalized = "|".join(part.strip().lower() for part in (name, street, city))
+    return "local:" + hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+class LocationRepository:
+    """Locations and reviews in one SQLite file
+
+    ``upsert`` inserts new places and updates known ones (same ``place_id``)
+    in place, so repeated collection runs accumulate instead of overwriting
+    each other. City, category and every feature flag are indexed for
+    ``query``; ``search`` runs an FTS5 query over name, tags and the
+    concatenated review texts, kept in sync by triggers.
+    """
+
+    def __init__(self, path: str = DEFAULT_REPOSITORY_PATH, read_only: bool = False):
+        """
+        Args:
+            path: SQLite file, created with the schema if missing
+            read_only: Open an existing repository without writing to it
+                (no directory, file or schema is created)
+        """
+        self.path = path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+
+        if read_only:
+            uri = Path(path).resolve().as_uri() + "?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._check_schema()
+            return
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._create_schema()
+
+    def _check_schema(self) -> None:
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'locations'"
+            ).fetchone()
+        if found is None:
+            self.close()
+            raise ValueError(f"{self.path} ist keine LocationRepository-Datenbank")
+
+    def _create_schema(self) -> None:
+        columns = ",\n".join(
+            f"{f.name} {_SQL_TYPES[f.type]} NOT NULL" for f in LOCATION_FIELDS
+        )
+        statements = [
+            f"""
+            CREATE TABLE IF NOT EXISTS locations (
+                place_id TEXT PRIMARY KEY,
+                category TEXT NOT NULL DEFAULT '',
+                {columns},
+                reviews_text TEXT NOT NULL DEFAULT '',
+                updated REAL NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS reviews (
+                place_id TEXT NOT NULL,
+                author TEXT NOT NULL DEFAULT '',
+                time INTEGER NOT NULL DEFAULT 0,
+                rating REAL NOT NULL DEFAULT 0,
+                text TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (place_id, author, time)
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_locations_city ON locations(city)",
+            "CREATE INDEX IF NOT EXISTS idx_locations_category ON locations(category)",
+            *(
+                f"CREATE INDEX IF NOT EXISTS idx_locations_{c} ON locations({c})"
+                for c in FEATURE_COLUMNS
+            ),
+            # External-content FTS index over the locations table
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS locations_fts USING fts5(
+                name, tags, reviews_text, content='locations', content_rowid='rowid'
+            )
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS locations_ai AFTER INSERT ON locations BEGIN
+                INSERT INTO locations_fts(rowid, name, tags, reviews_text)
+                VALUES (new.rowid, new.name, new.tags, new.reviews_text);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS locations_ad AFTER DELETE ON locations BEGIN
+                INSERT INTO locations_fts(locations_fts, rowid, name, tags, reviews_text)
+                VALUES ('delete', old.rowid, old.name, old.tags, old.reviews_text);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS locations_au AFTER UPDATE ON locations BEGIN
+                INSERT INTO locations_fts(locations_fts, rowid, name, tags, reviews_text)
+                VALUES ('delete', old.rowid, old.name, old.tags, old.reviews_text);
+                INSERT INTO locations_fts(rowid, name, tags, reviews_text)
+                VALUES (new.rowid, new.name, new.tags, new.reviews_text);
+            END
+            """,
+        ]
+        with self._lock:
+            for statement in statements:
+                self._conn.execute(statement)
+            self._conn.commit()
+
+    def upsert(
+        self,
+        rows: Union[pd.DataFrame, Iterable[Mapping]],
+        category: str = "",
+        city: str = "",
+    ) -> int:
+        """Insert or update places (scraper dicts or any data/ CSV layout)
+
+        Args:
+            rows: Frame or dicts; ``place_id``, ``category`` and
+                ``reviews_text`` columns are used when present
+            category: Category for rows without one
+            city: City for rows without one
+
+        Returns:
+            Number of rows written
+        """
+        df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        if df.empty:
+            return 0
+        df = df.reset_index(drop=True)
+
+        canonical = canonical_frame(df)
+        if city:
+            canonical["city"] = canonical["city"].replace("", city)
+        extra = {}
+        for column, default in (
+            ("place_id", ""),
+            ("category", category),
+            ("reviews_text", ""),
+        ):
+            if column in df.columns:
+                values = df[column].astype(object).where(df[column].notna(), "")
+                extra[column] = values.astype(str).replace("", default).tolist()
+            else:
+                extra[column] = [default] * len(df)
+
+        names = [f.name for f in LOCATION_FIELDS]
+        keys = [
+            place_key(pid, name, street, town)
+            for pid, name, street, town in zip(
+                extra["place_id"],
+                canonical["name"],
+                canonical["street"],
+                canonical["city"],
+            )
+        ]
+        now = time.time()
+        records = zip(
+            keys,
+            extra["category"],
+            *(canonical[name].tolist() for name in names),
+            extra["reviews_text"],
+            [now] * len(df),
+        )
+
+        columns = ["place_id", "category", *names, "reviews_text", "updated"]
+        assignments = ", ".join(
+            f"{c} = CASE WHEN excluded.{c} = '' THEN locations.{c} ELSE excluded.{c} END"
+            if c in _KEEP_IF_EMPTY
+            else f"{c} = excluded.{c}"
+            for c in columns[1:]
+        )
+        sql = (
+            f"INSERT INTO locations ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(place_id) DO UPDATE SET {assignments}"
+        )
+        with self._lock:
+            self._conn.executemany(sql, records)
+            self._conn.commit()
+        return len(keys)
+
+    def add_reviews(self, place_id: str, reviews: Iterable[Mapping]) -> int:
+        """Store reviews ({author, time, rating, text}) of a place
+
+        Known reviews (same author and time) are skipped; the place's
+        ``reviews_text`` is rebuilt from all its stored reviews.
+
+        Returns:
+            Number of new reviews
+        """
+        rows = [
+            (
+                place_id,
+                str(r.get("author") or ""),
+                int(r.get("time") or 0),
+                float(r.get("rating") or 0),
+                str(r.get("text") or ""),
+            )
+            for r in reviews
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO reviews (place_id, author, time, rating, text) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = self._conn.total_changes - before
+            self._conn.execute(
+                """
+                UPDATE locations SET reviews_text = (
+                    SELECT COALESCE(GROUP_CONCAT(text, ' '), '') FROM reviews
+                    WHERE reviews.place_id = locations.place_id
+                ) WHERE place_id = ?
+                """,
+                (place_id,),
+            )
+            self._conn.commit()
+        return added
+
+    def reviews(self, place_id: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT author, time, rating, text FROM reviews "
+                "WHERE place_id = ? ORDER BY time",
+                (place_id,),
+            ).fetchall()
+        return [dict(zip(("author", "time", "rating", "text"), row)) for row in rows]
+
+    @staticmethod
+    def _where(
+        city: Optional[str],
+        category: Optional[str],
+        features: Sequence[str],
+        text: Optional[str],
+    ):
+        clauses, params = [], []
+        if city:
+            clauses.append("city = ? COLLATE NOCASE")
+            params.append(city)
+        if category:
+            clauses.append("category = ? COLLATE NOCASE")
+            params.append(category)
+        for feature in features:
+            column = feature if feature.startswith("feature_") else f"feature_{feature}"
+            if column not in FEATURE_COLUMNS:
+                raise ValueError(f"Unbekanntes Feature: {feature}")
+            clauses.append(f"{column} = 1")
+        if text:
+            clauses.append(
+                "rowid IN (SELECT rowid FROM locations_fts WHERE locations_fts MATCH ?)"
+            )
+            params.append(text)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        city: Optional[str] = None,
+        category: Optional[str] = None,
+        features: Sequence[str] = (),
+        text: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> pd.DataFrame:
+        """Matching locations, most reviewed first
+
+        Args:
+            city: Exact city (case-insensitive)
+            category: Exact category (case-insensitive)
+            features: Required feature flags ("water" or "feature_water")
+            text: FTS5 query over name, tags and review texts
+            columns: Columns to return (default: all but reviews_text)
+            limit: Maximum number of rows
+            offset: Rows to skip (paging)
+        """
+        where, params = self._where(city, category, features, text)
+        if columns is None:
+            columns = ["place_id", "category", *(f.name for f in LOCATION_FIELDS)]
+        sql = f"SELECT {', '.join(columns)} FROM locations{where} ORDER BY review_count DESC, rowid"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        for column in df.columns.intersection(FEATURE_COLUMNS):
+            df[column] = df[column].astype(bool)
+        return df
+
+    def count(
+        self,
+        city: Optional[str] = None,
+        category: Optional[str] = None,
+        features: Sequence[str] = (),
+        text: Optional[str] = None,
+    ) -> int:
+        where, params = self._where(city, category, features, text)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM locations{where}", params
+            ).fetchone()[0]
+
+    def search(self, text: str, limit: int = 20) -> pd.DataFrame:
+        """Full-text search, best match (bm25) first"""
+        sql = f"""
+            SELECT {', '.join('l.' + c for c in ['place_id', 'category', *(f.name for f in LOCATION_FIELDS)])}
+            FROM locations_fts JOIN locations l ON l.rowid = locations_fts.rowid
+            WHERE locations_fts MATCH ? ORDER BY bm25(locations_fts) LIMIT ?
+        """
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=[text, limit])
+        for column in FEATURE_COLUMNS:
+            df[column] = df[column].astype(bool)
+        return df
+
+    def to_locations(self, **filters) -> List[LocationData]:
+        """LocationData objects (id = place_id) for the page generator"""
+        df = self.query(**filters).rename(columns={"place_id": "id"})
+        return records_from_frame(df, LocationData)
+
+    def import_csv(self, path: str, category: str = "", city: str = "") -> int:
+        return self.upsert(pd.read_csv(path), category=category, city=city)
+
+    def export_csv(self, path: str, **filters) -> int:
+        """Write matching locations as CSV; returns the row count"""
+        df = self.query(**filters)
+        df.to_csv(path, index=False)
+        return len(df)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
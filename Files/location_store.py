@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Columnar working store for collected location data
+Parquet-Teile mit festem LocationData-Schema (append-only, memory-mapped lesen,
+neueste Version je place_id gewinnt)
+"""
+
+import dataclasses
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from data_pipeline import LocationData
+from location_loader import canonical_frame, records_from_frame
+from location_repository import LocationRepository, place_key
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pq = None
+    PYARROW_AVAILABLE = False
+
+DEFAULT_STORE_PATH = "data/locations"
+PART_SUFFIX = ".parquet"
+REPOSITORY_SUFFIXES = {".sqlite", ".db"}
+# Columns on top of LocationData: the key that rows of different runs are
+# reconciled on (Google place_id or place_key of name/street/city) and the
+# category the place was collected for
+STORE_COLUMNS = ["place_id", "category"]
+
+
+def location_schema() -> "pa.Schema":
+    """Arrow schema of the store: LocationData fields plus STORE_COLUMNS, non-null"""
+    _require_pyarrow()
+    types = {str: pa.string(), float: pa.float64(), int: pa.int64(), bool: pa.bool_()}
+    return pa.schema(
+        [
+            pa.field(field.name, types[field.type], nullable=False)
+            for field in dataclasses.fields(LocationData)
+        ]
+        + [pa.field(name, pa.string(), nullable=False) for name in STORE_COLUMNS]
+    )
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow wird für den LocationStore benötigt: pip install pyarrow"
+        )
+
+
+def is_parquet_source(path: Union[str, Path]) -> bool:
+    """True for a Parquet file or a LocationStore directory"""
+    path = Path(path)
+    return path.suffix == PART_SUFFIX or path.is_dir()
+
+
+def read_location_frame(path: Union[str, Path]) -> pd.DataFrame:
+    """Read a CSV, Parquet file, LocationStore directory or SQLite repository"""
+    if Path(path).suffix in REPOSITORY_SUFFIXES:
+        # Readers never create, migrate or lock the collection database
+        repository = LocationRepository(str(path), read_only=True)
+        try:
+            return repository.query().rename(columns={"place_id": "id"})
+        finally:
+            repository.close()
+    if not is_parquet_source(path):
+        return pd.read_csv(path)
+    if Path(path).is_dir():
+        return LocationStore(path).read()
+    _require_pyarrow()
+    return pq.read_table(str(path), memory_map=True).to_pandas()
+
+
+class LocationStore:
+    """Append-only Parquet store with the LocationData schema
+
+    Every ``append`` writes one immutable part file (atomically, via a temp
+    file and ``os.replace``), so readers never see half-written data and
+    nothing is rewritten on ingestion. Incoming frames go through
+    ``canonical_frame``: alias columns (``lat``/``lng``, ``address``,
+    ``website``) are mapped, types are coerced once and columns outside the
+    schema are dropped. Each row is keyed by ``place_id`` (see
+    ``place_key``); a place collected again in a later run supersedes its
+    older rows, so ``read`` returns every place once, in its newest
+    version. Reads memory-map the parts. ``compact`` merges the parts into
+    one file and drops the superseded rows.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_STORE_PATH):
+        _require_pyarrow()
+        self.directory = Path(directory)
+        self.schema = location_schema()
+
+    def parts(self) -> List[Path]:
+        """Part files in append order"""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            p
+            for p in self.directory.iterdir()
+            if p.suffix == PART_SUFFIX and not p.name.startswith(".")
+        )
+
+    def __len__(self) -> int:
+        """Stored rows, superseded ones included until ``compact``"""
+        # Row counts come from the Parquet footers, no data is read
+        return sum(pq.read_metadata(str(p)).num_rows for p in self.parts())
+
+    def append(
+        self, data: Union[pd.DataFrame, Iterable[Dict]], category: str = ""
+    ) -> int:
+        """Write ``data`` (frame or dicts, e.g. from UniversalScraper) as a new part
+
+        Rows without an ``id`` get ids continuing the store's row count.
+
+        Args:
+            data: Rows; ``place_id`` and ``category`` columns are used when present
+            category: Category for rows without one
+
+        Returns:
+            Number of rows written
+        """
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(list(data))
+        if df.empty:
+            return 0
+
+        if "id" not in df.columns:
+            df = df.set_axis(pd.RangeIndex(len(self), len(self) + len(df)))
+        frame = canonical_frame(df)
+        extra = {}
+        for column, default in (("place_id", ""), ("category", category)):
+            if column in df.columns:
+                values = df[column].astype(object).where(df[column].notna(), "")
+                extra[column] = values.astype(str).replace("", default).tolist()
+            else:
+                extra[column] = [default] * len(df)
+        frame["place_id"] = [
+            place_key(pid, name, street, city)
+            for pid, name, street, city in zip(
+                extra["place_id"], frame["name"], frame["street"], frame["city"]
+            )
+        ]
+        frame["category"] = extra["category"]
+        table = pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+        self._write_part(table)
+        return table.num_rows
+
+    def _write_part(self, table: "pa.Table") -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Nanosecond prefix keeps the part names in append order
+        name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}{PART_SUFFIX}"
+        path = self.directory / name
+        tmp_path = self.directory / f".{name}.tmp"
+        pq.write_table(table, str(tmp_path))
+        os.replace(tmp_path, path)
+        return path
+
+    def read_table(self, columns: Optional[List[str]] = None) -> "pa.Table":
+        parts = self.parts()
+        if not parts:
+            schema = self.schema
+            if columns is not None:
+                schema = pa.schema([schema.field(c) for c in columns])
+            return schema.empty_table()
+        return pa.concat_tables(
+            [pq.read_table(str(p), columns=columns, memory_map=True) for p in parts]
+        )
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        city: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """The newest row of every place as a DataFrame
+
+        Args:
+            columns: Columns to return (default: all)
+            city: Only places in this city (case-insensitive)
+            category: Only places of this category (case-insensitive)
+        """
+        filters = {"city": city, "category": category}
+        filters = {column: value for column, value in filters.items() if value}
+        needed = None
+        if columns is not None:
+            needed = list(dict.fromkeys([*columns, "place_id", *filters]))
+        df = self.read_table(needed).to_pandas()
+
+        # Parts are in append order: the last row of a place is the newest
+        df = df.drop_duplicates("place_id", keep="last")
+        for column, value in filters.items():
+            df = df[df[column].str.casefold() == value.casefold()]
+        df = df.reset_index(drop=True)
+        return df if columns is None else df[columns]
+
+    def to_locations(self) -> List[LocationData]:
+        return records_from_frame(self.read(), LocationData)
+
+    def import_csv(self, path: Union[str, Path]) -> int:
+        """Append the rows of a CSV (any of the data/ CSV layouts)"""
+        return self.append(pd.read_csv(path))
+
+    def export_csv(self, path: Union[str, Path]) -> int:
+        """Write every place as CSV (newest rows); returns the row count"""
+        df = self.read()
+        df.to_csv(path, index=False)
+        return len(df)
+
+    def compact(self) -> int:
+        """Merge all parts into one without superseded rows
+
+        Returns:
+            Number of parts merged
+        """
+        parts = self.parts()
+        if len(parts) < 2:
+            return 0
+        self._write_part(
+            pa.Table.from_pandas(self.read(), schema=self.schema, preserve_index=False)
+        )
+        for part in parts:
+            part.unlink()
+        return len(parts)
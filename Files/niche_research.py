@@ -1,21 +1,55 @@
 import json
-import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import quote
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import re
+import threading
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 import os
 import sys
 
 # Import GooglePlacesScraper for review data
 try:
     from enhanced_scrapers import GooglePlacesScraper
+    from location_loader import normalize_bool
+    from location_store import read_location_frame
+    from location_repository import DEFAULT_REPOSITORY_PATH, LocationRepository
+    from http_session import create_session
+    from response_cache import ResponseCache
+    from analysis_cache import AnalysisCache
+    from keyword_scoring import KeywordScorer
+    from phrase_engine import (
+        GENERIC_PHRASE_PATTERN,
+        FeatureMatcher,
+        SENTENCE_SPLIT,
+        WORD_PATTERN,
+        SpaceSaving,
+        indicator_pattern,
+        sentence_ngrams,
+    )
 except ImportError:
     # Fallback for when running from different directory
     sys.path.insert(0, os.path.dirname(__file__))
     from enhanced_scrapers import GooglePlacesScraper
-
+    from location_loader import normalize_bool
+    from location_store import read_location_frame
+    from location_repository import DEFAULT_REPOSITORY_PATH, LocationRepository
+    from http_session import create_session
+    from response_cache import ResponseCache
+    from analysis_cache import AnalysisCache
+    from keyword_scoring import KeywordScorer
+    from phrase_engine import (
+        GENERIC_PHRASE_PATTERN,
+        FeatureMatcher,
+        SENTENCE_SPLIT,
+        WORD_PATTERN,
+        SpaceSaving,
+        indicator_pattern,
+        sentence_ngrams,
+    )
+
+import numpy as np
 import pandas as pd
 import requests
 
@@ -24,7 +58,7 @@ class KeywordResearch:
     """Research keywords and validate niches"""
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
 
     def check_serp_diversity(self, keyword: str) -> Dict:
         """
@@ -104,21 +138,74 @@ class KeywordResearch:
 class NicheValidator:
     """Validate niche opportunities using live geo data instead of placeholders"""
 
+    DEFAULT_DATA_SOURCES = [
+        Path("data/babelsberg_locations.csv"),
+        Path("data/active.csv"),
+        Path("data/collected_data.csv"),
+        Path("data/locations"),
+    ]
+    REPOSITORY_PATH = Path(DEFAULT_REPOSITORY_PATH)
+    # Exports of the repository (GUI preview, collection runs) and the
+    # scraper's working store: read next to it they would count every place
+    # twice
+    REPOSITORY_EXPORTS = (
+        Path("data/active.csv"),
+        Path("data/collected_data.csv"),
+        Path("data/locations"),
+    )
+
     def __init__(
         self,
         config_path: str = "quick_config.json",
         data_sources: Optional[List[Path]] = None,
+        config: Optional[Dict] = None,
+        frames: Optional[List[pd.DataFrame]] = None,
+        repository: Optional[Path] = None,
     ):
-        self.config = self._load_config(config_path)
-        self.data_sources = data_sources or [
-            Path("data/babelsberg_locations.csv"),
-            Path("data/active.csv"),
-            Path("data/collected_data.csv"),
-        ]
-        self.analytics_df = self._load_geolocation_data()
+        """
+        Args:
+            config_path: Project config (city etc.), ignored if ``config`` is given
+            data_sources: CSV/Parquet files, LocationStore directories or
+                LocationRepository databases with collected locations
+            config: Already loaded config
+            frames: Already read source frames (skips reading ``data_sources``)
+            repository: LocationRepository queried for the config's city
+                (default: REPOSITORY_PATH together with the default sources)
+        """
+        self.config = config if config is not None else self._load_config(config_path)
+        if repository is None and not data_sources:
+            repository = self.REPOSITORY_PATH
+        self.repository = Path(repository) if repository is not None else None
+        self.data_sources = data_sources or list(self.DEFAULT_DATA_SOURCES)
+        if frames is None:
+            repository_frame = self._read_repository(
+                self.repository, self.config.get("city")
+            )
+            frames = [
+                frame
+                for frame in (
+                    self._read_source(path)
+                    for path in self.sources(repository_frame is not None)
+                )
+                if frame is not None
+            ]
+            if repository_frame is not None:
+                frames.append(repository_frame)
+        self.analytics_df = self._prepare_frames(frames)
+        # Per feature column: locations, total_reviews, rating_mean
+        self.feature_stats = pd.DataFrame()
         self.niches = self._build_dynamic_niches()
+        self._keyword_research: Optional[KeywordResearch] = None
 
-    def _load_config(self, config_path: str) -> Dict:
+    @property
+    def keyword_research(self) -> KeywordResearch:
+        """One KeywordResearch (and HTTP session) for all analyze_niche calls"""
+        if self._keyword_research is None:
+            self._keyword_research = KeywordResearch()
+        return self._keyword_research
+
+    @staticmethod
+    def _load_config(config_path: str) -> Dict:
         path = Path(config_path)
         if path.exists():
             with open(path, "r", encoding="utf-8") as f:
@@ -132,19 +219,45 @@ class NicheValidator:
 
     @staticmethod
     def _normalize_bool(series: pd.Series) -> pd.Series:
-        return series.astype(str).str.upper().isin({"TRUE", "1", "JA", "YES", "Y"})
+        return normalize_bool(series)
 
-    def _load_geolocation_data(self) -> pd.DataFrame:
-        frames: List[pd.DataFrame] = []
-        for path in self.data_sources:
-            if not path.exists():
-                continue
-            try:
-                df = pd.read_csv(path)
-                frames.append(df)
-            except Exception as exc:
-                print(f"⚠️  Konnte {path} nicht laden: {exc}")
+    @staticmethod
+    def _read_source(path: Path) -> Optional[pd.DataFrame]:
+        if not path.exists():
+            return None
+        try:
+            return read_location_frame(path)
+        except Exception as exc:
+            print(f"⚠️  Konnte {path} nicht laden: {exc}")
+            return None
 
+    @staticmethod
+    def _read_repository(
+        path: Optional[Path], city: Optional[str]
+    ) -> Optional[pd.DataFrame]:
+        """Places of ``city`` in the repository, None if it has none"""
+        if path is None or not path.exists():
+            return None
+        try:
+            repository = LocationRepository(str(path), read_only=True)
+            try:
+                df = repository.query(city=city or None)
+            finally:
+                repository.close()
+        except Exception as exc:
+            print(f"⚠️  Konnte {path} nicht abfragen: {exc}")
+            return None
+        if df.empty:
+            return None
+        return df.rename(columns={"place_id": "id"})
+
+    def sources(self, from_repository: bool) -> List[Path]:
+        """Data sources to read; copies of the repository's places are skipped when it is used"""
+        if not from_repository:
+            return list(self.data_sources)
+        return [p for p in self.data_sources if p not in self.REPOSITORY_EXPORTS]
+
+    def _prepare_frames(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
         if not frames:
             return pd.DataFrame()
 
@@ -155,8 +268,16 @@ class NicheValidator:
             ).fillna(0)
         if "rating" in df.columns:
             df["rating"] = pd.to_numeric(df["rating"], errors="coerce").fillna(0)
+
+        # Normalize feature flags once; everything downstream uses plain bools
+        for column in self._feature_columns(df):
+            df[column] = self._normalize_bool(df[column])
         return df
 
+    @staticmethod
+    def _feature_columns(df: pd.DataFrame) -> List[str]:
+        return [col for col in df.columns if col.startswith("feature_")]
+
     @staticmethod
     def _feature_to_label(feature_name: str) -> str:
         mapping = {
@@ -181,41 +302,96 @@ class NicheValidator:
             return "medium"
         return "emerging"
 
-    def _extract_tags(self, feature_df: pd.DataFrame) -> List[str]:
-        if "tags" not in feature_df.columns:
-            return []
+    @staticmethod
+    def _rank_tags(df: pd.DataFrame, feature_columns: List[str]) -> Dict[str, List[str]]:
+        """Ranked tags for every feature column in one explode/groupby pass
 
-        tag_scores: Dict[str, float] = {}
-        for _, row in feature_df.iterrows():
-            weight = float(row.get("review_count", 0)) or 1.0
-            for tag in str(row.get("tags", "")).split(","):
-                tag_clean = tag.strip()
-                if not tag_clean:
-                    continue
-                tag_scores[tag_clean] = tag_scores.get(tag_clean, 0.0) + weight
+        Each location adds its review_count (at least 1) to each of its
+        comma-separated tags. Ties keep the order in which the tags first
+        appear among the locations of that feature.
+        """
+        if "tags" not in df.columns or not feature_columns:
+            return {}
 
-        return [
-            tag
-            for tag, _ in sorted(tag_scores.items(), key=lambda x: x[1], reverse=True)
-        ]
+        if "review_count" in df.columns:
+            weights = df["review_count"].astype(float).replace(0.0, 1.0)
+        else:
+            weights = pd.Series(1.0, index=df.index)
+
+        # Positional index, so each exploded tag knows its location row
+        tags = df["tags"].reset_index(drop=True).dropna().astype(str)
+        tags = tags.str.split(",").explode().str.strip()
+        tags = tags[tags != ""]
+        if tags.empty:
+            return {}
+
+        rows = tags.index.to_numpy()
+        flags = df[feature_columns].to_numpy(dtype=bool)[rows]
+        weight = weights.to_numpy(dtype=float)[rows]
+        # Position of the entry, used as tie-breaker (first appearance)
+        position = np.arange(len(rows), dtype=float)
+
+        long = pd.DataFrame(
+            np.column_stack(
+                [flags * weight[:, None], np.where(flags, position[:, None], np.inf)]
+            ),
+            columns=[f"s{i}" for i in range(len(feature_columns))]
+            + [f"p{i}" for i in range(len(feature_columns))],
+        )
+        grouped = long.groupby(tags.to_numpy(), sort=False)
+        scores = grouped[[f"s{i}" for i in range(len(feature_columns))]].sum()
+        first = grouped[[f"p{i}" for i in range(len(feature_columns))]].min()
+        names = scores.index.to_numpy()
+
+        ranked = {}
+        for i, feature in enumerate(feature_columns):
+            seen = np.isfinite(first.iloc[:, i].to_numpy())
+            order = np.lexsort((first.iloc[:, i].to_numpy(), -scores.iloc[:, i].to_numpy()))
+            ranked[feature] = [names[k] for k in order if seen[k]]
+        return ranked
+
+    def _compute_feature_stats(self, feature_columns: List[str]) -> pd.DataFrame:
+        """Locations, review sum and rating mean per feature via matrix products"""
+        df = self.analytics_df
+        matrix = df[feature_columns].to_numpy(dtype=bool)
+        counts = matrix.sum(axis=0)
+
+        if "review_count" in df.columns:
+            total_reviews = df["review_count"].to_numpy(dtype=float) @ matrix
+        else:
+            total_reviews = np.zeros(len(feature_columns))
+
+        if "rating" in df.columns:
+            rating_sums = df["rating"].to_numpy(dtype=float) @ matrix
+            with np.errstate(invalid="ignore", divide="ignore"):
+                rating_mean = rating_sums / counts
+        else:
+            rating_mean = np.full(len(feature_columns), np.nan)
+
+        return pd.DataFrame(
+            {
+                "locations": counts,
+                "total_reviews": total_reviews,
+                "rating_mean": rating_mean,
+            },
+            index=feature_columns,
+        )
 
     def _build_dynamic_niches(self) -> List[Dict]:
         if self.analytics_df.empty:
             return []
 
-        feature_columns = [
-            col for col in self.analytics_df.columns if col.startswith("feature_")
-        ]
+        feature_columns = self._feature_columns(self.analytics_df)
+        self.feature_stats = self._compute_feature_stats(feature_columns)
+        tags_by_feature = self._rank_tags(self.analytics_df, feature_columns)
         niches: List[Dict] = []
 
-        for feature in feature_columns:
-            feature_mask = self._normalize_bool(self.analytics_df[feature])
-            feature_df = self.analytics_df[feature_mask]
-            if feature_df.empty:
+        for feature, stats in self.feature_stats.iterrows():
+            if not stats["locations"]:
                 continue
 
-            total_reviews = float(feature_df.get("review_count", pd.Series([])).sum())
-            tags = self._extract_tags(feature_df)
+            total_reviews = float(stats["total_reviews"])
+            tags = tags_by_feature.get(feature, [])
             display_name = self._feature_to_label(feature)
             niche_keywords = [display_name.lower()] + [t.lower() for t in tags[:3]]
 
@@ -229,11 +405,9 @@ class NicheValidator:
                     "seasonality": "live",
                     "monetization_potential": self._monetization_bucket(total_reviews),
                     "analytics": {
-                        "locations": len(feature_df),
+                        "locations": int(stats["locations"]),
                         "total_reviews": int(total_reviews),
-                        "avg_rating": round(
-                            feature_df.get("rating", pd.Series([])).mean(), 2
-                        ),
+                        "avg_rating": round(float(stats["rating_mean"]), 2),
                     },
                 }
             )
@@ -250,13 +424,11 @@ class NicheValidator:
         if not niche:
             return {"error": f'Niche "{niche_name}" not found'}
 
-        feature_df = self.analytics_df[
-            self._normalize_bool(self.analytics_df[niche["feature_column"]])
-        ]
+        stats = self.feature_stats.loc[niche["feature_column"]]
 
         print(f"📊 Analyzing niche: {niche['name']}")
 
-        researcher = KeywordResearch()
+        researcher = self.keyword_research
         base_city = niche["cities"][0]
         all_keywords: List[Dict] = []
 
@@ -277,7 +449,7 @@ class NicheValidator:
         opportunity_score = min(
             100,
             (total_volume / 1000)
-            + (float(feature_df.get("rating", pd.Series([])).mean()) * 5)
+            + (float(stats["rating_mean"]) * 5)
             + (low_competition_count * 2),
         )
 
@@ -305,6 +477,126 @@ class NicheValidator:
         return recommendations
 
 
+class NicheValidatorService:
+    """Shared, lazily built NicheValidator that follows its source files
+
+    ``get()`` returns the cached validator as long as the config file and
+    every data source keep their mtime and size. When a CSV changes only
+    that file is re-read; the other frames come from the cache. The
+    repository is queried again when it is written or the city changes. Niche
+    recommendations are cached along with the validator. Thread-safe, so
+    GUI worker threads can share one instance.
+    """
+
+    def __init__(
+        self,
+        config_path: str = "quick_config.json",
+        data_sources: Optional[List[Path]] = None,
+        repository: Optional[Path] = None,
+    ):
+        self.config_path = config_path
+        if repository is None and not data_sources:
+            repository = NicheValidator.REPOSITORY_PATH
+        self.repository = Path(repository) if repository is not None else None
+        self.data_sources = [
+            Path(p) for p in (data_sources or NicheValidator.DEFAULT_DATA_SOURCES)
+        ]
+        self.builds = 0
+        self._frames: Dict[Path, Tuple[Tuple[int, int], Optional[pd.DataFrame]]] = {}
+        self._repository_frame: Optional[Tuple[Tuple, Optional[pd.DataFrame]]] = None
+        self._config: Optional[Tuple[Tuple[int, int], Dict]] = None
+        self._validator: Optional[NicheValidator] = None
+        self._recommendations: Optional[List[Dict]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(path: Path) -> Tuple[int, int]:
+        """(mtime_ns, size), or (-1, -1) for a missing file"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return (-1, -1)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self) -> bool:
+        """Re-read changed inputs; True if the validator must be rebuilt"""
+        changed = self._validator is None
+
+        config_path = Path(self.config_path)
+        signature = self._signature(config_path)
+        if self._config is None or self._config[0] != signature:
+            self._config = (signature, NicheValidator._load_config(self.config_path))
+            changed = True
+
+        if self.repository is not None:
+            city = self._config[1].get("city")
+            signature = (self._signature(self.repository), city)
+            cached = self._repository_frame
+            if cached is None or cached[0] != signature:
+                self._repository_frame = (
+                    signature,
+                    NicheValidator._read_repository(self.repository, city),
+                )
+                changed = True
+
+        for path in self._sources():
+            signature = self._signature(path)
+            cached = self._frames.get(path)
+            if cached is None or cached[0] != signature:
+                self._frames[path] = (signature, NicheValidator._read_source(path))
+                changed = True
+        return changed
+
+    def _repository_data(self) -> Optional[pd.DataFrame]:
+        return self._repository_frame[1] if self._repository_frame else None
+
+    def _sources(self) -> List[Path]:
+        if self._repository_data() is None:
+            return self.data_sources
+        return [
+            p for p in self.data_sources if p not in NicheValidator.REPOSITORY_EXPORTS
+        ]
+
+    def get(self) -> NicheValidator:
+        """Current validator, rebuilt only if config or data changed"""
+        with self._lock:
+            if self._refresh():
+                frames = [
+                    self._frames[path][1]
+                    for path in self._sources()
+                    if self._frames[path][1] is not None
+                ]
+                if self._repository_data() is not None:
+                    frames.append(self._repository_data())
+                self._validator = NicheValidator(
+                    config_path=self.config_path,
+                    data_sources=list(self.data_sources),
+                    config=self._config[1],
+                    frames=frames,
+                    repository=self.repository,
+                )
+                self._recommendations = None
+                self.builds += 1
+            return self._validator
+
+    def get_niche_recommendations(self) -> List[Dict]:
+        """Recommendations of the current validator (cached until data changes)"""
+        validator = self.get()
+        with self._lock:
+            if self._recommendations is None or self._validator is not validator:
+                self._recommendations = validator.get_niche_recommendations()
+            return self._recommendations
+
+    def invalidate(self) -> None:
+        """Forget everything; the next get() reads all sources again"""
+        with self._lock:
+            self._frames.clear()
+            self._repository_frame = None
+            self._config = None
+            self._validator = None
+            self._recommendations = None
+
+
 def analyze_competition(keyword: str, city: str) -> Dict:
     """Analyze competition for a keyword in a specific city"""
 
@@ -462,6 +754,17 @@ def main():
     print(f"   5. Aktiviere AdSense und starte Monitoring")
 
 
+@dataclass
+class ReviewBucket:
+    """Running counts for one rating group (complaints, praise or neutral)"""
+
+    negative: bool = False
+    count: int = 0
+    phrases: Optional[SpaceSaving] = None
+    keywords: Counter = field(default_factory=Counter)
+    features: Counter = field(default_factory=Counter)
+
+
 class ReviewDemandAnalyzer:
     """
     Analyzes Google Places reviews to extract hidden user demands and content opportunities.
@@ -473,16 +776,162 @@ class ReviewDemandAnalyzer:
     - Content ideas based on review insights
     """
 
-    def __init__(self, api_key: str, delay: float = 1.0):
+    # Review analysis limits (phrases/keywords kept per rating group)
+    MAX_PHRASES = 50
+    MAX_KEYWORDS = 30
+
+    # Sentiment indicator keywords
+    NEGATIVE_INDICATORS = [
+        "kein",
+        "keine",
+        "fehlt",
+        "fehlen",
+        "vermisse",
+        "vermissen",
+        "schlecht",
+        "schade",
+        "leider",
+        "nicht",
+        "wenig",
+        "zu wenig",
+        "dreckig",
+        "schmutzig",
+        "kaputt",
+        "defekt",
+        "no",
+        "missing",
+        "lack",
+        "poor",
+        "bad",
+        "dirty",
+        "broken",
+    ]
+    POSITIVE_INDICATORS = [
+        "toll",
+        "super",
+        "schön",
+        "gut",
+        "perfekt",
+        "empfehlen",
+        "liebe",
+        "beste",
+        "viel",
+        "genug",
+        "sauber",
+        "gepflegt",
+        "great",
+        "good",
+        "nice",
+        "perfect",
+        "clean",
+        "well-maintained",
+        "excellent",
+        "beautiful",
+        "love",
+        "best",
+    ]
+
+    NEGATIVE_PATTERN = indicator_pattern(NEGATIVE_INDICATORS)
+    POSITIVE_PATTERN = indicator_pattern(POSITIVE_INDICATORS)
+
+    # Phrase counters track this many candidates per requested phrase, which
+    # keeps memory fixed no matter how many reviews are analyzed
+    PHRASE_SKETCH_FACTOR = 40
+
+    # Stop words to ignore (German + English)
+    STOP_WORDS = {
+        "der",
+        "die",
+        "das",
+        "und",
+        "oder",
+        "aber",
+        "ist",
+        "sind",
+        "war",
+        "waren",
+        "ein",
+        "eine",
+        "einen",
+        "einem",
+        "eines",
+        "mit",
+        "zu",
+        "auf",
+        "für",
+        "von",
+        "in",
+        "im",
+        "am",
+        "an",
+        "bei",
+        "nach",
+        "vor",
+        "über",
+        "unter",
+        "auch",
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "is",
+        "are",
+        "was",
+        "were",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "from",
+        "by",
+        "about",
+        "sehr",
+        "viel",
+        "mehr",
+        "wenig",
+        "gut",
+        "schlecht",
+        "nice",
+        "good",
+        "bad",
+    }
+
+    def __init__(
+        self,
+        api_key: str,
+        delay: float = 1.0,
+        cache: Optional[ResponseCache] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+        language: str = "de",
+        keyword_background: Optional[str] = None,
+    ):
         """
         Initialize the ReviewDemandAnalyzer.
 
         Args:
             api_key: Google Places API key
             delay: Delay between API calls (seconds)
+            cache: Optional persistent response cache for search/details calls
+            analysis_cache: Result cache for analyze_review_sentiment; pass a
+                shared instance to reuse results across analyzers (default:
+                a private in-memory cache)
+            language: Review language requested from the Details API
+            keyword_background: JSON file with keyword counts of earlier
+                runs, used as prior for keyword scoring and extended by
+                every analysis
         """
-        self.scraper = GooglePlacesScraper(api_key=api_key, delay=delay)
+        self.scraper = GooglePlacesScraper(api_key=api_key, delay=delay, cache=cache)
         self.api_key = api_key
+        self.language = language
+        self.analysis_cache = (
+            analysis_cache if analysis_cache is not None else AnalysisCache()
+        )
+        self.keyword_scorer = KeywordScorer(background_path=keyword_background)
 
         # Feature keywords for unmet needs detection (German + English)
         self.feature_keywords = {
@@ -515,6 +964,8 @@ class ReviewDemandAnalyzer:
             "wifi": ["wifi", "wlan", "internet"],
             "outlets": ["steckdose", "steckdosen", "outlet", "outlets", "power"],
         }
+        self._matcher: Optional[FeatureMatcher] = None
+        self._matcher_source = None
 
     def get_reviews_for_category(
         self, category: str, city: str, max_places: int = 30
@@ -537,6 +988,37 @@ class ReviewDemandAnalyzer:
                 "author": str (optional)
             }
         """
+        return list(self.iter_reviews_for_category(category, city, max_places))
+
+    def iter_reviews_for_category(
+        self,
+        category: str,
+        city: str,
+        max_places: int = 30,
+        cancel_token=None,
+        progress: Optional[Callable[..., None]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream reviews for a category and city while they are being fetched.
+
+        Review details are requested concurrently (at most
+        ``scraper.max_concurrency`` places in flight, paced by
+        ``scraper.rate_limiter``). Reviews are yielded as soon as their place
+        completes, so the caller can analyze them while later places are
+        still loading. Closing the generator early cancels pending requests.
+
+        Args:
+            category: Category to search (e.g., "parks", "cafes")
+            city: City name
+            max_places: Maximum number of places to analyze
+            cancel_token: task_runner.CancelToken; cancelling raises
+                TaskCancelled within ~0.2 s and drops pending requests
+            progress: Called as ``progress(done_places, total_places)``
+
+        Yields:
+            Review dictionaries (see get_reviews_for_category), in completion
+            order rather than place order
+        """
         print(f"🔍 Fetching reviews for '{category}' in {city}...")
 
         # Search for places
@@ -544,35 +1026,60 @@ class ReviewDemandAnalyzer:
 
         if not places:
             print(f"❌ No places found for '{category}' in {city}")
-            return []
+            return
 
         print(f"📍 Found {len(places)} places, enriching with reviews...")
 
         # Limit to max_places to avoid excessive API calls
         places_to_analyze = places[:max_places]
+        pending = iter(place for place in places_to_analyze if place.place_id)
+        in_flight = {}
+        processed = 0
+        collected = 0
 
-        all_reviews = []
-
-        for i, place in enumerate(places_to_analyze):
-            print(f"   Processing {i+1}/{len(places_to_analyze)}: {place.name}")
-
-            if not place.place_id:
-                continue
+        executor = ThreadPoolExecutor(max_workers=self.scraper.max_concurrency)
 
-            # Get detailed reviews for this place
-            reviews = self._get_place_reviews(place.place_id)
+        def submit_next() -> None:
+            place = next(pending, None)
+            if place is not None:
+                future = executor.submit(self._get_place_reviews, place.place_id)
+                in_flight[future] = place
 
-            for review in reviews:
-                review["place_name"] = place.name
-                review["place_id"] = place.place_id
-                all_reviews.append(review)
-
-            time.sleep(self.scraper.delay)
+        try:
+            for _ in range(self.scraper.max_concurrency):
+                submit_next()
+
+            while in_flight:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                done, _ = wait(
+                    in_flight,
+                    timeout=None if cancel_token is None else 0.2,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    place = in_flight.pop(future)
+                    processed += 1
+                    print(f"   Processed {processed}/{len(places_to_analyze)}: {place.name}")
+                    if progress is not None:
+                        progress(processed, len(places_to_analyze))
+                    # Keep the pool busy while the caller consumes this batch
+                    submit_next()
+
+                    for review in future.result():
+                        review["place_name"] = place.name
+                        review["place_id"] = place.place_id
+                        collected += 1
+                        yield review
+        finally:
+            # Drop queued fetches (shutdown's cancel_futures needs Python 3.9)
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
 
         print(
-            f"✅ Collected {len(all_reviews)} reviews from {len(places_to_analyze)} places"
+            f"✅ Collected {collected} reviews from {len(places_to_analyze)} places"
         )
-        return all_reviews
 
     def _get_place_reviews(self, place_id: str) -> List[Dict]:
         """
@@ -589,7 +1096,7 @@ class ReviewDemandAnalyzer:
             "place_id": place_id,
             "key": self.api_key,
             "fields": "reviews",
-            "language": "de",  # Prefer German reviews
+            "language": self.language,  # German reviews by default
         }
 
         try:
@@ -637,7 +1144,13 @@ class ReviewDemandAnalyzer:
             return []
 
     def analyze_review_sentiment(
-        self, category: str, city: str, min_reviews: int = 100, max_places: int = 30
+        self,
+        category: str,
+        city: str,
+        min_reviews: int = 100,
+        max_places: int = 30,
+        cancel_token=None,
+        progress: Optional[Callable[..., None]] = None,
     ) -> Dict:
         """
         Analyze reviews to identify complaints, praise, and unmet needs.
@@ -647,6 +1160,8 @@ class ReviewDemandAnalyzer:
             city: City name
             min_reviews: Minimum number of reviews needed for analysis
             max_places: Maximum places to analyze
+            cancel_token: Optional CancelToken (see iter_reviews_for_category)
+            progress: Optional per-place progress callback
 
         Returns:
             Dictionary with analysis results:
@@ -657,20 +1172,76 @@ class ReviewDemandAnalyzer:
                 "top_complaints": [(phrase, count), ...],
                 "top_praise": [(phrase, count), ...],
                 "unmet_needs": [(feature, count), ...],
+                "complaint_feature_mentions": [(feature, count), ...],
                 "complaint_keywords": [(keyword, count), ...],
                 "praise_keywords": [(keyword, count), ...]
             }
-        """
-        # Fetch all reviews
-        all_reviews = self.get_reviews_for_category(category, city, max_places)
 
-        if len(all_reviews) < min_reviews:
+            Results with reviews are memoized in ``analysis_cache`` per
+            (category, city, max_places, language), so follow-up calls (e.g.
+            from generate_content_ideas) make no API requests.
+        """
+        key = self.analysis_cache.make_key(category, city, max_places, self.language)
+        cached = self.analysis_cache.get(key)
+        if cached is not None:
+            print(f"♻️  Using cached analysis for '{category}' in {city}")
+            return cached
+
+        analysis = self._analyze_reviews(
+            category, city, min_reviews, max_places, cancel_token, progress
+        )
+        # Empty results usually mean an API problem, so they are not kept
+        if analysis["total_reviews_analyzed"]:
+            self.analysis_cache.set(key, analysis)
+        return analysis
+
+    def invalidate_analysis(
+        self, category: Optional[str] = None, city: Optional[str] = None
+    ) -> int:
+        """Forget memoized analyses (all, or only those of a category/city)"""
+        return self.analysis_cache.invalidate(category=category, city=city)
+
+    def _analyze_reviews(
+        self,
+        category: str,
+        city: str,
+        min_reviews: int,
+        max_places: int,
+        cancel_token=None,
+        progress: Optional[Callable[..., None]] = None,
+    ) -> Dict:
+        """Fetch and analyze reviews (uncached, see analyze_review_sentiment)"""
+        complaints = ReviewBucket(negative=True)
+        praise = ReviewBucket(negative=False)
+        neutral = ReviewBucket()
+        total_reviews = 0
+        avg_rating = 0.0
+        matcher = self._feature_matcher()
+
+        # Each review goes straight into its bucket while later places load
+        reviews = self.iter_reviews_for_category(
+            category, city, max_places, cancel_token=cancel_token, progress=progress
+        )
+        for review in reviews:
+            rating = review["rating"]
+            total_reviews += 1
+            avg_rating += (rating - avg_rating) / total_reviews
+
+            if rating <= 2:
+                self._accumulate_review(complaints, review.get("text"))
+                matcher.count(review.get("text"), complaints.features)
+            elif rating >= 4:
+                self._accumulate_review(praise, review.get("text"))
+            else:
+                neutral.count += 1
+
+        if total_reviews < min_reviews:
             print(
-                f"⚠️  Warning: Only {len(all_reviews)} reviews found (min: {min_reviews})"
+                f"⚠️  Warning: Only {total_reviews} reviews found (min: {min_reviews})"
             )
             print(f"   Analysis may be less accurate with limited data")
 
-        if not all_reviews:
+        if not total_reviews:
             return {
                 "total_reviews_analyzed": 0,
                 "avg_rating": 0.0,
@@ -678,65 +1249,62 @@ class ReviewDemandAnalyzer:
                 "top_complaints": [],
                 "top_praise": [],
                 "unmet_needs": [],
+                "complaint_feature_mentions": [],
                 "complaint_keywords": [],
                 "praise_keywords": [],
             }
 
-        if len(all_reviews) < min_reviews:
-            print(f"⚠️  Warning: Only {len(all_reviews)} reviews found (min: {min_reviews})")
-            print(f"   Analysis may be less accurate with limited data")
-
-        # Categorize reviews by rating
-        complaints = [r for r in all_reviews if r["rating"] <= 2]
-        praise = [r for r in all_reviews if r["rating"] >= 4]
-        neutral = [r for r in all_reviews if 2 < r["rating"] < 4]
-
         print(f"\n📊 Review Distribution:")
-        total_reviews = len(all_reviews)
-        praise_pct = (len(praise) * 100 // total_reviews) if total_reviews > 0 else 0
-        neutral_pct = (len(neutral) * 100 // total_reviews) if total_reviews > 0 else 0
-        complaints_pct = (
-            (len(complaints) * 100 // total_reviews) if total_reviews > 0 else 0
-        )
-        print(f"   ⭐⭐⭐⭐⭐ / ⭐⭐⭐⭐ (Praise): {len(praise)} ({praise_pct}%)")
-        print(f"   ⭐⭐⭐ (Neutral): {len(neutral)} ({neutral_pct}%)")
-        print(f"   ⭐⭐ / ⭐ (Complaints): {len(complaints)} ({complaints_pct}%)")
-
-        # Extract phrases from complaints and praise
-        print(f"\n🔍 Extracting patterns from reviews...")
-        top_complaints = self._extract_top_phrases(
-            [r["text"] for r in complaints], negative=True
-        )
-        top_praise = self._extract_top_phrases(
-            [r["text"] for r in praise], negative=False
-        )
-
-        # Extract keywords
-        complaint_keywords = self._extract_keywords(
-            [r["text"] for r in complaints], negative=True
+        praise_pct = praise.count * 100 // total_reviews
+        neutral_pct = neutral.count * 100 // total_reviews
+        complaints_pct = complaints.count * 100 // total_reviews
+        print(f"   ⭐⭐⭐⭐⭐ / ⭐⭐⭐⭐ (Praise): {praise.count} ({praise_pct}%)")
+        print(f"   ⭐⭐⭐ (Neutral): {neutral.count} ({neutral_pct}%)")
+        print(f"   ⭐⭐ / ⭐ (Complaints): {complaints.count} ({complaints_pct}%)")
+
+        top_complaints = self._top_phrases(complaints.phrases, self.MAX_PHRASES)
+        top_praise = self._top_phrases(praise.phrases, self.MAX_PHRASES)
+        # Keywords that set complaints and praise apart (log-odds, not raw counts)
+        complaint_keywords, praise_keywords = self.keyword_scorer.distinctive(
+            complaints.keywords, praise.keywords, top_n=self.MAX_KEYWORDS
         )
-        praise_keywords = self._extract_keywords(
-            [r["text"] for r in praise], negative=False
+        self.keyword_scorer.update_background(
+            f"{category.casefold()}|{city.casefold()}",
+            complaints.keywords,
+            praise.keywords,
+            documents=complaints.count + praise.count,
         )
 
         # Find unmet needs
         unmet_needs = self._find_unmet_needs(top_complaints)
 
         # Calculate sentiment
-        avg_rating = sum(r["rating"] for r in all_reviews) / len(all_reviews)
         sentiment_score = avg_rating / 5.0
 
         return {
-            "total_reviews_analyzed": len(all_reviews),
+            "total_reviews_analyzed": total_reviews,
             "avg_rating": round(avg_rating, 2),
             "sentiment_score": round(sentiment_score, 2),
             "top_complaints": top_complaints[:15],
             "top_praise": top_praise[:15],
             "unmet_needs": unmet_needs[:10],
+            # Feature mentions across all complaint reviews, not just top phrases
+            "complaint_feature_mentions": matcher.ranked(complaints.features),
             "complaint_keywords": complaint_keywords[:20],
             "praise_keywords": praise_keywords[:20],
         }
 
+    def _accumulate_review(self, bucket: ReviewBucket, text: Optional[str]) -> None:
+        """Add one review text to the phrase and keyword counters of ``bucket``"""
+        bucket.count += 1
+        if not text:
+            return
+
+        if bucket.phrases is None:
+            bucket.phrases = SpaceSaving(self.MAX_PHRASES * self.PHRASE_SKETCH_FACTOR)
+        self._count_phrases(text, bucket.negative, bucket.phrases)
+        self._count_keywords(text, bucket.keywords)
+
     def _extract_top_phrases(
         self, texts: List[str], negative: bool = False, max_phrases: int = 50
     ) -> List[Tuple[str, int]]:
@@ -754,122 +1322,40 @@ class ReviewDemandAnalyzer:
         if not texts:
             return []
 
-        # Sentiment indicator keywords
-        if negative:
-            indicators = [
-                "kein",
-                "keine",
-                "fehlt",
-                "fehlen",
-                "vermisse",
-                "vermissen",
-                "schlecht",
-                "schade",
-                "leider",
-                "nicht",
-                "wenig",
-                "zu wenig",
-                "dreckig",
-                "schmutzig",
-                "kaputt",
-                "defekt",
-                "no",
-                "missing",
-                "lack",
-                "poor",
-                "bad",
-                "dirty",
-                "broken",
-            ]
-        else:
-            indicators = [
-                "toll",
-                "super",
-                "schön",
-                "gut",
-                "perfekt",
-                "empfehlen",
-                "liebe",
-                "beste",
-                "viel",
-                "genug",
-                "sauber",
-                "gepflegt",
-                "great",
-                "good",
-                "nice",
-                "perfect",
-                "clean",
-                "well-maintained",
-                "excellent",
-                "beautiful",
-                "love",
-                "best",
-            ]
-
-        phrases = []
-        # Add limit to prevent excessive phrase collection
-        max_phrases_to_collect = (
-            max_phrases * 100
-        )  # Collect up to 100x the final result size
-
+        phrase_counts = SpaceSaving(max_phrases * self.PHRASE_SKETCH_FACTOR)
         for text in texts:
-            if not text:
-                continue
-
-            # Early termination if we've collected enough phrases
-            if len(phrases) >= max_phrases_to_collect:
-                break
-
-            text_lower = text.lower()
-
-            # Split into sentences
-            sentences = re.split(r"[.!?]+", text_lower)
-
-            for sentence in sentences:
-                # Early termination check
-                if len(phrases) >= max_phrases_to_collect:
-                    break
-
-                # Check if sentence contains indicator words
-                has_indicator = any(ind in sentence for ind in indicators)
+            if text:
+                self._count_phrases(text, negative, phrase_counts)
 
-                if not has_indicator:
-                    continue
+        return self._top_phrases(phrase_counts, max_phrases)
 
-                # Clean and tokenize
-                sentence = re.sub(r"[^\w\s]", " ", sentence)
-                words = sentence.split()
-
-                # Extract 2-4 word phrases
-                for n in [2, 3, 4]:
-                    for i in range(len(words) - n + 1):
-                        phrase = " ".join(words[i : i + n])
+    @staticmethod
+    def _top_phrases(
+        counts: Optional[SpaceSaving], max_phrases: int
+    ) -> List[Tuple[str, int]]:
+        """Most common n-gram tuples of ``counts`` as (phrase, count)"""
+        if counts is None:
+            return []
+        return [(" ".join(gram), count) for gram, count in counts.most_common(max_phrases)]
 
-                        # Filter out phrases that are too generic
-                        if len(phrase) >= 8 and not self._is_too_generic(phrase):
-                            phrases.append(phrase)
-                            
-                            # Early termination within inner loop
-                            if len(phrases) >= max_total_phrases:
-                                break
-                    
-                    if len(phrases) >= max_total_phrases:
-                        break
-                
-                if len(phrases) >= max_total_phrases:
-                    break
+    def _count_phrases(self, text: str, negative: bool, counts) -> None:
+        """
+        Count the 2-4 word phrases of one text into ``counts``.
 
-                        # Early termination within phrase extraction
-                        if len(phrases) >= max_phrases_to_collect:
-                            break
+        Only sentences containing a sentiment indicator are used. Each
+        sentence is tokenized once and phrases are counted as word tuples.
 
-                    if len(phrases) >= max_phrases_to_collect:
-                        break
+        Args:
+            text: Review text
+            negative: Use negative instead of positive indicators
+            counts: SpaceSaving sketch (or Counter) to update
+        """
+        indicators = self.NEGATIVE_PATTERN if negative else self.POSITIVE_PATTERN
 
-        # Count and sort
-        phrase_counts = Counter(phrases)
-        return phrase_counts.most_common(max_phrases)
+        for sentence in SENTENCE_SPLIT.split(text.lower()):
+            # Check if sentence contains indicator words
+            if indicators.search(sentence):
+                counts.update(sentence_ngrams(WORD_PATTERN.findall(sentence)))
 
     def _extract_keywords(
         self, texts: List[str], negative: bool = False, max_keywords: int = 30
@@ -888,116 +1374,35 @@ class ReviewDemandAnalyzer:
         if not texts:
             return []
 
-        # Stop words to ignore (German + English)
-        stop_words = {
-            "der",
-            "die",
-            "das",
-            "und",
-            "oder",
-            "aber",
-            "ist",
-            "sind",
-            "war",
-            "waren",
-            "ein",
-            "eine",
-            "einen",
-            "einem",
-            "eines",
-            "mit",
-            "zu",
-            "auf",
-            "für",
-            "von",
-            "in",
-            "im",
-            "am",
-            "an",
-            "bei",
-            "nach",
-            "vor",
-            "über",
-            "unter",
-            "auch",
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "is",
-            "are",
-            "was",
-            "were",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "from",
-            "by",
-            "about",
-            "sehr",
-            "viel",
-            "mehr",
-            "wenig",
-            "gut",
-            "schlecht",
-            "nice",
-            "good",
-            "bad",
-        }
-
-        all_words = []
-
+        word_counts = Counter()
         for text in texts:
-            if not text:
-                continue
-
-            # Clean and tokenize
-            text_clean = re.sub(r"[^\w\s]", " ", text.lower())
-            words = text_clean.split()
-
-            # Filter meaningful words
-            for word in words:
-                if (
-                    len(word) >= 4  # At least 4 characters
-                    and word not in stop_words
-                    and not word.isdigit()
-                ):  # Not a number
-                    all_words.append(word)
+            if text:
+                self._count_keywords(text, word_counts)
 
         # Count and return
-        word_counts = Counter(all_words)
         return word_counts.most_common(max_keywords)
 
+    def _count_keywords(self, text: str, counts: Counter) -> None:
+        """Count the meaningful single words of one text into ``counts``"""
+        # Clean and tokenize
+        text_clean = re.sub(r"[^\w\s]", " ", text.lower())
+
+        # Filter meaningful words
+        for word in text_clean.split():
+            if (
+                len(word) >= 4  # At least 4 characters
+                and word not in self.STOP_WORDS
+                and not word.isdigit()
+            ):  # Not a number
+                counts[word] += 1
+
     def _is_too_generic(self, phrase: str) -> bool:
         """Check if a phrase is too generic to be useful."""
-        # Handle None or empty input
-        if not phrase:
+        # Handle None, empty or whitespace-only input
+        if not phrase or not phrase.strip():
             return True
 
-        generic_patterns = [
-            r"^sehr\s+",
-            r"^gut\s+",
-            r"^schlecht\s+",
-            r"^very\s+",
-            r"^good\s+",
-            r"^bad\s+",
-            r"^das\s+ist",
-            r"^die\s+sind",
-            r"^this\s+is",
-            r"^it\s+is",
-        ]
-
-        for pattern in generic_patterns:
-            if re.match(pattern, phrase):
-                return True
-
-        return False
+        return GENERIC_PHRASE_PATTERN.match(phrase) is not None
 
     def _find_unmet_needs(
         self, complaints: List[Tuple[str, int]]
@@ -1011,26 +1416,32 @@ class ReviewDemandAnalyzer:
         Returns:
             List of (feature_name, mention_count) tuples
         """
-        feature_mentions = {feature: 0 for feature in self.feature_keywords.keys()}
-
         # Combine all complaint phrases into one text for analysis
         all_complaint_text = " ".join([phrase for phrase, count in complaints])
 
-        # Check for feature keywords
-        for feature, keywords in self.feature_keywords.items():
-            for keyword in keywords:
-                # Count occurrences in complaints
-                pattern = r"\b" + re.escape(keyword) + r"\w*"
-                matches = re.findall(pattern, all_complaint_text, re.IGNORECASE)
-                feature_mentions[feature] += len(matches)
-
-        # Filter out features with no mentions and sort by count
-        unmet_needs = [
-            (feature, count) for feature, count in feature_mentions.items() if count > 0
-        ]
-        unmet_needs.sort(key=lambda x: x[1], reverse=True)
+        matcher = self._feature_matcher()
+        return matcher.ranked(matcher.count(all_complaint_text))
+
+    def count_feature_mentions(self, texts: List[str]) -> List[Tuple[str, int]]:
+        """
+        Count feature keyword mentions directly in review texts.
 
-        return unmet_needs
+        Args:
+            texts: Review texts (e.g. all complaint reviews)
+
+        Returns:
+            List of (feature_name, mention_count) tuples, most mentioned first
+        """
+        matcher = self._feature_matcher()
+        return matcher.ranked(matcher.count_many(texts))
+
+    def _feature_matcher(self) -> FeatureMatcher:
+        """FeatureMatcher for feature_keywords, recompiled when the table changes"""
+        source = {f: tuple(k) for f, k in self.feature_keywords.items()}
+        if self._matcher is None or source != self._matcher_source:
+            self._matcher = FeatureMatcher(self.feature_keywords)
+            self._matcher_source = source
+        return self._matcher
 
     def generate_content_ideas(
         self, category: str, city: str, max_places: int = 30
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Precompiled pillar page template
+Zerlegt das Template einmal in statische Segmente und benannte Slots
+"""
+
+import os
+import re
+import threading
+from typing import Dict, List, Tuple
+
+from build_manifest import content_hash
+
+# Literal placeholders and the slot they fill (every occurrence)
+PLACEHOLDER_SLOTS = {
+    "{{CITY}}": "city",
+    "{{CATEGORY}}": "category",
+    "{{CANONICAL_URL}}": "canonical_url",
+    "const DATA = [": "data",
+    "ca-pub-XXXXXXXXXXXXXXXX": "adsense",
+    "</head>": "head_end",
+}
+
+# The first JSON-LD block is replaced as a whole (slot "schema")
+SCHEMA_PATTERN = re.compile(
+    r'<script type="application/ld\+json">\s*\{[^<]*\}\s*</script>', re.DOTALL
+)
+
+_PLACEHOLDER_PATTERN = re.compile("|".join(re.escape(p) for p in PLACEHOLDER_SLOTS))
+
+
+class CompiledTemplate:
+    """Template split into static text and named slots
+
+    ``render(values)`` fills every slot in one join; slots missing from
+    ``values`` keep the original template text.
+    """
+
+    def __init__(self, text: str):
+        self.hash = content_hash(text)
+        # Each part is (is_slot, text_or_slot_name); defaults keep template text
+        self.parts: List[Tuple[bool, str]] = []
+        self.defaults: Dict[str, str] = {}
+        self.slots = set()
+
+        schema = SCHEMA_PATTERN.search(text)
+        if schema:
+            self._split(text[: schema.start()])
+            self._add_slot("schema", schema.group(0))
+            self._split(text[schema.end() :])
+        else:
+            self._split(text)
+
+    def _add_slot(self, name: str, original: str) -> None:
+        self.parts.append((True, name))
+        self.defaults.setdefault(name, original)
+        self.slots.add(name)
+
+    def _split(self, text: str) -> None:
+        position = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(text):
+            if match.start() > position:
+                self.parts.append((False, text[position : match.start()]))
+            self._add_slot(PLACEHOLDER_SLOTS[match.group(0)], match.group(0))
+            position = match.end()
+        if position < len(text):
+            self.parts.append((False, text[position:]))
+
+    def render(self, values: Dict[str, str]) -> str:
+        defaults = self.defaults
+        return "".join(
+            (values.get(part, defaults[part]) if is_slot else part)
+            for is_slot, part in self.parts
+        )
+
+
+_CACHE: Dict[str, Tuple[Tuple[int, int], CompiledTemplate]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_template(path: str) -> CompiledTemplate:
+    """Compiled template for ``path``, recompiled when mtime or size change"""
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        compiled = CompiledTemplate(f.read())
+
+    with _CACHE_LOCK:
+        _CACHE[key] = (version, compiled)
+    return compiled
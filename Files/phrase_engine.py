@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+N-gram phrase counting and feature mention matching for review analysis
+Zählt 2–4-Wort-Phrasen als Tupel (ohne Zwischen-Strings) mit fester Speichergrenze
+"""
+
+import re
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+SENTENCE_SPLIT = re.compile(r"[.!?]+")
+WORD_PATTERN = re.compile(r"\w+")
+
+# Phrases starting like this say nothing about a place ("sehr schön", "das ist ...")
+GENERIC_FIRST_WORDS = frozenset({"sehr", "gut", "schlecht", "very", "good", "bad"})
+GENERIC_PAIRS = {"das": "ist", "die": "sind", "this": "is", "it": "is"}
+GENERIC_PHRASE_PATTERN = re.compile(
+    r"(?:"
+    + "|".join(re.escape(w) for w in sorted(GENERIC_FIRST_WORDS))
+    + r")\s+|"
+    + "|".join(rf"{re.escape(a)}\s+{re.escape(b)}" for a, b in GENERIC_PAIRS.items())
+)
+
+
+def indicator_pattern(indicators: Iterable[str]) -> "re.Pattern":
+    """One regex that finds any indicator as a substring of a sentence"""
+    return re.compile(
+        "|".join(re.escape(i) for i in sorted(indicators, key=len, reverse=True))
+    )
+
+
+def is_generic_ngram(words: Tuple[str, ...]) -> bool:
+    """Tuple equivalent of matching GENERIC_PHRASE_PATTERN on the joined phrase"""
+    first = words[0]
+    if first in GENERIC_FIRST_WORDS:
+        return True
+    second = GENERIC_PAIRS.get(first)
+    return second is not None and words[1].startswith(second)
+
+
+def sentence_ngrams(
+    words: List[str], min_n: int = 2, max_n: int = 4, min_chars: int = 8
+) -> Iterable[Tuple[str, ...]]:
+    """Non-generic n-grams of one tokenized sentence, shortest n first
+
+    ``min_chars`` applies to the phrase joined with single spaces; it is
+    computed from word lengths, so no strings are built.
+    """
+    ends = [0, *accumulate(len(w) for w in words)]
+    count = len(words)
+    for n in range(min_n, max_n + 1):
+        for i in range(count - n + 1):
+            if ends[i + n] - ends[i] + n - 1 < min_chars:
+                continue
+            gram = tuple(words[i : i + n])
+            if not is_generic_ngram(gram):
+                yield gram
+
+
+class SpaceSaving:
+    """Bounded top-k counter (Space-Saving / stream-summary)
+
+    Tracks at most ``capacity`` keys. When a new key arrives while full, the
+    key with the lowest count is replaced and the newcomer inherits that
+    count + 1, so counts are upper bounds with error ``error(key)``. Every
+    key whose true frequency exceeds ``total / capacity`` is guaranteed to
+    be tracked. Until ``capacity`` distinct keys are seen the counter is a
+    plain dict (exact counts, ``most_common`` ties ordered like
+    ``collections.Counter``); the stream-summary buckets are only built on
+    the first eviction.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # count -> keys with that count (dict keeps insertion order); None
+        # while counts are still exact
+        self._buckets: Optional[Dict[int, Dict[Hashable, None]]] = None
+        self._min = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key) -> bool:
+        return key in self._counts
+
+    def __getitem__(self, key) -> int:
+        return self._counts.get(key, 0)
+
+    def _build_buckets(self) -> None:
+        self._buckets = {}
+        for key, count in self._counts.items():
+            self._buckets.setdefault(count, {})[key] = None
+        self._min = min(self._buckets)
+
+    def _increment(self, key, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if count == self._min:
+                self._min = count + 1
+        self._buckets.setdefault(count + 1, {})[key] = None
+        self._counts[key] = count + 1
+
+    def _replace_min(self, key) -> None:
+        """Evict one of the least frequent keys in favour of ``key``"""
+        floor = self._min
+        bucket = self._buckets[floor]
+        victim = next(iter(bucket))
+        del bucket[victim]
+        del self._counts[victim]
+        self._errors.pop(victim, None)
+        if not bucket:
+            del self._buckets[floor]
+            self._min = floor + 1
+        self._errors[key] = floor
+        self._counts[key] = floor + 1
+        self._buckets.setdefault(floor + 1, {})[key] = None
+
+    def add(self, key) -> None:
+        self.update((key,))
+
+    def update(self, keys: Iterable) -> None:
+        counts = self._counts
+        for key in keys:
+            self.total += 1
+            count = counts.get(key)
+            if self._buckets is None:
+                if count is not None:
+                    counts[key] = count + 1
+                    continue
+                if len(counts) < self.capacity:
+                    counts[key] = 1
+                    continue
+                self._build_buckets()
+
+            if count is not None:
+                self._increment(key, count)
+            else:
+                self._replace_min(key)
+
+    def error(self, key) -> int:
+        """Maximum overestimation of ``key``'s count"""
+        return self._errors.get(key, 0)
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+
+class FeatureMatcher:
+    """Counts feature mentions for a {feature: [keywords]} table in one pass
+
+    All keywords are compiled into one case-insensitive alternation with a
+    named group per feature (longest keyword first). A mention is a keyword
+    at a word start followed by any word characters, so "Toiletten" counts
+    once for "toilets" even though both "toilette" and "toiletten" are
+    listed.
+    """
+
+    def __init__(self, feature_keywords: Mapping[str, Iterable[str]]):
+        self.features = list(feature_keywords)
+        groups = []
+        self._group_features = {}
+        for index, (feature, keywords) in enumerate(feature_keywords.items()):
+            keywords = sorted(set(keywords), key=len, reverse=True)
+            if not keywords:
+                continue
+            group = f"f{index}"
+            self._group_features[group] = feature
+            groups.append(f"(?P<{group}>{'|'.join(re.escape(k) for k in keywords)})")
+        self.pattern = (
+            re.compile(r"\b(?:" + "|".join(groups) + r")\w*", re.IGNORECASE)
+            if groups
+            else None
+        )
+
+    def count(self, text: Optional[str], counts: Optional[Counter] = None) -> Counter:
+        """Add the feature mentions of ``text`` to ``counts`` (a new Counter by default)"""
+        counts = Counter() if counts is None else counts
+        if text and self.pattern is not None:
+            group_features = self._group_features
+            counts.update(
+                group_features[match.lastgroup] for match in self.pattern.finditer(text)
+            )
+        return counts
+
+    def count_many(self, texts: Iterable[Optional[str]]) -> Counter:
+        counts = Counter()
+        for text in texts:
+            self.count(text, counts)
+        return counts
+
+    def ranked(self, counts: Mapping[str, int]) -> List[Tuple[str, int]]:
+        """(feature, count) for mentioned features, most mentioned first
+
+        Ties keep the order of the keyword table.
+        """
+        mentioned = [(f, counts[f]) for f in self.features if counts.get(f, 0) > 0]
+        mentioned.sort(key=lambda item: item[1], reverse=True)
+        return mentioned
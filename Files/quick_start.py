@@ -211,7 +211,8 @@ def generate_quick_page(config, data_file=None):
     # Verwende echte PillarPageGenerator
     try:
         sys.path.insert(0, os.path.dirname(__file__))
-        from data_pipeline import PillarPageGenerator, LocationData
+        from data_pipeline import PillarPageGenerator
+        from location_loader import load_location_data
         import pandas as pd
 
         # Lade echte Daten
@@ -228,27 +229,8 @@ def generate_quick_page(config, data_file=None):
             print("   Bitte ersetzen Sie die Template-Einträge mit echten Daten.")
             return None
 
-        # Konvertiere zu LocationData
-        locations = []
-        for _, row in df.iterrows():
-            loc = LocationData(
-                id=row.get('id', str(row.name)),
-                name=row['name'],
-                street=row.get('address', row.get('street', '')),
-                city=row['city'],
-                region=row.get('region', ''),
-                country=row.get('country', 'Deutschland'),
-                postcode=row.get('postcode', ''),
-                latitude=float(row['latitude']),
-                longitude=float(row['longitude']),
-                url=row.get('website', row.get('url', '')),
-                phone=row.get('phone', ''),
-                email=row.get('email', ''),
-                opening_hours=row.get('opening_hours', ''),
-                rating=float(row.get('rating', 0.0)),
-                review_count=int(row.get('review_count', 0)),
-            )
-            locations.append(loc)
+        # Konvertiere zu LocationData (spaltenweise, inkl. address/website Aliase)
+        locations = load_location_data(df)
 
         # Generiere mit echtem Generator
         template_path = os.path.join(os.path.dirname(__file__), 'pillar_page_skeleton.html')
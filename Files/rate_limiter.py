@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Process-wide HTTP rate limiting, retries and circuit breaking
+Ein Kontingent pro Host für alle Sessions: Token-Bucket, Backoff, Circuit Breaker
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Request ceilings (requests/second) of APIs with a known quota; the Places
+# API allows 600 QPM per project by default
+HOST_QUOTAS = {"maps.googleapis.com": 10.0}
+# Hosts nobody configured get one request per second
+DEFAULT_RATE = 1.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {"OVER_QUERY_LIMIT", "RESOURCE_EXHAUSTED"}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+OK = "ok"
+THROTTLED = "throttled"
+FAILED = "failed"
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace API requests.
+
+    ``rate`` tokens are added per second up to ``capacity``; every request
+    takes one token. A ``rate`` of ``None`` disables limiting entirely.
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float = 1.0):
+        self.rate = rate if rate and rate > 0 else None
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller has to wait for it"""
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """Change the refill rate; tokens earned so far are kept"""
+        with self._lock:
+            if self.rate is not None:
+                self._refill(time.monotonic())
+            else:
+                self._updated = time.monotonic()
+            self.rate = rate if rate and rate > 0 else None
+
+    def drain(self) -> None:
+        """Drop the saved-up burst, e.g. after the server pushed back"""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+
+    def acquire(self) -> None:
+        """Block until a token is available"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket whose rate follows the server's feedback (AIMD)
+
+    Every clean response raises the rate by ``max_rate / 50`` up to
+    ``max_rate``; a throttled or failed response halves it (not below
+    ``min_rate``) and drops the burst, so a 429 slows all threads at once.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        capacity: float = 1.0,
+        max_rate: Optional[float] = None,
+        min_rate: Optional[float] = None,
+    ):
+        super().__init__(rate, capacity)
+        if self.rate is None:
+            self.max_rate = self.min_rate = None
+        else:
+            self.max_rate = max(self.rate, max_rate or self.rate)
+            self.min_rate = min(self.rate, min_rate or self.rate / 16)
+
+    def increase(self) -> None:
+        if self.rate is not None and self.rate < self.max_rate:
+            self.set_rate(min(self.max_rate, self.rate + self.max_rate / 50))
+
+    def decrease(self) -> None:
+        if self.rate is not None:
+            self.set_rate(max(self.min_rate, self.rate / 2))
+            self.drain()
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while a host's circuit is open"""
+
+
+class CircuitBreaker:
+    """Stops calling a host after ``threshold`` consecutive failures
+
+    While open, requests fail fast with CircuitOpenError; after
+    ``reset_timeout`` seconds one trial request is let through (half-open)
+    and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+
+@dataclass
+class HostState:
+    bucket: AdaptiveTokenBucket
+    breaker: CircuitBreaker
+    stats: Dict[str, int] = field(
+        default_factory=lambda: {
+            "requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "failed": 0,
+        }
+    )
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def backoff_delay(
+    attempt: int, base: float = 0.5, cap: float = 30.0, rng: random.Random = random
+) -> float:
+    """Exponential backoff with full jitter: uniform(0, min(cap, base * 2**attempt))"""
+    return rng.uniform(0, min(cap, base * 2**attempt))
+
+
+def classify_response(response: requests.Response, peek: bool = True) -> str:
+    """OK, THROTTLED (429 / OVER_QUERY_LIMIT) or FAILED (502/503/504 etc.)
+
+    Google APIs report quota errors as HTTP 200 with a JSON ``status``; with
+    ``peek`` small JSON bodies are checked for it.
+    """
+    if response.status_code == 429:
+        return THROTTLED
+    if response.status_code in RETRY_STATUSES:
+        return FAILED
+    if peek and "json" in response.headers.get("Content-Type", ""):
+        content = response.content
+        if any(status.encode() in content for status in THROTTLE_STATUSES):
+            try:
+                status = json.loads(content).get("status")
+            except (ValueError, AttributeError):
+                status = None
+            if status in THROTTLE_STATUSES:
+                return THROTTLED
+    return OK
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Per-host quotas, retries and circuit breakers shared by all sessions
+
+    Every session gets a RateLimitedAdapter (see ``install_rate_limiter``),
+    so all scrapers of the process draw from the same bucket per host. The
+    rate of a host starts at its configured value and adapts: it rises while
+    responses are clean (up to its quota) and halves on 429, 5xx and
+    OVER_QUERY_LIMIT, which are retried with exponential backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        default_rate: Optional[float] = DEFAULT_RATE,
+        quotas: Optional[Dict[str, float]] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        breaker_threshold: int = 5,
+        breaker_timeout: float = 30.0,
+    ):
+        self.default_rate = default_rate
+        self.quotas = dict(HOST_QUOTAS if quotas is None else quotas)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.breaker_threshold = breaker_threshold
+        self.breaker_timeout = breaker_timeout
+        self._hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def _new_state(
+        self,
+        host: str,
+        rate: Optional[float],
+        capacity: float,
+        max_rate: Optional[float],
+    ) -> HostState:
+        if max_rate is None and rate:
+            max_rate = max(rate, self.quotas.get(host, rate))
+        return HostState(
+            bucket=AdaptiveTokenBucket(rate, capacity=capacity, max_rate=max_rate),
+            breaker=CircuitBreaker(self.breaker_threshold, self.breaker_timeout),
+        )
+
+    def host(self, url_or_host: str) -> HostState:
+        """State of a host (created with the default rate on first use)"""
+        host = host_of(url_or_host) if "://" in url_or_host else url_or_host.lower()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._new_state(
+                    host, self.quotas.get(host, self.default_rate), 1.0, None
+                )
+                self._hosts[host] = state
+            return state
+
+    def configure(
+        self,
+        url_or_host: str,
+        rate: Optional[float],
+        capacity: float = 1.0,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        """Ask for at most ``rate`` requests/second to a host
+
+        The limiter is shared by the whole process, so a scraper can only
+        make a host stricter, never looser: an unseen host starts at
+        ``rate`` (``None``: the host's known quota, otherwise unpaced), a
+        configured host is tightened to ``min(current, rate)``. A rate the
+        host has learned from throttling is never raised here, and ``None``
+        leaves a configured host unchanged.
+
+        ``max_rate`` is the ceiling the rate may climb to; by default the
+        host's known quota or the starting rate.
+        """
+        host = host_of(url_or_host) if "://" in url_or_host else url_or_host.lower()
+        if rate is not None and rate <= 0:
+            rate = None
+        if rate is not None and host in self.quotas:
+            # Asking for more than the quota only buys OVER_QUERY_LIMIT
+            rate = min(rate, self.quotas[host])
+        with self._lock:
+            previous = self._hosts.get(host)
+            if previous is None:
+                if rate is None:
+                    rate = self.quotas.get(host)
+                self._hosts[host] = self._new_state(host, rate, capacity, max_rate)
+                return
+            if rate is None:
+                return
+            bucket = previous.bucket
+            if bucket.rate is None:
+                # Unpaced so far: nothing learned yet, start pacing
+                state = self._new_state(host, rate, capacity, max_rate)
+                previous.bucket = state.bucket
+            elif rate < bucket.rate:
+                bucket.set_rate(rate)
+                bucket.max_rate = min(bucket.max_rate, max_rate or bucket.max_rate)
+                bucket.min_rate = min(bucket.min_rate, rate)
+
+    def acquire(self, url: str) -> HostState:
+        """Wait for a token of the url's host; CircuitOpenError while open"""
+        state = self.host(url)
+        if not state.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {host_of(url)}, request skipped")
+        state.bucket.acquire()
+        state.stats["requests"] += 1
+        return state
+
+    def record(self, state: HostState, outcome: str) -> None:
+        """Feed a response outcome back into the host's rate and breaker"""
+        if outcome == OK:
+            state.bucket.increase()
+            state.breaker.success()
+            return
+        state.stats[outcome] += 1
+        state.bucket.decrease()
+        state.breaker.failure()
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_cap))
+        return delay
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Any],
+        stream: bool = False,
+        transport_errors: Tuple[type, ...] = (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ),
+    ):
+        """Run ``send()`` under the host's quota, retrying pushback and errors
+
+        ``send`` performs one attempt and returns a response with
+        ``status_code``, ``headers``, ``content`` and ``close()`` (requests
+        or httpx). Only idempotent methods are retried; the final response
+        (or exception) is returned to the caller unchanged, so
+        ``raise_for_status`` and status checks still work.
+        """
+        retries = self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            state = self.acquire(url)
+            try:
+                response = send()
+            except transport_errors:
+                self.record(state, FAILED)
+                if attempt >= retries:
+                    raise
+                retry_after = None
+            else:
+                outcome = classify_response(response, peek=not stream)
+                self.record(state, outcome)
+                if outcome == OK or attempt >= retries:
+                    return response
+                retry_after = _retry_after(response)
+                response.close()
+
+            delay = self.backoff(attempt, retry_after)
+            state.stats["retries"] += 1
+            logger.info(
+                f"Retrying {host_of(url)} in {delay:.1f}s (attempt {attempt + 2})"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {
+            host: {
+                **state.stats,
+                "rate": state.bucket.rate,
+                "circuit": state.breaker.state,
+            }
+            for host, state in hosts.items()
+        }
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that sends every request through ``RateLimiter.send``"""
+
+    def __init__(self, limiter: "RateLimiter", **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        return self.limiter.send(
+            request.method,
+            request.url,
+            lambda: HTTPAdapter.send(self, request, stream=stream, **kwargs),
+            stream=stream,
+        )
+
+
+_shared: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter() -> RateLimiter:
+    """The process-wide RateLimiter every scraper uses by default"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter()
+        return _shared
+
+
+def install_rate_limiter(
+    session: requests.Session,
+    limiter: Optional[RateLimiter] = None,
+    pool_maxsize: int = 10,
+    prefixes: Sequence[str] = ("https://", "http://"),
+    pool_connections: int = 10,
+) -> RateLimiter:
+    """Mount a RateLimitedAdapter on ``session``; returns the limiter used
+
+    ``pool_connections`` is the number of hosts whose pools are kept,
+    ``pool_maxsize`` the connections kept open per host.
+    """
+    limiter = limiter or shared_rate_limiter()
+    adapter = RateLimitedAdapter(
+        limiter, pool_connections=pool_connections, pool_maxsize=max(10, pool_maxsize)
+    )
+    for prefix in prefixes:
+        session.mount(prefix, adapter)
+    return limiter
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Persistent response cache for Google Places API calls
+Speichert Text Search und Details Antworten in SQLite (TTL + LRU-Eviction)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+DEFAULT_CACHE_PATH = "data/places_cache.sqlite"
+
+# Params that must never become part of a cache key (credentials)
+IGNORED_PARAMS = {"key"}
+
+# Google API statuses worth caching; errors like OVER_QUERY_LIMIT or
+# REQUEST_DENIED are transient/credential specific and always re-fetched
+CACHEABLE_STATUSES = {"OK", "ZERO_RESULTS"}
+
+# Paginated searches are never cached: a next_page_token is only valid for
+# a few minutes, so a cached first page would hand out an expired token and
+# a cached follow-up page would end the chain early
+PAGINATION_PARAMS = {"pagetoken"}
+PAGINATION_FIELD = "next_page_token"
+
+
+class ResponseCache:
+    """Content-addressed SQLite cache for JSON API responses
+
+    Entries are keyed on the endpoint plus the normalized query params (minus
+    the API key), expire after ``ttl`` seconds and are evicted least recently
+    used first once the stored bodies exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = 7 * 24 * 3600,
+        max_bytes: int = 200 * 1024 * 1024,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping] = None) -> Tuple[str, str]:
+        """Return (endpoint, key) for a request
+
+        Query params from the URL and from ``params`` are merged, the API key
+        is dropped and the rest is sorted so equivalent requests share a key.
+        """
+        parts = urlsplit(url)
+        endpoint = f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+        items = parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            items.extend(params.items())
+
+        normalized = sorted(
+            (str(k), str(v)) for k, v in items if k not in IGNORED_PARAMS
+        )
+        digest = hashlib.sha256(
+            json.dumps([endpoint, normalized], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        return endpoint, digest
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for ``key`` or None if missing/expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, endpoint: str, body: bytes) -> None:
+        """Store a response body and evict old entries if over budget"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, endpoint, body, size, created, accessed)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, endpoint, sqlite3.Binary(body), len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the size budget is met"""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        freed = 0
+        stale_keys = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        ):
+            stale_keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters of this process plus current cache size"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "miss_rate": round(self.misses / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedSession(requests.Session):
+    """requests.Session with read-through/write-through response caching
+
+    Only GET requests are cached, and only JSON responses whose Google API
+    status is in CACHEABLE_STATUSES are written back. Pages of a paginated
+    search (a ``pagetoken`` request or a body with ``next_page_token``)
+    always go to the network.
+    """
+
+    def __init__(self, cache: Optional[ResponseCache] = None):
+        super().__init__()
+        self.cache = cache
+
+    def request(self, method, url, params=None, **kwargs):
+        if (
+            self.cache is None
+            or str(method).upper() != "GET"
+            or self._is_paginated(url, params)
+        ):
+            return super().request(method, url, params=params, **kwargs)
+
+        endpoint, key = self.cache.make_key(url, params)
+        body = self.cache.get(key)
+        if body is not None:
+            return self._cached_response(url, body)
+
+        response = super().request(method, url, params=params, **kwargs)
+        if self._is_cacheable(response):
+            self.cache.set(key, endpoint, response.content)
+        return response
+
+    @staticmethod
+    def _is_paginated(url: str, params: Optional[Mapping]) -> bool:
+        names = {k for k, _ in parse_qsl(urlsplit(url).query)}
+        if isinstance(params, Mapping):
+            names.update(params)
+        return not PAGINATION_PARAMS.isdisjoint(names)
+
+    @staticmethod
+    def _is_cacheable(response: requests.Response) -> bool:
+        if response.status_code != 200:
+            return False
+        try:
+            data = response.json()
+        except ValueError:
+            return False
+        return (
+            isinstance(data, dict)
+            and data.get("status") in CACHEABLE_STATUSES
+            and not data.get(PAGINATION_FIELD)
+        )
+
+    @staticmethod
+    def _cached_response(url: str, body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.encoding = "utf-8"
+        response.url = url
+        response.headers["Content-Type"] = "application/json"
+        response.headers["X-Cache"] = "HIT"
+        return response
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Background task execution for the Tk GUI
+Worker-Pool + Event-Queue, die der Tk-Mainloop per after() abarbeitet
+"""
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task when its CancelToken was cancelled"""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared by a task and the code it calls
+
+    Scrapers take it as ``cancel_token`` and call ``raise_if_cancelled()``
+    between requests; ``wait()`` is a sleep that ends early on cancel.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled()
+
+    def wait(self, seconds: float) -> bool:
+        """Sleep up to ``seconds``; True if cancelled meanwhile"""
+        return self._event.wait(seconds)
+
+
+@dataclass
+class Progress:
+    """Latest progress report of a task"""
+
+    task_id: int
+    name: str
+    done: int = 0
+    total: Optional[int] = None
+    unit: str = ""
+    bytes: int = 0
+    message: str = ""
+    eta: Optional[float] = None  # seconds
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+    def describe(self) -> str:
+        """Status bar text, e.g. "Daten sammeln: 12/40 Orte · 85 KB · ETA 0:30" """
+        parts = []
+        if self.total:
+            parts.append(f"{self.done}/{self.total} {self.unit}".strip())
+        elif self.done:
+            parts.append(f"{self.done} {self.unit}".strip())
+        if self.bytes:
+            parts.append(f"{self.bytes / 1024:.0f} KB")
+        if self.eta is not None:
+            minutes, seconds = divmod(int(round(self.eta)), 60)
+            parts.append(f"ETA {minutes}:{seconds:02d}")
+        text = f"{self.name}: {' · '.join(parts)}" if parts else self.name
+        return f"{text} – {self.message}" if self.message else text
+
+
+@dataclass
+class TaskHandle:
+    id: int
+    name: str
+    group: Optional[str]
+    token: CancelToken = field(default_factory=CancelToken)
+    started: float = field(default_factory=time.monotonic)
+    future: Optional[Future] = None
+    progress: Optional[Progress] = None
+
+
+class TaskContext:
+    """What a task function receives: cancellation, progress and UI calls"""
+
+    def __init__(self, runner: "TaskRunner", handle: TaskHandle, on_progress):
+        self.runner = runner
+        self.handle = handle
+        self.token = handle.token
+        self._on_progress = on_progress
+        self._progress_pending = False
+        self._progress_lock = threading.Lock()
+
+    def check(self) -> None:
+        """Raise TaskCancelled if the task was cancelled"""
+        self.token.raise_if_cancelled()
+
+    def progress(
+        self,
+        done: int,
+        total: Optional[int] = None,
+        unit: Optional[str] = None,
+        bytes: Optional[int] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        """Report progress; the ETA is extrapolated from the elapsed time
+
+        Reports are coalesced: while one is waiting in the queue, newer
+        reports only replace its values, so a fast loop cannot flood Tk.
+        """
+        self.check()
+        handle = self.handle
+        previous = handle.progress or Progress(handle.id, handle.name)
+        eta = None
+        if total and done:
+            elapsed = time.monotonic() - handle.started
+            eta = elapsed / done * max(0, total - done)
+        with self._progress_lock:
+            handle.progress = Progress(
+                task_id=handle.id,
+                name=handle.name,
+                done=done,
+                total=total,
+                unit=previous.unit if unit is None else unit,
+                bytes=previous.bytes if bytes is None else bytes,
+                message=previous.message if message is None else message,
+                eta=eta,
+            )
+            if self._progress_pending or self._on_progress is None:
+                return
+            self._progress_pending = True
+        self.runner.post(self._deliver_progress)
+
+    def _deliver_progress(self) -> None:
+        with self._progress_lock:
+            self._progress_pending = False
+            progress = self.handle.progress
+        self._on_progress(progress)
+
+    def call(self, fn: Callable, *args, **kwargs) -> None:
+        """Run ``fn`` in the Tk thread (fire and forget)"""
+        self.runner.call(fn, *args, **kwargs)
+
+    def call_sync(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn`` in the Tk thread and return its result (e.g. a dialog)
+
+        Raises TaskCancelled when the task is cancelled while waiting, e.g.
+        because the window was closed and nobody drains the queue any more.
+        """
+        return self.runner._call_sync(fn, args, kwargs, self.token)
+
+
+class TaskRunner:
+    """Runs GUI tasks on a worker pool and hands results back to Tk
+
+    Task functions run as ``fn(context, *args)`` in the pool and must not
+    touch widgets; everything UI related (callbacks, progress, ``call``)
+    goes through ``events``, a ``queue.Queue`` that the Tk thread drains
+    via ``root.after`` once ``attach(root)`` was called. Tasks that share a
+    ``group`` are mutually exclusive: while one runs, ``submit`` returns
+    None for the next, so e.g. two collections never write the same file.
+    """
+
+    # How often a worker blocked in call_sync checks for cancellation
+    SYNC_POLL_INTERVAL = 0.1
+
+    def __init__(self, max_workers: int = 4):
+        self.events: "queue.Queue" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gui-task"
+        )
+        self._tasks: Dict[int, TaskHandle] = {}
+        self._groups: Dict[str, TaskHandle] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._ui_thread = threading.current_thread()
+        self._root = None
+        self._closed = threading.Event()
+
+    # -- Tk side ---------------------------------------------------------
+
+    def attach(self, root, interval_ms: int = 50) -> None:
+        """Drain the event queue from the Tk mainloop every ``interval_ms``"""
+        self._root = root
+        self._ui_thread = threading.current_thread()
+
+        def poll():
+            self.drain()
+            root.after(interval_ms, poll)
+
+        root.after(interval_ms, poll)
+
+    def drain(self, limit: int = 500) -> int:
+        """Run up to ``limit`` queued UI events; returns how many ran"""
+        handled = 0
+        while handled < limit:
+            try:
+                fn, args, kwargs = self.events.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                print(f"⚠️  UI-Callback fehlgeschlagen: {e}")
+        return handled
+
+    def in_ui_thread(self) -> bool:
+        return threading.current_thread() is self._ui_thread
+
+    def post(self, fn: Callable, *args, **kwargs) -> None:
+        self.events.put((fn, args, kwargs))
+
+    def call(self, fn: Callable, *args, **kwargs) -> None:
+        """Run ``fn`` now when on the Tk thread, otherwise queue it"""
+        if self.in_ui_thread():
+            fn(*args, **kwargs)
+        else:
+            self.post(fn, *args, **kwargs)
+
+    def call_sync(self, fn: Callable, *args, **kwargs) -> Any:
+        return self._call_sync(fn, args, kwargs, None)
+
+    def _call_sync(
+        self, fn: Callable, args, kwargs, token: Optional[CancelToken]
+    ) -> Any:
+        if self.in_ui_thread():
+            return fn(*args, **kwargs)
+
+        result: Future = Future()
+
+        def run():
+            try:
+                result.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                result.set_exception(e)
+
+        self.post(run)
+        while True:
+            try:
+                return result.result(timeout=self.SYNC_POLL_INTERVAL)
+            except FutureTimeout:
+                if self._closed.is_set() or (token is not None and token.cancelled):
+                    raise TaskCancelled()
+
+    # -- Tasks -----------------------------------------------------------
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable,
+        *args,
+        group: Optional[str] = None,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+        on_progress: Optional[Callable[[Progress], None]] = None,
+    ) -> Optional[TaskHandle]:
+        """Start ``fn(context, *args)`` in the pool
+
+        The callbacks run in the Tk thread. Returns None (and starts
+        nothing) when a task of the same ``group`` is still running.
+        """
+        with self._lock:
+            if group is not None and group in self._groups:
+                return None
+            handle = TaskHandle(id=next(self._ids), name=name, group=group)
+            self._tasks[handle.id] = handle
+            if group is not None:
+                self._groups[group] = handle
+
+        context = TaskContext(self, handle, on_progress)
+        handle.future = self._executor.submit(
+            self._run, handle, context, fn, args, on_done, on_error, on_cancel
+        )
+        return handle
+
+    def _run(self, handle, context, fn, args, on_done, on_error, on_cancel) -> None:
+        try:
+            result = fn(context, *args)
+            if handle.token.cancelled:
+                raise TaskCancelled()
+        except TaskCancelled:
+            self._finish(handle)
+            if on_cancel:
+                self.post(on_cancel)
+        except Exception as e:
+            self._finish(handle)
+            if on_error:
+                self.post(on_error, e)
+            else:
+                print(f"❌ Task '{handle.name}' fehlgeschlagen: {e}")
+        else:
+            self._finish(handle)
+            if on_done:
+                self.post(on_done, result)
+
+    def _finish(self, handle: TaskHandle) -> None:
+        with self._lock:
+            self._tasks.pop(handle.id, None)
+            if handle.group is not None and self._groups.get(handle.group) is handle:
+                del self._groups[handle.group]
+
+    def running(self) -> List[TaskHandle]:
+        with self._lock:
+            return list(self._tasks.values())
+
+    def is_running(self, group: str) -> bool:
+        with self._lock:
+            return group in self._groups
+
+    def cancel(self, task: Union[int, str, TaskHandle]) -> bool:
+        """Cancel a task by handle, id or group; True if one was found"""
+        with self._lock:
+            if isinstance(task, TaskHandle):
+                handle = self._tasks.get(task.id)
+            elif isinstance(task, str):
+                handle = self._groups.get(task)
+            else:
+                handle = self._tasks.get(task)
+        if handle is None:
+            return False
+        handle.token.cancel()
+        return True
+
+    def cancel_all(self) -> int:
+        handles = self.running()
+        for handle in handles:
+            handle.token.cancel()
+        return len(handles)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._closed.set()
+        for handle in self.running():
+            handle.token.cancel()
+            # Queued tasks never start (cancel_futures needs Python 3.9)
+            if handle.future is not None and handle.future.cancel():
+                self._finish(handle)
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,135 @@
+// Headless benchmark for the pillar page filters (run via test_filter_index.py)
+//
+//   node filter_benchmark.js generated_page.html
+//
+// Runs the page script against a minimal fake DOM and compares the bitset
+// filter + keyed rendering with the previous per-item checks + full
+// innerHTML rebuild. Prints one JSON object with timings and checks.
+
+const fs = require('fs');
+const vm = require('vm');
+
+const html = fs.readFileSync(process.argv[2], 'utf8');
+const scripts = [...html.matchAll(/<script>([\s\S]*?)<\/script>/g)].map(m => m[1]);
+const pageScript = scripts.find(s => s.includes('function applyFilters'));
+
+let created = 0;
+
+function makeElement(tag) {
+  if (tag !== '#fragment') created++;
+  const el = {
+    tagName: tag,
+    style: {},
+    checked: false,
+    children: [],
+    appendChild(child) {
+      if (child.isFragment) {
+        this.children.push(...child.children);
+        child.children = [];
+      } else {
+        this.children.push(child);
+      }
+      return child;
+    },
+    set textContent(_) { this.children = []; },
+    set innerHTML(value) { this.html = value; this.firstElementChild = makeElement('article'); },
+    querySelectorAll: () => [],
+    addEventListener() {},
+  };
+  return el;
+}
+
+const elements = {};
+const document = {
+  getElementById: id => (elements[id] = elements[id] || makeElement(id)),
+  createElement: makeElement,
+  createDocumentFragment: () => Object.assign(makeElement('#fragment'), { isFragment: true }),
+  querySelectorAll: () => [],
+};
+const context = { document, console, Uint32Array, Math, Object, JSON, Map };
+context.window = context;
+vm.createContext(context);
+vm.runInContext(pageScript, context);
+
+// The previous implementation: ten checks per item, full string rebuild
+function legacyFilter(DATA, f) {
+  return DATA.filter(item =>
+    (!f.shade || item.feature_shade) &&
+    (!f.water || item.feature_water) &&
+    (!f.benches || item.feature_benches) &&
+    (!f.parking || item.feature_parking) &&
+    (!f.toilets || item.feature_toilets) &&
+    (!f.wheelchair || item.feature_wheelchair_accessible) &&
+    (!f.kids || item.feature_kids_friendly) &&
+    (!f.dogs || item.feature_dogs_allowed) &&
+    (!f.fee || item.feature_fee === false) &&
+    (!f.seasonal || item.feature_seasonal === true));
+}
+
+const run = code => vm.runInContext(code, context);
+const DATA = run('DATA');
+const names = run('FEATURE_FILTERS');
+const cardHtml = run('cardHtml');
+
+// Deterministic pseudo-random filter combinations (1-3 filters each)
+let seed = 42;
+const random = () => (seed = (seed * 1103515245 + 12345) % 2147483648) / 2147483648;
+const combos = [[]];
+for (let c = 0; c < 300; c++) {
+  const size = 1 + Math.floor(random() * 3);
+  const combo = new Set();
+  while (combo.size < size) combo.add(names[Math.floor(random() * names.length)]);
+  combos.push([...combo]);
+}
+
+let mismatches = 0;
+for (const combo of combos) {
+  const flags = Object.fromEntries(combo.map(name => [name, true]));
+  const expected = legacyFilter(DATA, flags).map(item => DATA.indexOf(item));
+  const actual = run(`filterIndices(${JSON.stringify(combo)})`);
+  if (expected.join() !== actual.join()) mismatches++;
+}
+
+function time(fn, repeat = 3) {
+  let best = Infinity;
+  for (let r = 0; r < repeat; r++) {
+    const start = process.hrtime.bigint();
+    fn();
+    best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  return best;
+}
+
+const filterIndices = run('filterIndices');
+const legacyFilterMs = time(() => {
+  for (const combo of combos) legacyFilter(DATA, Object.fromEntries(combo.map(n => [n, true])));
+});
+const bitsetFilterMs = time(() => {
+  for (const combo of combos) filterIndices(combo);
+});
+
+// Rendering: old code rebuilt every card's HTML string on each change
+const legacyRenderMs = time(() => {
+  for (const combo of combos.slice(0, 30)) {
+    legacyFilter(DATA, Object.fromEntries(combo.map(n => [n, true]))).map(cardHtml).join('');
+  }
+});
+const render = run('render');
+render(filterIndices([]));  // first full render creates every card once
+const createdAfterFirstRender = created;
+const keyedRenderMs = time(() => {
+  for (const combo of combos.slice(0, 30)) render(filterIndices(combo));
+});
+const cardsCreatedOnRefilter = created - createdAfterFirstRender;
+
+console.log(JSON.stringify({
+  items: DATA.length,
+  indexFromGenerator: run('window.FEATURE_INDEX && window.FEATURE_INDEX.count') === DATA.length,
+  combos: combos.length,
+  mismatches,
+  legacyFilterMs,
+  bitsetFilterMs,
+  legacyRenderMs,
+  keyedRenderMs,
+  cardsCreatedOnRefilter,
+}));
@@ -0,0 +1,154 @@
+"""Memoized review analysis (AnalysisCache + ReviewDemandAnalyzer)."""
+
+import json
+import sys
+import time
+from unittest.mock import patch
+
+import analyze_demand
+from analysis_cache import AnalysisCache
+from enhanced_scrapers import GooglePlacesScraper, ScrapedLocation
+from niche_research import ReviewDemandAnalyzer
+
+API_KEY = "AIzaSyDEMO_KEY_FOR_TESTING_1234567890"
+
+
+def _places():
+    return [
+        ScrapedLocation(name=f"Park {i}", address="", city="Berlin", place_id=f"p{i}")
+        for i in range(3)
+    ]
+
+
+def _reviews(place_id):
+    return [
+        {
+            "rating": 1,
+            "text": "Leider keine Toiletten und keine Parkplätze",
+            "author": "a",
+            "time": 0,
+        },
+        {
+            "rating": 5,
+            "text": "Toller Spielplatz mit viel Schatten",
+            "author": "b",
+            "time": 0,
+        },
+    ]
+
+
+def _patched_api():
+    return (
+        patch.object(GooglePlacesScraper, "search_places", return_value=_places()),
+        patch.object(ReviewDemandAnalyzer, "_get_place_reviews", side_effect=_reviews),
+    )
+
+
+def test_report_fetches_everything_once():
+    search, details = _patched_api()
+    with search as search_mock, details as details_mock:
+        analyzer = ReviewDemandAnalyzer(api_key=API_KEY, delay=0)
+        analysis, ideas = analyzer.print_analysis_report(
+            "Parks", "Berlin", max_places=3
+        )
+
+    assert analysis["total_reviews_analyzed"] == 6
+    assert ideas
+    assert search_mock.call_count == 1
+    assert details_mock.call_count == 3
+    assert analyzer.analysis_cache.stats()["hits"] == 1
+
+
+def test_key_normalization_and_invalidation():
+    cache = AnalysisCache()
+    cache.set(cache.make_key("Parks", "Berlin", 30), {"total_reviews_analyzed": 1})
+    cache.set(cache.make_key("Parks", "Potsdam", 30), {"total_reviews_analyzed": 2})
+    cache.set(
+        cache.make_key("Cafes", "Berlin", 30, "en"), {"total_reviews_analyzed": 3}
+    )
+
+    assert cache.get(cache.make_key(" parks", "BERLIN", 30)) == {
+        "total_reviews_analyzed": 1
+    }
+    assert cache.get(cache.make_key("Parks", "Berlin", 20)) is None
+    assert cache.invalidate(city="berlin") == 2
+    assert cache.get(cache.make_key("Parks", "Potsdam", 30)) is not None
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+def test_entries_expire_and_copies_are_returned():
+    cache = AnalysisCache(ttl=0.05)
+    key = cache.make_key("Parks", "Berlin", 30)
+    cache.set(key, {"top_praise": [("viel schatten", 2)]})
+
+    cached = cache.get(key)
+    cached["top_praise"].clear()
+    assert cache.get(key) == {"top_praise": [("viel schatten", 2)]}
+
+    time.sleep(0.1)
+    assert cache.get(key) is None
+
+
+def test_disk_persistence_restores_pairs(tmp_path):
+    path = str(tmp_path / "analysis.json")
+    key = AnalysisCache.make_key("Parks", "Berlin", 30)
+    AnalysisCache(path=path).set(
+        key,
+        {
+            "total_reviews_analyzed": 4,
+            "top_complaints": [("keine toiletten", 3)],
+            "unmet_needs": [],
+        },
+    )
+
+    reloaded = AnalysisCache(path=path).get(key)
+
+    assert reloaded == {
+        "total_reviews_analyzed": 4,
+        "top_complaints": [("keine toiletten", 3)],
+        "unmet_needs": [],
+    }
+    assert AnalysisCache(ttl=0, path=path).get(key) is None
+
+
+def test_empty_results_are_not_cached():
+    analyzer = ReviewDemandAnalyzer(api_key=API_KEY, delay=0)
+    with patch.object(analyzer, "iter_reviews_for_category", return_value=[]) as stream:
+        analyzer.analyze_review_sentiment("Parks", "Berlin", min_reviews=1)
+        analyzer.analyze_review_sentiment("Parks", "Berlin", min_reviews=1)
+
+    assert stream.call_count == 2
+
+
+def test_cli_output_uses_single_analysis(tmp_path, monkeypatch):
+    output = tmp_path / "results.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "analyze_demand.py",
+            "--category",
+            "parks",
+            "--city",
+            "Berlin",
+            "--api-key",
+            API_KEY,
+            "--max-places",
+            "3",
+            "--delay",
+            "0",
+            "--quiet",
+            "--output",
+            str(output),
+        ],
+    )
+
+    search, details = _patched_api()
+    with search as search_mock, details:
+        analyze_demand.main()
+
+    saved = json.loads(output.read_text(encoding="utf-8"))
+    assert saved["analysis"]["total_reviews_analyzed"] == 6
+    assert saved["content_ideas"]
+    assert search_mock.call_count == 1
@@ -0,0 +1,210 @@
+"""Quadtree area sweep: tile geometry, adaptive splitting and dedupe."""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from area_sweep import AreaSweep, Tile
+from enhanced_scrapers import GooglePlacesScraper, ScrapedLocation
+from geo_index import haversine_m
+
+BERLIN = Tile.from_bounds((52.34, 13.09, 52.68, 13.76))
+
+
+def _city(seed=3):
+    """A dense center (1500 places) and sparse outskirts (300 places)"""
+    rng = random.Random(seed)
+    places = []
+    for i in range(1800):
+        if i < 1500:
+            lat, lng = rng.gauss(52.52, 0.015), rng.gauss(13.40, 0.025)
+        else:
+            lat, lng = rng.uniform(52.34, 52.68), rng.uniform(13.09, 13.76)
+        if BERLIN.contains(lat, lng):
+            places.append(
+                ScrapedLocation("Park", "", "Berlin", lat, lng, place_id=f"p{i}")
+            )
+    return places
+
+
+def _nearby_search(places, cap=60):
+    """Fake Nearby Search: the first ``cap`` places in the tile's circle"""
+    calls = []
+
+    def search(tile):
+        calls.append(tile)
+        lat, lng = tile.center
+        radius = tile.radius_m
+        hits = [
+            p
+            for p in places
+            if haversine_m(lat, lng, p.latitude, p.longitude) <= radius
+        ]
+        # The circle overlaps the neighbours, so places come back repeatedly
+        return hits[:cap], len(hits) >= cap, 1
+
+    return search, calls
+
+
+def test_tiles_split_into_covering_quadrants():
+    quadrants = BERLIN.split()
+
+    assert [q.depth for q in quadrants] == [1, 1, 1, 1]
+    assert BERLIN.center == (quadrants[0].north, quadrants[0].east)
+    # Every point lies in exactly one quadrant, edges included
+    for lat, lng in [BERLIN.center, (52.34, 13.09), (52.5, 13.2), (52.6, 13.7)]:
+        assert sum(q.contains(lat, lng) for q in quadrants) == 1
+    # The covering circle reaches the farthest corner
+    corners = [
+        (lat, lng)
+        for lat in (BERLIN.south, BERLIN.north)
+        for lng in (BERLIN.west, BERLIN.east)
+    ]
+    farthest = max(haversine_m(*BERLIN.center, *c) for c in corners)
+    assert abs(BERLIN.radius_m - farthest) < 0.01
+    assert 40000 < BERLIN.size_m < 50000
+
+
+def test_saturated_tiles_are_refined_until_everything_is_found():
+    places = _city()
+    search, calls = _nearby_search(places)
+    seen = []
+
+    sweep = AreaSweep(search, max_depth=8, min_tile_m=100, max_workers=4)
+    found = sweep.run(BERLIN, on_place=seen.append)
+
+    assert {p.place_id for p in found} == {p.place_id for p in places}
+    assert len(found) == len(places) == len(seen)
+    assert not sweep.stats.skipped
+    # Refinement is local: far fewer searches than a uniform grid at the
+    # deepest level that was needed
+    assert sweep.stats.tiles == len(calls)
+    assert sweep.stats.results > len(found)
+    assert len(calls) < 4**sweep.stats.max_depth / 4
+
+
+def test_depth_limit_and_failing_tiles_are_reported():
+    places = _city()
+    search, _ = _nearby_search(places)
+
+    def flaky(tile):
+        if tile.depth == 1 and tile.south == BERLIN.south and tile.west == BERLIN.west:
+            raise ConnectionError("timeout")
+        return search(tile)
+
+    reports = []
+    sweep = AreaSweep(flaky, max_depth=2, min_tile_m=100)
+    found = sweep.run(
+        BERLIN, progress=lambda done, total, **info: reports.append((done, total))
+    )
+
+    assert 0 < len(found) < len(places)
+    assert sweep.stats.failed == 1
+    assert sweep.stats.skipped and all(t.depth == 2 for t in sweep.stats.skipped)
+    assert reports[-1][0] == reports[-1][1] == sweep.stats.tiles
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+def test_search_tile_pages_filters_and_detects_saturation():
+    scraper = GooglePlacesScraper(api_key="test", delay=0)
+    scraper.PAGE_TOKEN_DELAY = 0
+    tile = Tile(52.50, 13.30, 52.52, 13.34)
+
+    def result(i, lat=52.51):
+        return {
+            "name": f"Park {i}",
+            "vicinity": f"Weg {i}, Berlin",
+            "geometry": {"location": {"lat": lat, "lng": 13.32}},
+            "place_id": f"p{i}",
+        }
+
+    pages = [
+        {
+            "status": "OK",
+            "results": [result(i) for i in range(20)],
+            "next_page_token": "t1",
+        },
+        {"status": "INVALID_REQUEST", "results": []},
+        {
+            "status": "OK",
+            "results": [result(i) for i in range(20, 40)],
+            "next_page_token": "t2",
+        },
+        # Part of the circle lies outside the tile
+        {"status": "OK", "results": [result(i, lat=52.53) for i in range(40, 60)]},
+    ]
+    scraper.session = MagicMock()
+    scraper.session.get.side_effect = [_response(page) for page in pages]
+
+    places, saturated, requests = scraper.search_tile("parks", tile)
+
+    assert len(places) == 40 and places[0].address == "Weg 0, Berlin"
+    assert saturated and requests == 4
+    first = scraper.session.get.call_args_list[0]
+    assert first.args[0].endswith("/nearbysearch/json")
+    assert first.kwargs["params"]["keyword"] == "parks"
+    assert first.kwargs["params"]["location"] == "52.510000,13.320000"
+    assert scraper.session.get.call_args_list[2].kwargs["params"]["pagetoken"] == "t1"
+
+
+def test_interrupted_page_chains_are_not_complete():
+    scraper = GooglePlacesScraper(api_key="test", delay=0)
+    scraper.PAGE_TOKEN_DELAY = 0
+    scraper.PAGE_TOKEN_RETRIES = 2
+    tile = Tile(52.50, 13.30, 52.52, 13.34)
+    first = {
+        "status": "OK",
+        "results": [
+            {
+                "name": "Park",
+                "geometry": {"location": {"lat": 52.51, "lng": 13.32}},
+                "place_id": "p1",
+            }
+        ],
+        "next_page_token": "t1",
+    }
+    scraper.session = MagicMock()
+
+    # The token never became valid: split the tile instead of dropping pages
+    scraper.session.get.side_effect = [_response(first)] + [
+        _response({"status": "INVALID_REQUEST"})
+    ] * 2
+    places, saturated, requests = scraper.search_tile("parks", tile)
+    assert [p.place_id for p in places] == ["p1"]
+    assert saturated and requests == 3
+
+    scraper.session.get.side_effect = [
+        _response(first),
+        _response({"status": "UNKNOWN_ERROR"}),
+    ]
+    assert scraper.search_tile("parks", tile)[1]
+
+    # Without a first page the tile failed
+    scraper.session.get.side_effect = [_response({"status": "REQUEST_DENIED"})]
+    with pytest.raises(RuntimeError):
+        scraper.search_tile("parks", tile)
+
+
+def test_sweep_area_geocodes_the_city():
+    scraper = GooglePlacesScraper(api_key="test", delay=0)
+    viewport = {
+        "northeast": {"lat": 52.68, "lng": 13.76},
+        "southwest": {"lat": 52.34, "lng": 13.09},
+    }
+    scraper.session = MagicMock()
+    scraper.session.get.return_value = _response(
+        {"status": "OK", "results": [{"geometry": {"viewport": viewport}}]}
+    )
+    search, calls = _nearby_search(_city())
+    scraper.search_tile = lambda query, tile, cancel_token=None: search(tile)
+
+    found = scraper.sweep_area("parks", "Berlin", max_depth=8, min_tile_m=100)
+
+    assert calls[0] == BERLIN
+    assert len(found) == scraper.last_sweep.places == len(_city())
@@ -0,0 +1,112 @@
+"""Batch city × category builds (batch_build)."""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+import pytest
+
+from batch_build import build_matrix, load_spec, slugify
+
+
+@pytest.fixture
+def spec(tmp_path):
+    rows = []
+    for city in ("Berlin", "München", "Köln"):
+        for category in ("Parks", "Cafés"):
+            for i in range(3):
+                rows.append(
+                    {
+                        "name": f"{category} {i} {city}",
+                        "address": f"Straße {i}",
+                        "city": city,
+                        "category": category,
+                        "latitude": 52.0 + i,
+                        "longitude": 13.0,
+                        "rating": 4.0,
+                        "review_count": 10,
+                        "feature_shade": "TRUE" if i else "FALSE",
+                    }
+                )
+    csv_path = tmp_path / "locations.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+
+    return {
+        "csv": str(csv_path),
+        "domain": "example.com",
+        "cities": ["Berlin", "München", "Köln", "Hamburg"],
+        "categories": ["Parks", "Cafés"],
+        "output_dir": str(tmp_path / "site"),
+    }
+
+
+def test_slugify():
+    assert slugify("München") == "muenchen"
+    assert slugify("Cafés & Bars") == "cafes-bars"
+
+
+def test_builds_matrix_in_processes_and_writes_sitemap(spec, tmp_path):
+    results = build_matrix(spec, workers=2)
+
+    written = [r for r in results if r.status == "written"]
+    assert len(written) == 6
+    assert {(r.city, r.category) for r in results if r.status == "empty"} == {
+        ("Hamburg", "Parks"),
+        ("Hamburg", "Cafés"),
+    }
+    assert all(r.locations == 3 and r.seconds > 0 for r in written)
+
+    page = (tmp_path / "site" / "muenchen-parks.html").read_text(encoding="utf-8")
+    assert "Parks 0 München" in page
+    assert "https://example.com/muenchen-parks" in page
+    assert "Cafés 0 München" not in page
+
+    sitemap = ET.parse(tmp_path / "site" / "sitemap.xml")
+    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    locs = {el.text for el in sitemap.findall(".//sm:loc", ns)}
+    assert len(locs) == 6
+    assert "https://example.com/koeln-cafes" in locs
+
+
+def test_second_run_skips_unchanged_pages(spec, tmp_path):
+    build_matrix(spec, workers=0)
+
+    df = pd.read_csv(spec["csv"])
+    df.loc[df["name"] == "Parks 1 Berlin", "rating"] = 2.5
+    df.to_csv(spec["csv"], index=False)
+
+    results = build_matrix(spec, workers=0)
+    statuses = {(r.city, r.category): r.status for r in results}
+
+    assert statuses[("Berlin", "Parks")] == "written"
+    assert list(statuses.values()).count("skipped") == 5
+
+    assert all(r.status != "written" for r in build_matrix(spec, workers=0))
+    assert (
+        len(
+            [
+                r
+                for r in build_matrix(spec, workers=0, force=True)
+                if r.status == "written"
+            ]
+        )
+        == 6
+    )
+
+
+def test_single_category_csv_and_spec_validation(spec, tmp_path):
+    df = pd.read_csv(spec["csv"]).drop(columns=["category"])
+    df.to_csv(spec["csv"], index=False)
+    spec = {**spec, "categories": None, "cities": None, "default_category": "Orte"}
+
+    results = build_matrix(spec, workers=0)
+    assert sorted(r.output_path.rsplit("/", 1)[-1] for r in results) == [
+        "berlin-orte.html",
+        "koeln-orte.html",
+        "muenchen-orte.html",
+    ]
+
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps({"csv": "x.csv"}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_spec(str(spec_path))
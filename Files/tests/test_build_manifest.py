@@ -0,0 +1,131 @@
+"""Incremental page regeneration via the build manifest."""
+
+import dataclasses
+import json
+import re
+from pathlib import Path
+
+from build_manifest import BuildManifest
+from data_pipeline import LocationData, PillarPageGenerator
+
+TEMPLATE = Path(__file__).resolve().parents[1] / "pillar_page_skeleton.html"
+
+
+def _location(i, **changes):
+    location = LocationData(
+        id=f"loc-{i}",
+        name=f"Park Nr. {i} – Süd",
+        street=f"Weg {i}",
+        city="Berlin",
+        region="Berlin",
+        country="Deutschland",
+        postcode="10115",
+        latitude=52.5 + i / 1000,
+        longitude=13.4,
+        url="https://example.com",
+        phone="+49 30 1",
+        email="",
+        opening_hours="",
+        rating=4.0 if i % 2 else 0.0,
+        review_count=10 * i,
+        feature_shade=bool(i % 2),
+    )
+    return dataclasses.replace(location, **changes)
+
+
+def _generate(generator, data, output):
+    return generator.generate_page(
+        data=data,
+        city="Berlin",
+        category="Parks",
+        output_path=str(output),
+        canonical_url="https://example.com/berlin-parks",
+    )
+
+
+def _json_blocks(html):
+    data = re.search(
+        r"const DATA = (.*?);\nconst DATA_EXAMPLE = \[", html, re.DOTALL
+    ).group(1)
+    schema = re.search(
+        r'<script type="application/ld\+json">\n  (.*?)\n  </script>', html, re.DOTALL
+    ).group(1)
+    return data, schema
+
+
+def test_serialization_matches_json_dumps_indent_2(tmp_path):
+    output = tmp_path / "page.html"
+    generator = PillarPageGenerator(
+        str(TEMPLATE), manifest=BuildManifest(str(tmp_path / "m.json"))
+    )
+
+    for data in ([], [_location(1)], [_location(i) for i in range(4)]):
+        _generate(generator, data, output)
+        data_text, schema_text = _json_blocks(output.read_text(encoding="utf-8"))
+
+        assert data_text == json.dumps(
+            json.loads(data_text), ensure_ascii=False, indent=2
+        )
+        assert schema_text == json.dumps(
+            json.loads(schema_text), ensure_ascii=False, indent=2
+        )
+        schema = json.loads(schema_text)
+        assert [item["position"] for item in schema["itemListElement"]] == list(
+            range(1, len(data) + 1)
+        )
+
+    # Same bytes with and without a manifest
+    plain = tmp_path / "plain.html"
+    _generate(
+        PillarPageGenerator(str(TEMPLATE)), [_location(i) for i in range(4)], plain
+    )
+    assert plain.read_text(encoding="utf-8") == output.read_text(encoding="utf-8")
+
+
+def test_unchanged_pages_are_skipped(tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    output = tmp_path / "page.html"
+    data = [_location(i) for i in range(3)]
+
+    manifest = BuildManifest(manifest_path)
+    assert _generate(
+        PillarPageGenerator(str(TEMPLATE), manifest=manifest), data, output
+    )
+    manifest.save()
+
+    manifest = BuildManifest(manifest_path)
+    generator = PillarPageGenerator(str(TEMPLATE), manifest=manifest)
+    assert not _generate(generator, data, output)
+    assert manifest.skipped == 1
+
+    # Changed config, changed record or an edited output all trigger a rebuild
+    generator.config = {"ga_id": "G-TEST"}
+    assert _generate(generator, data, output)
+    assert not _generate(generator, data, output)
+    assert _generate(generator, data[:2] + [_location(2, rating=1.5)], output)
+    output.write_text("edited", encoding="utf-8")
+    assert _generate(generator, data[:2] + [_location(2, rating=1.5)], output)
+
+
+def test_only_changed_records_are_reserialized(tmp_path, monkeypatch):
+    manifest = BuildManifest(str(tmp_path / "manifest.json"))
+    generator = PillarPageGenerator(str(TEMPLATE), manifest=manifest)
+    data = [_location(i) for i in range(5)]
+    _generate(generator, data, tmp_path / "a.html")
+    manifest.save()
+
+    serialized = []
+    original = PillarPageGenerator._location_fragments
+
+    def counting(self, location):
+        serialized.append(location.id)
+        return original(self, location)
+
+    monkeypatch.setattr(PillarPageGenerator, "_location_fragments", counting)
+    reloaded = BuildManifest(str(tmp_path / "manifest.json"))
+    generator = PillarPageGenerator(str(TEMPLATE), manifest=reloaded)
+    data[3] = _location(3, name="Umbenannt")
+    _generate(generator, data, tmp_path / "a.html")
+
+    assert serialized == ["loc-3"]
+    assert "Umbenannt" in (tmp_path / "a.html").read_text(encoding="utf-8")
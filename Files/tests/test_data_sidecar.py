@@ -0,0 +1,133 @@
+"""Data sidecar output mode for large pillar pages."""
+
+import json
+import re
+from pathlib import Path
+
+from build_manifest import BuildManifest
+from data_pipeline import LocationData, PillarPageGenerator
+
+TEMPLATE = str(Path(__file__).resolve().parents[1] / "pillar_page_skeleton.html")
+
+
+def _locations(count, rating=4.0):
+    return [
+        LocationData(
+            id=str(i),
+            name=f"Ort {i}",
+            street="Weg 1",
+            city="Berlin",
+            region="",
+            country="DE",
+            postcode="10115",
+            latitude=52.5,
+            longitude=13.4,
+            url="https://example.com",
+            phone="",
+            email="",
+            opening_hours="",
+            rating=rating,
+            review_count=i,
+        )
+        for i in range(count)
+    ]
+
+
+def _generate(generator, data, output):
+    generator.generate_page(
+        data=data,
+        city="Berlin",
+        category="Parks",
+        output_path=str(output),
+        canonical_url="https://example.com/berlin-parks",
+    )
+    html = output.read_text(encoding="utf-8")
+    inline = json.loads(
+        re.search(r"const DATA = (.*?);\nconst DATA_EXAMPLE", html, re.DOTALL).group(1)
+    )
+    source = re.search(r"window\.DATA_SRC = (\{.*?\});", html)
+    return html, inline, json.loads(source.group(1)) if source else None
+
+
+def test_auto_mode_inlines_small_pages(tmp_path):
+    generator = PillarPageGenerator(
+        TEMPLATE, {"data_mode": "auto", "sidecar_threshold": 10}
+    )
+
+    _, inline, source = _generate(generator, _locations(10), tmp_path / "page.html")
+
+    assert len(inline) == 10
+    assert source is None
+    assert not list(tmp_path.glob("data.*"))
+
+
+def test_sidecar_holds_remaining_items_and_shrinks_html(tmp_path):
+    data = _locations(300)
+    inline_html, _, _ = _generate(
+        PillarPageGenerator(TEMPLATE), data, tmp_path / "inline.html"
+    )
+
+    generator = PillarPageGenerator(
+        TEMPLATE, {"data_mode": "auto", "sidecar_threshold": 100, "inline_items": 12}
+    )
+    html, inline, source = _generate(generator, data, tmp_path / "page.html")
+
+    assert [item["name"] for item in inline] == [f"Ort {i}" for i in range(12)]
+    assert source["format"] == "json"
+    assert source["total"] == 300
+    assert re.fullmatch(r"data\.[0-9a-f]{12}\.json", source["url"])
+
+    sidecar = json.loads((tmp_path / source["url"]).read_text(encoding="utf-8"))
+    assert [item["name"] for item in sidecar] == [f"Ort {i}" for i in range(12, 300)]
+    # The JSON-LD ItemList stays complete; the DATA array is what moves out
+    assert len(html) < len(inline_html) * 0.7
+
+    headers = (tmp_path / "_headers").read_text(encoding="utf-8")
+    assert "immutable" in headers
+    _generate(generator, data, tmp_path / "page.html")
+    assert (tmp_path / "_headers").read_text(encoding="utf-8") == headers
+
+
+def test_ndjson_above_threshold(tmp_path):
+    generator = PillarPageGenerator(
+        TEMPLATE, {"data_mode": "sidecar", "inline_items": 2, "ndjson_threshold": 5}
+    )
+
+    _, inline, source = _generate(generator, _locations(8), tmp_path / "page.html")
+
+    assert len(inline) == 2
+    assert source["format"] == "ndjson"
+    lines = (tmp_path / source["url"]).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == [
+        f"Ort {i}" for i in range(2, 8)
+    ]
+
+
+def test_manifest_tracks_and_replaces_sidecars(tmp_path):
+    manifest = BuildManifest(str(tmp_path / "manifest.json"))
+    config = {"data_mode": "sidecar", "inline_items": 1}
+    generator = PillarPageGenerator(TEMPLATE, config, manifest=manifest)
+    output = tmp_path / "page.html"
+
+    _, _, first = _generate(generator, _locations(5), output)
+    # A missing sidecar forces a rebuild even though the page is unchanged
+    (tmp_path / first["url"]).unlink()
+    assert generator.generate_page(
+        _locations(5),
+        "Berlin",
+        "Parks",
+        str(output),
+        "https://example.com/berlin-parks",
+    )
+    assert not generator.generate_page(
+        _locations(5),
+        "Berlin",
+        "Parks",
+        str(output),
+        "https://example.com/berlin-parks",
+    )
+
+    _, _, second = _generate(generator, _locations(5, rating=3.0), output)
+
+    assert second["url"] != first["url"]
+    assert [p.name for p in tmp_path.glob("data.*")] == [second["url"]]
@@ -0,0 +1,83 @@
+"""FrameWindow: the pandas model behind the virtualized GUI preview."""
+
+import numpy as np
+import pandas as pd
+
+from frame_window import FrameWindow
+
+
+def _frame(rows):
+    rng = np.random.default_rng(5)
+    return pd.DataFrame(
+        {
+            "name": [f"Park {i}" for i in range(rows)],
+            "city": rng.choice(["Berlin", "Potsdam", "Leipzig"], rows),
+            "rating": rng.integers(10, 50, rows) / 10,
+            "phone": [None if i % 3 else f"030 {i}" for i in range(rows)],
+        }
+    )
+
+
+def test_window_rows_and_sorting():
+    df = pd.DataFrame(
+        {
+            "name": ["b", "a", "c", "d"],
+            "rating": [4.0, None, 3.5, 4.0],
+            "mixed": [1, "x", 2, "a"],
+        }
+    )
+    view = FrameWindow(df)
+
+    assert view.rows(1, 2) == [["a", "", "x"], ["c", 3.5, 2]]
+    view.sort("rating")
+    assert view.view_frame()["name"].tolist() == ["c", "b", "d", "a"]
+    view.sort("rating")
+    assert view.view_frame()["name"].tolist() == ["b", "d", "c", "a"]
+    # Mixed columns fall back to their string form
+    view.sort("mixed", ascending=True)
+    assert view.view_frame()["mixed"].tolist() == [1, 2, "a", "x"]
+    # The source frame is untouched
+    assert df["name"].tolist() == ["b", "a", "c", "d"]
+
+
+def test_filter_then_sort_keeps_both():
+    view = FrameWindow(_frame(30))
+
+    view.filter("POTSDAM")
+    assert len(view) and set(view.view_frame()["city"]) == {"Potsdam"}
+    view.sort("rating", ascending=False)
+    ratings = view.view_frame()["rating"].tolist()
+    assert ratings == sorted(ratings, reverse=True)
+    assert set(view.view_frame()["city"]) == {"Potsdam"}
+
+    view.filter("030", column="phone")
+    assert view.view_frame()["phone"].str.startswith("030").all()
+    view.filter("")
+    assert len(view) == 30
+
+
+def test_large_frames_only_format_the_visible_window(monkeypatch):
+    df = _frame(100_000)
+    view = FrameWindow(df)
+    view.filter("park 99")
+    view.sort("rating")
+
+    formatted = []
+    astype = pd.DataFrame.astype
+    monkeypatch.setattr(
+        pd.DataFrame,
+        "astype",
+        lambda frame, *args, **kwargs: formatted.append(len(frame))
+        or astype(frame, *args, **kwargs),
+    )
+    window = view.rows(0, 40)
+    last = view.rows(len(view) - 40, 40)
+
+    # Display values are built for the 2 x 40 visible rows, not the 100k
+    assert formatted and max(formatted) == 40
+    expected = df[df["name"].str.contains("Park 99")].sort_values(
+        "rating", kind="stable"
+    )
+    assert len(view) == len(expected) == 1111
+    assert [row[0] for row in window] == expected["name"].tolist()[:40]
+    assert [row[0] for row in last] == expected["name"].tolist()[-40:]
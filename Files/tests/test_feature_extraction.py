@@ -0,0 +1,92 @@
+"""SmartFeatureExtractor: compiled single-pass matcher vs. the per-pattern loop."""
+
+import random
+import re
+
+from enhanced_scrapers import SmartFeatureExtractor
+
+
+def _legacy_extract(text, reviews="", price_level=0):
+    """Reference implementation: one re.search per pattern."""
+    combined_text = f"{text} {reviews}".lower()
+    features = {}
+    for feature_name, patterns in SmartFeatureExtractor.FEATURE_PATTERNS.items():
+        found = any(re.search(p, combined_text, re.IGNORECASE) for p in patterns)
+        if feature_name == "free":
+            features["feature_fee"] = price_level > 0
+        else:
+            features[f"feature_{feature_name}"] = found
+    return features
+
+
+def _keyword(pattern):
+    """Plain text matched by ``pattern``"""
+    word = re.sub(r"\\w\*$|\\b$", "", pattern).replace(r"\s+", " ")
+    return word.replace(r"\s", " ")
+
+
+def _keywords():
+    words = [
+        _keyword(pattern)
+        for patterns in SmartFeatureExtractor.FEATURE_PATTERNS.values()
+        for pattern in patterns
+    ]
+    return words + ["Straße", "street", "Café", "Tor", "xyz", "Ä", "  "]
+
+
+def test_feature_patterns_are_collision_free():
+    # The compiled alternation reports one feature per start offset, so no
+    # keyword may also start a match of another feature
+    features = SmartFeatureExtractor.FEATURE_PATTERNS
+    for feature_name, patterns in features.items():
+        for keyword in map(_keyword, patterns):
+            for other, other_patterns in features.items():
+                if other != feature_name:
+                    assert not any(
+                        re.match(p, f"{keyword} ", re.IGNORECASE)
+                        for p in other_patterns
+                    ), (keyword, other)
+
+
+def test_matches_legacy_loop_on_random_texts():
+    rng = random.Random(42)
+    words = _keywords()
+
+    for _ in range(2000):
+        picked = rng.sample(words, rng.randint(0, 6))
+        sep = rng.choice([" ", "", ", ", "-"])
+        text = sep.join(w.upper() if rng.random() < 0.2 else w for w in picked)
+        reviews = sep.join(rng.sample(words, rng.randint(0, 4)))
+        price_level = rng.choice([0, 0, 1, 3])
+
+        assert SmartFeatureExtractor.extract_features(
+            text, reviews, price_level
+        ) == _legacy_extract(text, reviews, price_level), (text, reviews)
+
+
+def test_overlapping_keywords_are_all_detected():
+    features = SmartFeatureExtractor.extract_features("dogarage", "kinderspielplatz")
+
+    assert features["feature_dogs"]
+    assert features["feature_parking"]
+    assert features["feature_kids"]
+    assert not features["feature_water"]
+
+
+def test_batch_is_columnar_and_matches_single_calls():
+    texts = ["Park mit Schatten", "Hundewiese am See", "Museum"]
+    reviews = ["Toiletten vorhanden", "", "kostenlos"]
+    price_levels = [0, None, 2]
+
+    columns = SmartFeatureExtractor.extract_features_batch(texts, reviews, price_levels)
+
+    for i, text in enumerate(texts):
+        single = SmartFeatureExtractor.extract_features(
+            text, reviews[i], price_levels[i] or 0
+        )
+        assert {key: values[i] for key, values in columns.items()} == single
+
+    assert columns["feature_fee"] == [False, False, True]
+    assert SmartFeatureExtractor.extract_features_batch([]) == {
+        key: [] for key in columns
+    }
@@ -0,0 +1,118 @@
+"""Single-pass feature mention matching for unmet-needs detection."""
+
+import re
+from collections import Counter
+from types import SimpleNamespace
+
+from niche_research import ReviewDemandAnalyzer
+from phrase_engine import FeatureMatcher
+
+
+def _analyzer():
+    return ReviewDemandAnalyzer(api_key="test", delay=0)
+
+
+def _reference_counts(feature_keywords, text):
+    """One mention per word start and feature, like the old per-keyword findall"""
+    counts = Counter()
+    for feature, keywords in feature_keywords.items():
+        starts = set()
+        for keyword in keywords:
+            pattern = r"\b" + re.escape(keyword) + r"\w*"
+            starts.update(m.start() for m in re.finditer(pattern, text, re.IGNORECASE))
+        if starts:
+            counts[feature] = len(starts)
+    return counts
+
+
+def test_matches_per_keyword_regexes_in_one_pass():
+    analyzer = _analyzer()
+    text = (
+        "Keine Toiletten, kein WC und zu wenig Schatten! Parkplätze fehlen, "
+        "Parken unmöglich. Hunde verboten, no dogs, kein Trinkbrunnen oder "
+        "drinking fountain. Bänke kaputt, Steckdosen? Rollstuhl-unfreundlich."
+    )
+
+    counts = FeatureMatcher(analyzer.feature_keywords).count(text)
+
+    assert counts == _reference_counts(analyzer.feature_keywords, text)
+    # "Toiletten" is one mention even though "toilette" and "toiletten" are listed
+    assert counts["toilets"] == 2
+
+
+def test_unmet_needs_ranked_from_top_phrases():
+    analyzer = _analyzer()
+    complaints = [
+        ("keine parkplätze", 10),
+        ("fehlen toiletten", 8),
+        ("zu wenig schatten", 5),
+        ("keine toilette", 3),
+        ("kein parken", 2),
+        ("parkplatz voll", 1),
+    ]
+
+    assert analyzer._find_unmet_needs(complaints) == [
+        ("parking", 3),
+        ("toilets", 2),
+        ("shade", 1),
+    ]
+    assert analyzer._find_unmet_needs([]) == []
+
+
+def test_usable_on_raw_reviews_and_follows_table_changes():
+    analyzer = _analyzer()
+    reviews = ["Leider keine Toiletten", "Toilette defekt, kein Schatten", None, ""]
+
+    assert analyzer.count_feature_mentions(reviews) == [("toilets", 2), ("shade", 1)]
+
+    analyzer.feature_keywords["lighting"] = ["beleuchtung", "laterne"]
+    assert analyzer.count_feature_mentions(["Keine Beleuchtung, dunkle Laternen"]) == [
+        ("lighting", 2)
+    ]
+
+
+def test_streaming_analysis_reports_mentions_from_all_complaints():
+    analyzer = _analyzer()
+    reviews = [
+        {"rating": 1, "text": "Keine Toiletten", "author": "a", "time": 0},
+        {
+            "rating": 2,
+            "text": "Hunde überall, keine Toilette",
+            "author": "b",
+            "time": 0,
+        },
+        {"rating": 5, "text": "Toilette sauber", "author": "c", "time": 0},
+    ]
+    analyzer.iter_reviews_for_category = lambda *args, **kwargs: iter(reviews)
+
+    analysis = analyzer.analyze_review_sentiment("parks", "Berlin", min_reviews=1)
+
+    assert analysis["complaint_feature_mentions"] == [
+        ("toilets", 2),
+        ("dog_friendly", 1),
+    ]
+
+
+def test_every_text_is_scanned_once():
+    analyzer = _analyzer()
+    texts = [
+        "Keine Toiletten, kaum Schatten und die Bänke sind kaputt. Parkplätze fehlen."
+    ] * 20000
+
+    matcher = analyzer._feature_matcher()
+    scans = []
+    pattern = matcher.pattern
+    matcher.pattern = SimpleNamespace(
+        finditer=lambda text: scans.append(text) or pattern.finditer(text)
+    )
+
+    mentions = dict(analyzer.count_feature_mentions(texts))
+
+    assert mentions == {
+        "toilets": 20000,
+        "shade": 20000,
+        "benches": 20000,
+        "parking": 20000,
+    }
+    # One pass of the combined pattern per text, not one per keyword
+    assert len(scans) == len(texts)
@@ -0,0 +1,93 @@
+"""Columnar feature index for client-side filtering of generated pages."""
+
+import json
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from data_pipeline import (
+    FEATURE_FILTERS,
+    LocationData,
+    PillarPageGenerator,
+    build_feature_index,
+)
+
+FILES_DIR = Path(__file__).resolve().parents[1]
+BENCHMARK = Path(__file__).resolve().parent / "js" / "filter_benchmark.js"
+
+
+def _random_locations(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        LocationData(
+            id=str(i),
+            name=f"Ort {i}",
+            street="Weg 1",
+            city="Berlin",
+            region="",
+            country="DE",
+            postcode="10115",
+            latitude=52.5,
+            longitude=13.4,
+            url="",
+            phone="",
+            email="",
+            opening_hours="",
+            rating=4.0,
+            review_count=1,
+            **{field: rng.random() < 0.4 for _, field, _ in FEATURE_FILTERS},
+        )
+        for i in range(count)
+    ]
+
+
+def test_feature_index_masks_and_bitsets_agree():
+    data = _random_locations(70)
+    index = build_feature_index(data)
+
+    assert index["count"] == 70
+    assert index["features"] == [name for name, _, _ in FEATURE_FILTERS]
+    for bit, (name, field, expected) in enumerate(FEATURE_FILTERS):
+        words = index["bitsets"][bit]
+        assert len(words) == 3
+        assert all(0 <= word < 2**32 for word in words)
+        for i, location in enumerate(data):
+            passes = getattr(location, field) == expected
+            assert bool(words[i // 32] >> (i % 32) & 1) == passes, name
+            assert bool(index["masks"][i] >> bit & 1) == passes
+
+    # "Kostenfrei" passes locations without a fee
+    fee_bit = index["features"].index("fee")
+    assert bool(index["masks"][0] >> fee_bit & 1) == (data[0].feature_fee is False)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_bitset_filtering_benchmark_10k(tmp_path):
+    page = tmp_path / "bench.html"
+    PillarPageGenerator(str(FILES_DIR / "pillar_page_skeleton.html")).generate_page(
+        data=_random_locations(10_000),
+        city="Berlin",
+        category="Parks",
+        output_path=str(page),
+        canonical_url="https://example.com/bench",
+    )
+
+    completed = subprocess.run(
+        ["node", str(BENCHMARK), str(page)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    result = json.loads(completed.stdout)
+    print(f"\n📊 Filter benchmark: {result}")
+
+    assert result["items"] == 10_000
+    assert result["indexFromGenerator"]
+    assert result["mismatches"] == 0
+    assert result["cardsCreatedOnRefilter"] == 0
+    assert result["bitsetFilterMs"] < result["legacyFilterMs"]
+    assert result["keyedRenderMs"] < result["legacyRenderMs"]
@@ -0,0 +1,120 @@
+"""Spatial-grid near-duplicate detection (geo_index + UniversalScraper)."""
+
+import random
+
+import geo_index
+from enhanced_scrapers import ScrapedLocation, UniversalScraper
+from geo_index import (
+    GridIndex,
+    find_duplicates,
+    haversine_m,
+    name_trigrams,
+    trigram_similarity,
+)
+
+
+def _place(name, lat, lng, address="", **kwargs):
+    return ScrapedLocation(
+        name=name, address=address, city="Berlin", latitude=lat, longitude=lng, **kwargs
+    )
+
+
+def test_haversine_and_similarity_basics():
+    # 0.0001° latitude is ~11 m
+    assert 10 < haversine_m(52.5, 13.4, 52.5001, 13.4) < 12
+    assert (
+        trigram_similarity(
+            name_trigrams("Café Einstein"), name_trigrams("cafe einstein")
+        )
+        == 1.0
+    )
+    assert (
+        trigram_similarity(name_trigrams("Mauerpark"), name_trigrams("Tiergarten"))
+        == 0.0
+    )
+    assert trigram_similarity(set(), name_trigrams("Park")) == 0.0
+
+
+def test_grid_neighbours_cover_radius_at_high_latitude():
+    grid = GridIndex(50.0, max_abs_lat=70.0)
+    grid.add(69.9, 20.0, "a")
+    # ~45 m east at 69.9° N
+    lng = 20.0 + 45 / (111320 * 0.3437)
+
+    assert "a" in list(grid.neighbours(69.9, lng))
+    assert "a" not in list(grid.neighbours(69.9, 20.1))
+
+
+def test_find_duplicates_merges_near_similar_names_only():
+    places = [
+        _place("Großer Tiergarten", 52.5145, 13.3501),
+        _place("Tiergarten", 52.51462, 13.35018),  # ~15 m, similar name
+        _place("Café am Neuen See", 52.51475, 13.35030),  # ~35 m, different name
+        _place("Tiergarten", 52.5300, 13.3501),  # similar name but 1.7 km away
+        _place("Cafe Neuer See", 52.5148, 13.3503),  # ~6 m from the café
+        _place("Großer Tiergarten", 0.0, 0.0, address=""),  # same name+address
+    ]
+
+    kept, matches = find_duplicates(places, radius_m=50, name_threshold=0.5)
+
+    assert kept == [0, 2, 3]
+    report = {(m.merged_index, m.kept_index, m.reason) for m in matches}
+    assert report == {(1, 0, "nearby"), (4, 2, "nearby"), (5, 0, "name_address")}
+    nearby = next(m for m in matches if m.merged_index == 1)
+    assert 10 < nearby.distance_m < 20
+    assert nearby.similarity >= 0.5
+
+
+def test_same_spot_merges_regardless_of_name():
+    kept, matches = find_duplicates(
+        [_place("Spielplatz", 52.4, 13.0), _place("Playground", 52.400001, 13.0)]
+    )
+
+    assert kept == [0]
+    assert matches[0].reason == "same_spot"
+
+
+def test_universal_scraper_reports_and_merges_fields():
+    scraper = UniversalScraper({"dedupe_radius_m": 30})
+    places = [
+        _place("Volkspark Friedrichshain", 52.5279, 13.4330, review_count=10),
+        _place(
+            "Volkspark Friedrichshain Berlin",
+            52.52795,
+            13.43305,
+            phone="+49 30 1",
+            review_count=900,
+            rating=4.6,
+        ),
+    ]
+
+    unique = scraper._deduplicate_places(places)
+
+    assert len(unique) == 1
+    assert unique[0].phone == "+49 30 1"
+    assert (unique[0].rating, unique[0].review_count) == (4.6, 900)
+    assert [(m.kept_index, m.merged_index) for m in scraper.last_merge_report] == [
+        (0, 1)
+    ]
+
+
+def test_only_nearby_candidates_are_compared(monkeypatch):
+    rng = random.Random(1)
+    places = [
+        _place(f"Ort {i}", rng.uniform(52.3, 52.7), rng.uniform(13.1, 13.7))
+        for i in range(20000)
+    ]
+
+    distances = []
+    monkeypatch.setattr(
+        geo_index,
+        "haversine_m",
+        lambda *args: distances.append(args) or haversine_m(*args),
+    )
+
+    kept, _ = find_duplicates(places)
+
+    assert len(kept) > 19000
+    # The grid hands out the few places of the 3x3 neighbourhood instead
+    # of the 200 million pairs an all-pairs comparison would check
+    assert 0 < len(distances) < len(places)
@@ -0,0 +1,94 @@
+"""Session factory: per-host pools, gzip, HTTP/2 fallback and reuse metrics."""
+
+import gzip
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import http_session
+from http_session import connection_stats, create_session
+from rate_limiter import RateLimitedAdapter, RateLimiter
+
+
+def _gzip_stub(request):
+    """JSON endpoint that gzips when the client accepts it"""
+    body = json.dumps({"status": "OK", "results": ["x" * 40] * 20}).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    return 200, body, headers
+
+
+@pytest.fixture
+def server(local_server):
+    return local_server(_gzip_stub)
+
+
+def test_sessions_are_pooled_per_host_and_ask_for_gzip():
+    session = create_session(
+        pool_maxsize=4, pool_sizes={"example.com": 16}, user_agent="ua"
+    )
+
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+    assert session.headers["User-Agent"] == "ua"
+    google = session.get_adapter(
+        "https://maps.googleapis.com/maps/api/place/details/json"
+    )
+    example = session.get_adapter("https://example.com/list")
+    other = session.get_adapter("https://other.org/")
+    assert all(isinstance(a, RateLimitedAdapter) for a in (google, example, other))
+    assert google._pool_maxsize == 32
+    assert example._pool_maxsize == 16
+    assert other._pool_maxsize == http_session.DEFAULT_POOL_MAXSIZE
+
+
+def test_concurrent_requests_reuse_connections(server, caplog):
+    session = create_session(
+        rate_limiter=RateLimiter(default_rate=None), pool_maxsize=8
+    )
+
+    with caplog.at_level(logging.WARNING, logger="urllib3"):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(
+                pool.map(lambda i: session.get(f"{server}/p{i}"), range(80))
+            )
+
+    assert all(r.json()["status"] == "OK" for r in responses)
+    assert "pool is full" not in caplog.text
+
+    stats = connection_stats(session)
+    host = stats["hosts"][server[len("http://") :]]
+    assert host["requests"] == 80
+    # At most one connection per worker, everything else is reused
+    assert host["connections"] <= 8
+    assert host["reuse_rate"] >= 0.9
+    assert stats["responses"]["responses"] == 80
+    assert stats["responses"]["compressed"] == 80
+    assert 0 < stats["responses"]["wire_bytes"] < 80 * len(responses[0].content)
+
+
+def test_http2_falls_back_without_httpx(monkeypatch, caplog):
+    monkeypatch.setattr(http_session, "HTTPX_AVAILABLE", False)
+
+    with caplog.at_level(logging.WARNING):
+        session = create_session(http2=True)
+
+    assert isinstance(session, requests.Session)
+    assert "HTTP/1.1" in caplog.text
+
+
+def test_http2_session_uses_the_rate_limiter():
+    pytest.importorskip("h2")
+    pytest.importorskip("httpx")
+    limiter = RateLimiter(default_rate=None)
+
+    session = create_session(rate_limiter=limiter, http2=True)
+
+    assert isinstance(session, http_session.Http2Session)
+    assert session.rate_limiter is limiter
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+    session.close()
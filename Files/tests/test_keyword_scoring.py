@@ -0,0 +1,102 @@
+"""Log-odds keyword scoring for complaint vs praise corpora."""
+
+import random
+from collections import Counter
+
+from keyword_scoring import KeywordScorer
+from niche_research import ReviewDemandAnalyzer
+
+
+def test_shared_words_rank_below_distinctive_ones():
+    complaints = Counter({"park": 40, "toiletten": 12, "dreck": 6, "schatten": 2})
+    praise = Counter({"park": 45, "schatten": 20, "spielplatz": 9, "toiletten": 1})
+
+    scorer = KeywordScorer()
+    complaint_keywords, praise_keywords = scorer.distinctive(complaints, praise)
+    scores = dict(zip(*scorer.log_odds(complaints, praise)[:2]))
+
+    assert [k for k, _ in complaint_keywords][:2] == ["toiletten", "dreck"]
+    assert complaint_keywords[0] == ("toiletten", 12)
+    assert [k for k, _ in praise_keywords][:2] == ["schatten", "spielplatz"]
+    # "park" is the most frequent word on both sides but not distinctive
+    assert abs(scores["park"]) < 1 < scores["toiletten"]
+
+
+def test_background_prior_is_persisted_and_reloaded(tmp_path):
+    path = str(tmp_path / "background.json")
+    scorer = KeywordScorer(background_path=path)
+    scorer.update_background(
+        "parks|berlin",
+        Counter({"park": 3}),
+        Counter({"park": 2, "bank": 1}),
+        documents=4,
+    )
+    scorer.update_background("zoos|berlin", Counter({"zoo": 2}), documents=1)
+
+    reloaded = KeywordScorer(background_path=path)
+
+    assert reloaded.background == Counter({"park": 5, "bank": 1, "zoo": 2})
+    assert reloaded.background_documents == 5
+
+
+def test_reanalysed_corpus_replaces_its_background_counts():
+    scorer = KeywordScorer()
+    for _ in range(3):
+        scorer.update_background("parks|berlin", Counter({"park": 3}), documents=2)
+    scorer.update_background("parks|potsdam", Counter({"park": 1}), documents=1)
+
+    assert scorer.background == Counter({"park": 4})
+    assert scorer.background_documents == 3
+
+    scorer.update_background("parks|berlin", Counter({"wiese": 1}), documents=1)
+    assert scorer.background == Counter({"park": 1, "wiese": 1})
+
+
+def test_background_shrinks_rare_contrasts():
+    complaints, praise = Counter({"kiosk": 3}), Counter({"wiese": 3})
+    plain = dict(zip(*KeywordScorer().log_odds(complaints, praise)[:2]))
+
+    seasoned = KeywordScorer()
+    seasoned.background = Counter({"kiosk": 5000, "wiese": 5000})
+    shrunk = dict(zip(*seasoned.log_odds(complaints, praise)[:2]))
+
+    assert 0 < shrunk["kiosk"] < plain["kiosk"]
+
+
+def test_analyzer_extends_background(tmp_path):
+    path = str(tmp_path / "background.json")
+    analyzer = ReviewDemandAnalyzer(api_key="test", delay=0, keyword_background=path)
+    reviews = [
+        {"rating": 1, "text": "Keine Toiletten vorhanden", "author": "a", "time": 0},
+        {"rating": 5, "text": "Wunderbarer Spielplatz", "author": "b", "time": 0},
+    ]
+    analyzer.iter_reviews_for_category = lambda *args, **kwargs: iter(reviews)
+
+    analysis = analyzer.analyze_review_sentiment("parks", "Berlin", min_reviews=1)
+
+    assert ("toiletten", 1) in analysis["complaint_keywords"]
+    assert KeywordScorer(background_path=path).background["spielplatz"] == 1
+
+    analyzer.invalidate_analysis()
+    analyzer.analyze_review_sentiment("parks", "Berlin", min_reviews=1)
+    assert KeywordScorer(background_path=path).background["spielplatz"] == 1
+
+
+def test_scoring_large_vocabulary():
+    rng = random.Random(5)
+    words = [f"wort{i}" for i in range(30000)]
+    complaints = Counter(rng.choice(words) for _ in range(300000))
+    praise = Counter(rng.choice(words) for _ in range(300000))
+    # Planted terms stand out against 30k words of random noise
+    complaints.update({"müll": 400, "lärm": 300})
+    praise.update({"aussicht": 400})
+
+    scorer = KeywordScorer()
+    complaint_keywords, praise_keywords = scorer.distinctive(complaints, praise)
+    terms, z, counts = scorer.log_odds(complaints, praise)
+
+    assert len(complaint_keywords) == len(praise_keywords) == 20
+    assert [k for k, _ in complaint_keywords[:2]] == ["müll", "lärm"]
+    assert praise_keywords[0] == ("aussicht", 400)
+    assert len(terms) == len(z) == counts.shape[1] == len(set(complaints) | set(praise))
+    assert counts.sum() == sum(complaints.values()) + sum(praise.values())
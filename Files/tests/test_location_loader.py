@@ -0,0 +1,133 @@
+"""Vectorized CSV ingestion (location_loader)."""
+
+
+import numpy as np
+import pandas as pd
+
+from data_pipeline import LocationData
+from enhanced_scrapers import CSVDataLoader, ScrapedLocation
+from location_loader import load_location_data, normalize_bool
+
+
+def test_normalize_bool_semantics():
+    series = pd.Series(["TRUE", "false", "Ja", "nein", "y", "1", "0", None, "False"])
+
+    assert normalize_bool(series).tolist() == [
+        True,
+        False,
+        True,
+        False,
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert normalize_bool(pd.Series([None, "no"]), default=True).tolist() == [
+        True,
+        False,
+    ]
+    assert normalize_bool(pd.Series([1.0, 0.0, np.nan])).tolist() == [
+        True,
+        False,
+        False,
+    ]
+    assert normalize_bool(pd.Series([True, False])).tolist() == [True, False]
+
+
+def test_load_location_data_coerces_and_resolves_aliases(tmp_path):
+    csv_path = tmp_path / "locations.csv"
+    csv_path.write_text(
+        "name,address,city,postcode,lat,lng,website,rating,review_count,"
+        "feature_shade,feature_fee\n"
+        "Park A,Weg 1,Potsdam,14467,52.4,13.0,https://a.de,4.5,120,False,\n"
+        "Park B,,Potsdam,,52.5,13.1,,,n/a,JA,no\n",
+        encoding="utf-8",
+    )
+
+    first, second = load_location_data(str(csv_path))
+
+    assert isinstance(first, LocationData)
+    assert (first.id, second.id) == ("0", "1")
+    assert first.street == "Weg 1"
+    assert second.street == ""
+    assert first.postcode == "14467"
+    assert second.postcode == ""
+    assert (first.latitude, first.longitude) == (52.4, 13.0)
+    assert first.url == "https://a.de"
+    assert first.country == "Deutschland"
+    assert (second.rating, second.review_count) == (0.0, 0)
+    assert isinstance(first.review_count, int)
+    # bool("False") would have been True
+    assert first.feature_shade is False
+    assert second.feature_shade is True
+    # Empty fee cell keeps the dataclass default (costs money)
+    assert first.feature_fee is True
+    assert second.feature_fee is False
+    assert first.feature_water is False
+
+
+def test_csv_data_loader_builds_scraped_locations(tmp_path):
+    csv_path = tmp_path / "collected.csv"
+    pd.DataFrame(
+        {
+            "name": ["Cafe", "Bar"],
+            "address": ["Str. 1", None],
+            "lat": [52.1, 52.2],
+            "lng": [13.1, 13.2],
+            "rating": [4.0, None],
+            "review_count": [10, 3],
+            "place_id": ["pid-1", "pid-2"],
+        }
+    ).to_csv(csv_path, index=False)
+
+    places = CSVDataLoader.load_csv(str(csv_path))
+
+    assert [type(p) for p in places] == [ScrapedLocation, ScrapedLocation]
+    assert places[0].latitude == 52.1
+    assert places[1].address == ""
+    assert places[1].rating == 0.0
+    assert places[0].place_id == "pid-1"
+    assert places[0].categories == []
+
+
+def test_hundred_thousand_rows_load_column_wise(monkeypatch):
+    rows = 100_000
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "name": [f"Ort {i}" for i in range(rows)],
+            "street": "Hauptstraße 1",
+            "city": "Berlin",
+            "postcode": 10115,
+            "latitude": rng.uniform(52.3, 52.7, rows),
+            "longitude": rng.uniform(13.1, 13.7, rows),
+            "rating": rng.uniform(1, 5, rows).round(1),
+            "review_count": rng.integers(0, 5000, rows),
+            "feature_shade": rng.choice(["TRUE", "FALSE"], rows),
+            "feature_water": rng.choice([True, False], rows),
+            "feature_fee": rng.choice(["ja", "nein", ""], rows),
+        }
+    )
+
+    def row_wise(*args, **kwargs):
+        raise AssertionError("rows must not be visited one by one in pandas")
+
+    for name in ("iterrows", "itertuples", "apply"):
+        monkeypatch.setattr(pd.DataFrame, name, row_wise)
+    monkeypatch.setattr(pd.Series, "apply", row_wise)
+
+    locations = load_location_data(df)
+
+    assert len(locations) == rows
+    last = locations[-1]
+    assert last.id == str(rows - 1) and last.postcode == "10115"
+    assert last.latitude == df["latitude"].iloc[-1]
+    assert last.review_count == df["review_count"].iloc[-1]
+    assert (
+        sum(loc.feature_shade for loc in locations)
+        == (df["feature_shade"] == "TRUE").sum()
+    )
+    assert sum(loc.feature_water for loc in locations) == df["feature_water"].sum()
+    assert all(type(loc.feature_fee) is bool for loc in locations[:100])
@@ -0,0 +1,164 @@
+"""SQLite LocationRepository: upsert by place_id, filters and FTS5 search."""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from location_loader import load_location_data
+from location_repository import LocationRepository, place_key
+from location_store import read_location_frame
+from niche_research import NicheValidator
+
+
+def _places():
+    return [
+        {
+            "name": "Park am See",
+            "address": "Seeweg 1",
+            "lat": 52.39,
+            "lng": 13.06,
+            "rating": 4.5,
+            "review_count": 120,
+            "place_id": "p1",
+            "feature_water": True,
+            "feature_dogs_allowed": "JA",
+            "reviews_text": "Schöner Badestrand, leider keine Toiletten",
+        },
+        {
+            "name": "Spielplatz Nord",
+            "address": "Nordallee 2",
+            "rating": 4.0,
+            "review_count": 30,
+            "place_id": "p2",
+            "feature_kids_friendly": True,
+        },
+    ]
+
+
+def test_upsert_updates_known_places_and_keeps_earlier_runs(tmp_path):
+    repo = LocationRepository(str(tmp_path / "locations.sqlite"))
+
+    assert repo.upsert(_places(), category="Parks", city="Potsdam") == 2
+    update = {
+        "name": "Park am See",
+        "place_id": "p1",
+        "rating": 4.7,
+        "review_count": 130,
+    }
+    repo.upsert([update], category="", city="Potsdam")
+    repo.upsert(
+        [{"name": "Waldbad", "address": "Waldweg 3", "city": "Potsdam"}],
+        category="Baden",
+    )
+
+    df = repo.query()
+    assert df["place_id"].tolist()[:2] == ["p1", "p2"]
+    assert len(df) == 3
+    park = df.iloc[0]
+    assert (park["rating"], park["review_count"]) == (4.7, 130)
+    # Empty values do not blank out what an earlier run stored
+    assert park["category"] == "Parks"
+    assert repo.count(text="toiletten") == 1
+    assert df.iloc[2]["place_id"] == place_key("", "Waldbad", "Waldweg 3", "Potsdam")
+
+
+def test_query_filters_by_city_category_and_features(tmp_path):
+    repo = LocationRepository(str(tmp_path / "locations.sqlite"))
+    repo.upsert(_places(), category="Parks", city="Potsdam")
+    repo.upsert(
+        [{"name": "Tiergarten", "place_id": "b1", "feature_water": 1}],
+        "Parks",
+        "Berlin",
+    )
+
+    assert repo.query(city="potsdam")["place_id"].tolist() == ["p1", "p2"]
+    assert repo.query(category="parks", features=["water"])["place_id"].tolist() == [
+        "p1",
+        "b1",
+    ]
+    assert repo.query(city="Potsdam", features=["feature_dogs_allowed"])[
+        "feature_dogs_allowed"
+    ].tolist() == [True]
+    assert repo.query(limit=1, offset=1)["place_id"].tolist() == ["p2"]
+    with pytest.raises(ValueError):
+        repo.query(features=["sauna"])
+
+    plan = repo._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM locations WHERE feature_water = 1"
+    ).fetchall()
+    assert "idx_locations_feature_water" in str(plan)
+
+
+def test_reviews_feed_full_text_search(tmp_path):
+    repo = LocationRepository(str(tmp_path / "locations.sqlite"))
+    repo.upsert(_places(), category="Parks", city="Potsdam")
+
+    reviews = [
+        {
+            "author": "a",
+            "time": 1,
+            "rating": 2,
+            "text": "Spielgeräte kaputt und kein Schatten",
+        },
+        {"author": "b", "time": 2, "rating": 5, "text": "Toll für Kinder"},
+    ]
+    assert repo.add_reviews("p2", reviews) == 2
+    assert repo.add_reviews("p2", reviews[:1]) == 0
+    assert [r["author"] for r in repo.reviews("p2")] == ["a", "b"]
+
+    assert repo.search("schatten")["place_id"].tolist() == ["p2"]
+    assert repo.search("kind*")["place_id"].tolist() == ["p2"]
+    assert repo.query(text="badestrand OR kaputt")["place_id"].tolist() == ["p1", "p2"]
+
+
+def test_consumers_read_the_repository(tmp_path):
+    path = tmp_path / "locations.sqlite"
+    repo = LocationRepository(str(path))
+    repo.upsert(_places(), category="Parks", city="Potsdam")
+
+    locations = load_location_data(str(path))
+    assert [loc.id for loc in locations] == ["p1", "p2"]
+    assert locations[0].street == "Seeweg 1" and locations[0].feature_water is True
+    assert [loc.name for loc in repo.to_locations(features=["kids_friendly"])] == [
+        "Spielplatz Nord"
+    ]
+
+    validator = NicheValidator(
+        config_path=str(tmp_path / "missing.json"), data_sources=[path]
+    )
+    assert validator.feature_stats.loc["feature_water", "total_reviews"] == 120
+
+    csv_path = tmp_path / "export.csv"
+    assert repo.export_csv(str(csv_path), city="Potsdam") == 2
+    assert pd.read_csv(csv_path)["place_id"].tolist() == ["p1", "p2"]
+
+
+def test_readers_open_the_repository_read_only(tmp_path):
+    path = tmp_path / "locations.sqlite"
+    repo = LocationRepository(str(path))
+    repo.upsert(_places(), category="Parks", city="Potsdam")
+    repo.close()
+    before = path.stat().st_mtime_ns
+
+    assert read_location_frame(path)["id"].tolist() == ["p1", "p2"]
+    reader = LocationRepository(str(path), read_only=True)
+    with pytest.raises(sqlite3.OperationalError):
+        reader.upsert(_places())
+    reader.close()
+    assert path.stat().st_mtime_ns == before
+
+    # A missing file is not created, a foreign database is not migrated
+    with pytest.raises(sqlite3.OperationalError):
+        read_location_frame(tmp_path / "missing.sqlite")
+    assert not (tmp_path / "missing.sqlite").exists()
+    other = tmp_path / "other.db"
+    sqlite3.connect(str(other)).execute(
+        "CREATE TABLE notes (text TEXT)"
+    ).connection.commit()
+    with pytest.raises(ValueError):
+        read_location_frame(other)
+    tables = (
+        sqlite3.connect(str(other)).execute("SELECT name FROM sqlite_master").fetchall()
+    )
+    assert tables == [("notes",)]
@@ -0,0 +1,146 @@
+"""Canonical location frames and the Parquet LocationStore."""
+
+import pandas as pd
+import pytest
+
+from location_loader import canonical_frame, load_location_data
+
+ACTIVE_ROWS = pd.DataFrame(
+    {
+        "name": ["Park am See", "Spielplatz Nord"],
+        "street": ["Seeweg 1", "Nordallee 2"],
+        "city": ["Potsdam", "Potsdam"],
+        "postcode": [14467.0, None],
+        "lat": [52.39, 52.41],
+        "lng": [13.06, 13.05],
+        "rating": ["4.5", "n/a"],
+        "review_count": [120, None],
+        "feature_water": ["JA", "nein"],
+        "feature_fee": [None, "false"],
+        "tags": ["see,baden", None],
+    }
+)
+
+SCRAPED_ROWS = [
+    {
+        "name": "Waldbad",
+        "address": "Waldweg 3",
+        "city": "Potsdam",
+        "latitude": 52.37,
+        "longitude": 13.02,
+        "rating": 4.1,
+        "review_count": 40,
+        "website": "https://waldbad.example",
+        "price_level": 2,
+        "feature_water": True,
+        "feature_restaurant": True,
+    }
+]
+
+
+def test_canonical_frame_maps_aliases_and_types():
+    df = canonical_frame(ACTIVE_ROWS)
+
+    assert list(df.columns)[:4] == ["id", "name", "street", "city"]
+    assert "lat" not in df.columns and "feature_restaurant" not in df.columns
+    assert df["latitude"].tolist() == [52.39, 52.41]
+    assert df["postcode"].tolist() == ["14467", ""]
+    assert df["rating"].tolist() == [4.5, 0.0]
+    assert df["review_count"].dtype == "int64"
+    assert df["feature_water"].tolist() == [True, False]
+    # Missing flags take the dataclass default (fee defaults to True)
+    assert df["feature_fee"].tolist() == [True, False]
+    assert df["country"].tolist() == ["Deutschland", "Deutschland"]
+
+
+def test_store_appends_reads_and_exports(tmp_path):
+    pytest.importorskip("pyarrow")
+    from location_store import LocationStore
+
+    store = LocationStore(tmp_path / "locations")
+    assert store.read().empty
+
+    assert store.append(ACTIVE_ROWS) == 2
+    assert store.append(SCRAPED_ROWS) == 1
+    assert len(store.parts()) == 2
+    assert len(store) == 3
+
+    df = store.read()
+    assert df["name"].tolist() == ["Park am See", "Spielplatz Nord", "Waldbad"]
+    assert df["id"].tolist() == ["0", "1", "2"]
+    assert df.loc[2, "street"] == "Waldweg 3"
+    assert df.loc[2, "url"] == "https://waldbad.example"
+    assert df["place_id"].str.startswith("local:").all()
+    assert store.read(["name", "rating"]).columns.tolist() == ["name", "rating"]
+
+    locations = store.to_locations()
+    assert locations[0].feature_water is True
+    assert locations[1].rating == 0.0
+
+    csv_path = tmp_path / "export.csv"
+    assert store.export_csv(csv_path) == 3
+    other = LocationStore(tmp_path / "copy")
+    assert other.import_csv(csv_path) == 3
+    assert other.read().equals(df)
+
+
+def test_compact_merges_parts_and_readers_accept_store_paths(tmp_path):
+    pytest.importorskip("pyarrow")
+    from location_store import LocationStore
+    from niche_research import NicheValidator
+
+    path = tmp_path / "locations"
+    store = LocationStore(path)
+    for _ in range(3):
+        store.append(ACTIVE_ROWS)
+    before = store.read()
+
+    assert store.compact() == 3
+    assert len(store.parts()) == 1
+    assert store.read().equals(before)
+
+    assert [loc.name for loc in load_location_data(str(path))][:2] == [
+        "Park am See",
+        "Spielplatz Nord",
+    ]
+    validator = NicheValidator(
+        config_path=str(tmp_path / "missing.json"), data_sources=[path]
+    )
+    assert len(validator.analytics_df) == 2
+    assert validator.feature_stats.loc["feature_water", "locations"] == 1
+
+
+def test_read_keeps_newest_row_per_place_and_filters(tmp_path):
+    pytest.importorskip("pyarrow")
+    from location_store import LocationStore
+
+    store = LocationStore(tmp_path / "locations")
+    store.append(ACTIVE_ROWS, category="parks")
+    store.append(
+        [{"place_id": "g1", "name": "Waldbad", "city": "Potsdam", "rating": 3.9}],
+        category="pools",
+    )
+    # A later run collects both again with fresh data
+    store.append(ACTIVE_ROWS.assign(rating=["4.8", "4.0"]), category="parks")
+    store.append(
+        [{"place_id": "g1", "name": "Waldbad", "city": "Potsdam", "rating": 4.2}],
+        category="pools",
+    )
+    assert len(store) == 6
+
+    df = store.read()
+    assert sorted(df["name"]) == ["Park am See", "Spielplatz Nord", "Waldbad"]
+    assert df.set_index("name")["rating"].to_dict() == {
+        "Park am See": 4.8,
+        "Spielplatz Nord": 4.0,
+        "Waldbad": 4.2,
+    }
+    assert store.read(category="POOLS")["place_id"].tolist() == ["g1"]
+    assert store.read(["name"], city="potsdam", category="parks").columns.tolist() == [
+        "name"
+    ]
+    assert store.read(city="Berlin").empty
+
+    assert store.compact() == 4
+    assert len(store) == 3
+    assert store.read().equals(df)
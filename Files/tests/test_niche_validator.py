@@ -0,0 +1,229 @@
+"""Vectorized niche analytics in NicheValidator."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from location_repository import LocationRepository
+from niche_research import NicheValidator, NicheValidatorService
+
+
+def _validator(tmp_path, df):
+    path = tmp_path / "locations.csv"
+    df.to_csv(path, index=False)
+    return NicheValidator(
+        config_path=str(tmp_path / "missing.json"), data_sources=[Path(path)]
+    )
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "name": ["A", "B", "C", "D", "E"],
+            "rating": [4.0, 5.0, None, 3.0, 4.5],
+            "review_count": [100, 0, 50, 1000, 10],
+            "tags": ["See, Grill", "Wiese", None, "Grill,,Wald", "Wiese,See"],
+            "feature_shade": ["TRUE", "ja", "false", "1", ""],
+            "feature_toilets": [0, 0, 1, 1, 0],
+            "feature_parking": ["no", "nein", None, "", "FALSE"],
+        }
+    )
+
+
+def test_features_are_normalized_once_and_aggregated(tmp_path):
+    validator = _validator(tmp_path, _frame())
+
+    assert validator.analytics_df["feature_shade"].dtype == bool
+    stats = validator.feature_stats
+    assert stats.loc["feature_shade", "locations"] == 3
+    assert stats.loc["feature_shade", "total_reviews"] == 1100
+    assert (
+        stats.loc["feature_toilets", "rating_mean"] == 1.5
+    )  # missing rating counts as 0
+
+    niches = {n["feature_column"]: n for n in validator.niches}
+    assert set(niches) == {"feature_shade", "feature_toilets"}
+    assert niches["feature_shade"]["analytics"] == {
+        "locations": 3,
+        "total_reviews": 1100,
+        "avg_rating": 4.0,
+    }
+    assert [n["feature_column"] for n in validator.niches] == [
+        "feature_shade",
+        "feature_toilets",
+    ]
+
+
+def test_tags_are_review_weighted_and_skip_missing_values(tmp_path):
+    validator = _validator(tmp_path, _frame())
+    niches = {n["feature_column"]: n for n in validator.niches}
+
+    # Grill 100+1000, Wald 1000, See 100, Wiese 1 (0 reviews weigh 1)
+    assert niches["feature_shade"]["facets"] == ["Grill", "Wald", "See", "Wiese"]
+    # Row C has no tags at all - no "nan" facet
+    assert niches["feature_toilets"]["facets"] == ["Grill", "Wald"]
+    # B (Wiese, 0 reviews) and E (Wiese, See, 10 reviews): Wiese 1+10, See 10
+    selected = validator.analytics_df.iloc[[1, 4]].assign(selected=True)
+    assert NicheValidator._rank_tags(selected, ["selected"]) == {
+        "selected": ["Wiese", "See"]
+    }
+    assert NicheValidator._rank_tags(selected, []) == {}
+
+
+def test_analyze_niche_uses_precomputed_stats(tmp_path):
+    validator = _validator(tmp_path, _frame())
+
+    analysis = validator.analyze_niche("Schattenplätze")
+
+    assert analysis["analytics"]["locations"] == 3
+    assert analysis["opportunity_score"] > 0
+    assert "error" in validator.analyze_niche("Unbekannt")
+
+    # One KeywordResearch (and HTTP session) serves every analysis
+    researcher = validator.keyword_research
+    validator.analyze_niche("Schattenplätze")
+    assert validator.keyword_research is researcher
+
+
+def test_100k_locations_are_normalized_once_per_column(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    rows = 100_000
+    df = pd.DataFrame(
+        {
+            "rating": rng.uniform(1, 5, rows).round(1),
+            "review_count": rng.integers(0, 500, rows),
+            "tags": rng.choice(["See,Grill", "Wiese", "Wald,See,Hunde", ""], rows),
+            **{
+                f"feature_f{i}": rng.choice(["TRUE", "FALSE", ""], rows)
+                for i in range(8)
+            },
+        }
+    )
+    path = tmp_path / "big.csv"
+    df.to_csv(path, index=False)
+
+    normalized = []
+    normalize = NicheValidator._normalize_bool
+    monkeypatch.setattr(
+        NicheValidator,
+        "_normalize_bool",
+        staticmethod(
+            lambda series: normalized.append(series.name) or normalize(series)
+        ),
+    )
+
+    validator = NicheValidator(
+        config_path=str(tmp_path / "missing.json"), data_sources=[Path(path)]
+    )
+
+    assert len(validator.niches) == 8
+    assert sorted(normalized) == [f"feature_f{i}" for i in range(8)]
+    shade = df["feature_f3"] == "TRUE"
+    stats = validator.feature_stats.loc["feature_f3"]
+    assert stats["locations"] == shade.sum()
+    assert stats["total_reviews"] == df.loc[shade, "review_count"].sum()
+
+
+def _touch(path, text):
+    """Rewrite ``path`` with a guaranteed new mtime"""
+    before = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+def test_service_reuses_validator_until_a_source_changes(tmp_path, monkeypatch):
+    parks, cafes = tmp_path / "parks.csv", tmp_path / "cafes.csv"
+    _frame().to_csv(parks, index=False)
+    _frame().assign(name=list("VWXYZ")).to_csv(cafes, index=False)
+    config = tmp_path / "config.json"
+
+    reads = []
+    original = NicheValidator._read_source
+    monkeypatch.setattr(
+        NicheValidator,
+        "_read_source",
+        staticmethod(lambda p: reads.append(p.name) or original(p)),
+    )
+    service = NicheValidatorService(str(config), [parks, cafes, tmp_path / "later.csv"])
+
+    validator = service.get()
+    recommendations = service.get_niche_recommendations()
+    assert len(validator.analytics_df) == 10
+    assert service.get() is validator
+    assert service.get_niche_recommendations() is recommendations
+    assert service.builds == 1
+    assert sorted(reads) == ["cafes.csv", "later.csv", "parks.csv"]
+
+    # Only the changed CSV is read again
+    reads.clear()
+    _touch(cafes, "name,feature_shade,review_count\nNeu,TRUE,5\n")
+    validator = service.get()
+    assert reads == ["cafes.csv"]
+    assert len(validator.analytics_df) == 6
+    assert service.get_niche_recommendations() is not recommendations
+
+    # A config change and a newly created source also trigger a rebuild
+    _touch(config, json.dumps({"city": "Potsdam"}))
+    assert service.get().niches[0]["cities"] == ["Potsdam"]
+    _touch(tmp_path / "later.csv", "name,feature_shade\nSpät,ja\n")
+    assert len(service.get().analytics_df) == 7
+    assert service.builds == 4
+
+
+def test_repository_is_queried_for_the_city_instead_of_its_exports(
+    tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    repo = LocationRepository("data/locations.sqlite")
+    places = _frame().assign(
+        place_id=[f"p{i}" for i in range(5)], city=["Potsdam"] * 3 + ["Berlin"] * 2
+    )
+    repo.upsert(places, category="Parks")
+    # The GUI preview and collection runs write the same places as CSV
+    repo.query(city="Potsdam").to_csv("data/active.csv", index=False)
+    places.to_csv("data/collected_data.csv", index=False)
+    pd.DataFrame({"name": ["Extra"], "feature_shade": [True]}).to_csv(
+        "data/babelsberg_locations.csv", index=False
+    )
+
+    validator = NicheValidator(config={"city": "Potsdam"})
+    assert sorted(validator.analytics_df["name"]) == ["A", "B", "C", "Extra"]
+    assert validator.feature_stats.loc["feature_shade", "locations"] == 3
+
+    # Without places for the city the CSV sources are used as before
+    validator = NicheValidator(config={"city": "Hamburg"})
+    assert len(validator.analytics_df) == 1 + 3 + 5
+
+    _touch(Path("config.json"), json.dumps({"city": "Berlin"}))
+    service = NicheValidatorService("config.json")
+    assert sorted(service.get().analytics_df["name"]) == ["D", "E", "Extra"]
+    assert service.get() is service.get()
+    repo.upsert([{"place_id": "p9", "name": "F", "city": "Berlin"}], category="Parks")
+    repo.close()
+    os.utime("data/locations.sqlite", ns=(time.time_ns() + 10**9,) * 2)
+    assert sorted(service.get().analytics_df["name"]) == ["D", "E", "Extra", "F"]
+    assert service.builds == 2
+
+
+def test_store_is_skipped_while_the_repository_has_the_city(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from location_store import LocationStore
+
+    monkeypatch.chdir(tmp_path)
+    places = _frame().assign(place_id=[f"p{i}" for i in range(5)], city="Potsdam")
+    # A scraper run writes the same places to the store and the repository
+    LocationStore("data/locations").append(places, category="Parks")
+    repo = LocationRepository("data/locations.sqlite")
+    repo.upsert(places.iloc[:3], category="Parks")
+    repo.close()
+
+    validator = NicheValidator(config={"city": "Potsdam"})
+    assert sorted(validator.analytics_df["name"]) == ["A", "B", "C"]
+
+    validator = NicheValidator(config={"city": "Hamburg"})
+    assert sorted(validator.analytics_df["name"]) == ["A", "B", "C", "D", "E"]
@@ -0,0 +1,66 @@
+"""Precompiled template segments and slots (page_template)."""
+
+import os
+
+from page_template import CompiledTemplate, load_template
+
+TEMPLATE = """<html><head><title>{{CITY}} – {{CATEGORY}}</title>
+<script type="application/ld+json">
+  {"name": "{{CATEGORY}} in {{CITY}}"}
+</script>
+<script src="x?client=ca-pub-XXXXXXXXXXXXXXXX"></script>
+</head><body><h1>{{CITY}}</h1>
+<script>const DATA = [ ];</script></body></html>"""
+
+
+def test_render_fills_every_slot_in_one_pass():
+    template = CompiledTemplate(TEMPLATE)
+
+    assert template.slots == {
+        "city",
+        "category",
+        "schema",
+        "adsense",
+        "head_end",
+        "data",
+    }
+    html = template.render(
+        {
+            "city": "Köln",
+            "category": "Parks",
+            "schema": "<SCHEMA>",
+            "data": "const DATA = [1]; // Original: [",
+        }
+    )
+
+    assert html.startswith("<html><head><title>Köln – Parks</title>\n<SCHEMA>\n")
+    assert "<h1>Köln</h1>" in html
+    assert "const DATA = [1]; // Original: [ ];" in html
+    # Unfilled slots keep the template text
+    assert "ca-pub-XXXXXXXXXXXXXXXX" in html
+    assert "</head>" in html
+
+
+def test_render_does_not_interpret_replacement_text():
+    template = CompiledTemplate(TEMPLATE)
+
+    html = template.render({"schema": r'{"name": "C:\\temp \1 {{CITY}}"}', "city": "X"})
+
+    assert r'{"name": "C:\\temp \1 {{CITY}}"}' in html
+
+
+def test_load_template_is_cached_until_file_changes(tmp_path):
+    path = tmp_path / "template.html"
+    path.write_text(TEMPLATE, encoding="utf-8")
+
+    first = load_template(str(path))
+    assert load_template(str(path)) is first
+
+    path.write_text(TEMPLATE.replace("<h1>", "<h2>"), encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_template(str(path))
+    assert second is not first
+    assert second.hash != first.hash
+    assert "<h2>" in second.render({})
@@ -0,0 +1,90 @@
+"""Tuple n-gram phrase counting and the Space-Saving top-k sketch."""
+
+import itertools
+import random
+import re
+from collections import Counter
+
+from niche_research import ReviewDemandAnalyzer
+from phrase_engine import (
+    GENERIC_PHRASE_PATTERN,
+    SpaceSaving,
+    is_generic_ngram,
+    sentence_ngrams,
+)
+
+
+def _string_ngrams(sentence):
+    """Reference: the former string-based extraction"""
+    words = re.sub(r"[^\w\s]", " ", sentence).split()
+    phrases = []
+    for n in [2, 3, 4]:
+        for i in range(len(words) - n + 1):
+            phrase = " ".join(words[i : i + n])
+            if len(phrase) >= 8 and not GENERIC_PHRASE_PATTERN.match(phrase):
+                phrases.append(phrase)
+    return phrases
+
+
+def test_tuple_ngrams_match_string_ngrams():
+    sentence = "das ist leider keine toilette, die sind kaputt - sehr schade im it-park"
+    words = re.findall(r"\w+", sentence)
+
+    assert [" ".join(g) for g in sentence_ngrams(words)] == _string_ngrams(sentence)
+
+
+def test_generic_prefix_check_matches_pattern():
+    firsts = ["das", "die", "sehr", "gut", "it", "this", "park"]
+    seconds = ["ist", "istanbul", "sind", "is", "isle", "toll"]
+    for gram in itertools.product(firsts, seconds):
+        expected = GENERIC_PHRASE_PATTERN.match(" ".join(gram)) is not None
+        assert is_generic_ngram(gram) == expected, gram
+
+
+def test_space_saving_is_exact_below_capacity():
+    rng = random.Random(7)
+    keys = [rng.choice("abcdefghij") for _ in range(5000)]
+
+    sketch = SpaceSaving(capacity=10)
+    sketch.update(keys)
+
+    assert sketch.most_common() == Counter(keys).most_common()
+    assert sketch.total == 5000
+
+
+def test_space_saving_keeps_heavy_hitters_with_bounded_error():
+    rng = random.Random(11)
+    heavy = [f"heavy{i}" for i in range(5)]
+    stream = []
+    for _ in range(20000):
+        stream.append(
+            rng.choice(heavy) if rng.random() < 0.3 else f"tail{rng.randrange(50000)}"
+        )
+    truth = Counter(stream)
+
+    sketch = SpaceSaving(capacity=100)
+    sketch.update(stream)
+
+    assert len(sketch) == 100
+    assert {key for key, _ in sketch.most_common(5)} == set(heavy)
+    for key, count in sketch.most_common():
+        assert count - sketch.error(key) <= truth[key] <= count
+
+
+def test_phrase_memory_stays_fixed_over_many_reviews():
+    analyzer = ReviewDemandAnalyzer(api_key="test", delay=0)
+    rng = random.Random(3)
+    texts = [
+        f"Leider keine Toiletten und kaputte Bank {rng.randrange(10**6)} am Weg {i}"
+        for i in range(30000)
+    ]
+
+    counts = SpaceSaving(50 * analyzer.PHRASE_SKETCH_FACTOR)
+    for text in texts:
+        analyzer._count_phrases(text, True, counts)
+    top = analyzer._top_phrases(counts, 12)
+
+    assert len(counts) == 50 * analyzer.PHRASE_SKETCH_FACTOR
+    # Phrases of every review survive the churn of 30k distinct tails
+    assert ("leider keine toiletten", 30000) in top
+    assert ("kaputte bank", 30000) in top
@@ -0,0 +1,106 @@
+"""Concurrent Place Details enrichment against a local HTTP stub."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import rate_limiter
+from enhanced_scrapers import GooglePlacesScraper, ScrapedLocation, TokenBucket
+
+
+class _DetailsStub:
+    """Minimal stand-in for the Places Details endpoint."""
+
+    def __init__(self, latency=0.2):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            place_id = request.query["place_id"]
+            if place_id.startswith("broken"):
+                return 500, b""
+            return 200, {
+                "status": "OK",
+                "result": {
+                    "international_phone_number": f"+49 {place_id}",
+                    "website": f"https://example.com/{place_id}",
+                    "reviews": [{"text": f"Review for {place_id}"}],
+                },
+            }
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def stub():
+    return _DetailsStub()
+
+
+@pytest.fixture
+def details_server(local_server, stub):
+    return local_server(stub)
+
+
+def _places(count):
+    return [
+        ScrapedLocation(name=f"Park {i}", address="", city="Berlin", place_id=f"p{i}")
+        for i in range(count)
+    ]
+
+
+def test_concurrent_enrichment_keeps_order_and_overlaps_requests(details_server, stub):
+    scraper = GooglePlacesScraper(
+        api_key="test", delay=1.0, max_concurrency=5, requests_per_second=100
+    )
+    scraper.base_url = details_server
+
+    places = _places(10)
+    enriched = scraper.enrich_places(places, concurrent=True)
+
+    assert [p.name for p in enriched] == [p.name for p in places]
+    assert all(p.phone == f"+49 {p.place_id}" for p in enriched)
+    assert enriched[3].reviews_text == "Review for p3"
+    assert 1 < stub.max_in_flight <= 5
+
+
+def test_concurrent_enrichment_falls_back_to_original_place(details_server):
+    scraper = GooglePlacesScraper(api_key="test", requests_per_second=100)
+    scraper.base_url = details_server
+
+    places = _places(2) + [
+        ScrapedLocation(name="Broken", address="", city="Berlin", place_id="broken"),
+        ScrapedLocation(name="No ID", address="", city="Berlin"),
+    ]
+    enriched = scraper.enrich_places(places, concurrent=True)
+
+    assert [p.name for p in enriched] == ["Park 0", "Park 1", "Broken", "No ID"]
+    assert enriched[2].phone == ""
+    assert enriched[3].phone == ""
+    assert enriched[0].website == "https://example.com/p0"
+
+
+def test_token_bucket_paces_requests_after_burst(monkeypatch):
+    # Frozen clock: the waits depend only on the reservations
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=lambda: 100.0))
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    waits = [bucket._reserve() for _ in range(6)]
+
+    # Two tokens are available immediately, the remaining four arrive at 20/s
+    assert waits == pytest.approx([0.0, 0.0, 0.05, 0.1, 0.15, 0.2])
+
+
+def test_token_bucket_without_rate_never_waits():
+    bucket = TokenBucket(rate=None)
+
+    assert all(bucket._reserve() == 0.0 for _ in range(100))
@@ -0,0 +1,135 @@
+"""Paginated, pipelined DataScraper.scrape_google_places against a local HTTP stub."""
+
+import csv
+import threading
+import time
+
+import pytest
+
+from data_pipeline import DataScraper
+
+
+class _PlacesStub:
+    """Text search with three pages of 20 results plus a Details endpoint."""
+
+    def __init__(self, page_latency=0.1, details_latency=0.2):
+        self.page_latency = page_latency
+        self.details_latency = details_latency
+        self.requests = []
+        self.token_attempts = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        query = request.query
+        with self.lock:
+            self.requests.append((request.path, query, time.monotonic()))
+
+        if request.path.endswith("/textsearch/json"):
+            time.sleep(self.page_latency)
+            page = int(query["pagetoken"][4:]) if "pagetoken" in query else 0
+            if page:
+                with self.lock:
+                    attempts = self.token_attempts.get(page, 0) + 1
+                    self.token_attempts[page] = attempts
+                if attempts == 1:
+                    # Real tokens are not valid right away either
+                    return 200, {"status": "INVALID_REQUEST", "results": []}
+            body = {
+                "status": "OK",
+                "results": [
+                    {
+                        "name": f"Park {page * 20 + i}",
+                        "formatted_address": f"Weg {page * 20 + i}",
+                        "geometry": {"location": {"lat": 52.0, "lng": 13.0}},
+                        "rating": 4.0,
+                        "user_ratings_total": 10,
+                        "place_id": f"p{page * 20 + i}",
+                    }
+                    for i in range(20)
+                ],
+            }
+            if page < 2:
+                body["next_page_token"] = f"page{page + 1}"
+            return 200, body
+
+        time.sleep(self.details_latency)
+        place_id = query["place_id"]
+        return 200, {
+            "status": "OK",
+            "result": {
+                "international_phone_number": f"+49 {place_id}",
+                "website": f"https://example.com/{place_id}",
+                "reviews": [{"text": f"Review for {place_id}"}],
+            },
+        }
+
+
+@pytest.fixture
+def stub():
+    return _PlacesStub()
+
+
+@pytest.fixture
+def scraper(local_server, stub):
+    scraper = DataScraper(delay=0)
+    scraper.places_url = f"{local_server(stub)}/maps/api/place"
+    scraper.PAGE_TOKEN_DELAY = 0.05
+    return scraper
+
+
+def test_all_pages_are_collected_and_enriched(scraper, stub, tmp_path):
+    output = tmp_path / "collected.csv"
+    streamed = []
+    reports = []
+
+    places = scraper.scrape_google_places(
+        "parks",
+        "Berlin",
+        "AIzaTEST",
+        max_workers=60,
+        output_path=str(output),
+        on_place=streamed.append,
+        progress=lambda done, total, **info: reports.append(
+            (done, total, info["bytes"])
+        ),
+    )
+
+    assert [p["place_id"] for p in places] == [f"p{i}" for i in range(60)]
+    assert places[59]["website"] == "https://example.com/p59"
+    assert places[0]["reviews_text"] == "Review for p0"
+    assert len(streamed) == 60
+
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(row["place_id"] for row in rows) == sorted(
+        p["place_id"] for p in places
+    )
+    assert rows[0]["phone"].startswith("+49 p")
+
+    assert reports[-1][:2] == (60, 60)
+    assert reports[-1][2] == scraper.bytes_received > 0
+    # The stale token was retried once per follow-up page
+    assert stub.token_attempts == {1: 2, 2: 2}
+
+
+def test_next_page_is_fetched_while_details_load(scraper, stub):
+    stub.details_latency = 0.3
+    places = scraper.scrape_google_places("parks", "Berlin", "AIzaTEST", max_workers=60)
+
+    assert len(places) == 60
+    searches = [t for path, _, t in stub.requests if path.endswith("/textsearch/json")]
+    first_details = min(
+        t for path, _, t in stub.requests if path.endswith("/details/json")
+    )
+    # Page 2 is requested before the details of page 1 have returned
+    assert searches[1] < first_details + stub.details_latency
+
+
+def test_max_pages_and_no_enrichment(scraper, stub):
+    places = scraper.scrape_google_places(
+        "parks", "Berlin", "AIzaTEST", enrich=False, max_pages=1
+    )
+
+    assert len(places) == 20
+    assert "phone" not in places[0]
+    assert all(path.endswith("/textsearch/json") for path, _, _ in stub.requests)
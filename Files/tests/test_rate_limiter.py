@@ -0,0 +1,178 @@
+"""Shared per-host rate limiter: AIMD rate, retries with backoff, circuit breaker."""
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+import requests
+
+from data_pipeline import DataScraper
+from enhanced_scrapers import GooglePlacesScraper
+from rate_limiter import (
+    HOST_QUOTAS,
+    AdaptiveTokenBucket,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiter,
+    install_rate_limiter,
+    shared_rate_limiter,
+)
+
+
+class _FlakyStub:
+    """Answers with the next scripted (status, body) per path, then 200 OK"""
+
+    def __init__(self):
+        self.script = {}
+        self.hits = Counter()
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.hits[request.path] += 1
+            queue = self.script.get(request.path, [])
+            status, body = queue.pop(0) if queue else (200, {"status": "OK"})
+        return status, body, {"Retry-After": "0"} if status == 429 else {}
+
+
+@pytest.fixture
+def stub():
+    return _FlakyStub()
+
+
+@pytest.fixture
+def server(local_server, stub):
+    return local_server(stub)
+
+
+def _session(limiter):
+    session = requests.Session()
+    install_rate_limiter(session, limiter)
+    return session
+
+
+def test_rate_rises_while_clean_and_halves_on_throttling():
+    bucket = AdaptiveTokenBucket(rate=2.0, max_rate=10.0)
+
+    for _ in range(100):
+        bucket.increase()
+    assert bucket.rate == 10.0
+    bucket.decrease()
+    assert bucket.rate == 5.0
+    for _ in range(20):
+        bucket.decrease()
+    assert bucket.rate == bucket.min_rate == 2.0 / 16
+
+    unlimited = AdaptiveTokenBucket(rate=None)
+    unlimited.increase()
+    unlimited.decrease()
+    assert unlimited.rate is None
+
+
+def test_circuit_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(threshold=3, reset_timeout=0.05)
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    # Half-open: a single trial request, the others keep failing fast
+    assert breaker.allow() and not breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_throttled_and_failed_responses_are_retried(server, stub):
+    limiter = RateLimiter(default_rate=None, backoff_base=0.01)
+    limiter.configure(server, rate=100.0, max_rate=200.0)
+    session = _session(limiter)
+    stub.script = {
+        "/places": [(429, {}), (200, {"status": "OVER_QUERY_LIMIT"}), (503, {})],
+        "/post": [(503, {})],
+    }
+
+    response = session.get(f"{server}/places")
+
+    assert response.status_code == 200 and response.json() == {"status": "OK"}
+    assert stub.hits["/places"] == 4
+    stats = limiter.stats()[server[len("http://") :]]
+    assert (stats["retries"], stats["throttled"], stats["failed"]) == (3, 2, 1)
+    # Three pushbacks halved the rate; the clean answer raised it a step
+    assert stats["rate"] == pytest.approx(100 / 8 + 200 / 50)
+    assert stats["circuit"] == "closed"
+
+    # Non-idempotent requests are sent once
+    assert session.post(f"{server}/post").status_code == 503
+    assert stub.hits["/post"] == 1
+
+
+def test_open_circuit_fails_fast(server, stub):
+    limiter = RateLimiter(
+        default_rate=None, max_retries=1, backoff_base=0.01, breaker_threshold=4
+    )
+    session = _session(limiter)
+    stub.script = {"/down": [(503, {})] * 10}
+
+    assert session.get(f"{server}/down").status_code == 503
+    assert session.get(f"{server}/down").status_code == 503
+    with pytest.raises(CircuitOpenError):
+        session.get(f"{server}/down")
+    # The third call never reached the server
+    assert stub.hits["/down"] == 4
+
+
+def test_sessions_share_one_quota_per_host(server):
+    limiter = RateLimiter(default_rate=None)
+    limiter.configure(server, rate=20.0)
+    first, second = _session(limiter), _session(limiter)
+
+    started = time.monotonic()
+    for i in range(6):
+        (first if i % 2 else second).get(f"{server}/quota")
+    elapsed = time.monotonic() - started
+
+    # One token up front, the other five at 20/s across both sessions
+    assert elapsed >= 0.2
+    assert install_rate_limiter(requests.Session()) is shared_rate_limiter()
+
+
+def test_new_scrapers_never_loosen_a_learned_rate():
+    limiter = RateLimiter()
+    GooglePlacesScraper(api_key="test", delay=1.0, rate_limiter=limiter)
+    places = limiter.host("maps.googleapis.com")
+    assert places.bucket.rate == 1.0
+
+    # Two 429s: the process has learned to slow down to 0.25 rps
+    places.bucket.decrease()
+    places.bucket.decrease()
+    assert places.bucket.rate == 0.25
+
+    GooglePlacesScraper(api_key="test", delay=1.0, rate_limiter=limiter)
+    GooglePlacesScraper(api_key="test", requests_per_second=50, rate_limiter=limiter)
+    DataScraper(delay=0, rate_limiter=limiter)
+    assert limiter.host("maps.googleapis.com") is places
+    assert places.bucket.rate == 0.25
+
+    # A stricter scraper still tightens the shared bucket
+    GooglePlacesScraper(api_key="test", delay=10.0, rate_limiter=limiter)
+    assert places.bucket.rate == 0.1
+
+
+def test_unpaced_scrapers_do_not_lift_a_known_quota():
+    limiter = RateLimiter()
+
+    DataScraper(delay=0, rate_limiter=limiter)
+    GooglePlacesScraper(api_key="test", requests_per_second=100, rate_limiter=limiter)
+
+    assert (
+        limiter.host("maps.googleapis.com").bucket.rate
+        == HOST_QUOTAS["maps.googleapis.com"]
+    )
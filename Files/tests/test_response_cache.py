@@ -0,0 +1,167 @@
+"""Tests for the persistent Google Places response cache."""
+
+import json
+import time
+from unittest.mock import patch
+
+import requests
+
+from data_pipeline import DataScraper
+from enhanced_scrapers import GooglePlacesScraper
+from response_cache import CachedSession, ResponseCache
+
+
+def _json_response(payload, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode("utf-8")
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def test_make_key_ignores_api_key_and_param_order():
+    url = "https://maps.googleapis.com/maps/api/place/details/json"
+
+    endpoint, key_a = ResponseCache.make_key(url, {"place_id": "abc", "key": "one"})
+    _, key_b = ResponseCache.make_key(url + "?key=two", {"place_id": "abc"})
+    _, key_c = ResponseCache.make_key(url, {"place_id": "xyz", "key": "one"})
+
+    assert endpoint == url
+    assert key_a == key_b
+    assert key_a != key_c
+
+
+def test_cached_session_reads_through_and_tracks_stats(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    session = CachedSession(cache)
+    payload = {"status": "OK", "result": {"name": "Tiergarten"}}
+
+    with patch.object(
+        requests.Session, "request", return_value=_json_response(payload)
+    ) as network:
+        first = session.get(
+            "https://example.com/details/json", params={"place_id": "a"}
+        )
+        second = session.get(
+            "https://example.com/details/json", params={"place_id": "a", "key": "new"}
+        )
+
+    assert network.call_count == 1
+    assert first.json() == second.json() == payload
+    assert second.headers["X-Cache"] == "HIT"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+
+
+def test_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResponseCache(path)
+    cache.set("k", "https://example.com/textsearch/json", b'{"status": "OK"}')
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get("k") == b'{"status": "OK"}'
+
+
+def test_error_statuses_are_not_cached(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    session = CachedSession(cache)
+
+    with patch.object(
+        requests.Session,
+        "request",
+        return_value=_json_response({"status": "OVER_QUERY_LIMIT"}),
+    ) as network:
+        session.get("https://example.com/details/json", params={"place_id": "a"})
+        session.get("https://example.com/details/json", params={"place_id": "a"})
+
+    assert network.call_count == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_paginated_searches_are_not_cached(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    session = CachedSession(cache)
+    url = "https://example.com/nearbysearch/json"
+    first_page = {"status": "OK", "results": [], "next_page_token": "t1"}
+
+    with patch.object(
+        requests.Session, "request", return_value=_json_response(first_page)
+    ) as network:
+        session.get(url, params={"keyword": "parks"})
+        session.get(url, params={"keyword": "parks"})
+    assert network.call_count == 2
+
+    with patch.object(
+        requests.Session,
+        "request",
+        return_value=_json_response({"status": "OK", "results": []}),
+    ) as network:
+        session.get(url, params={"pagetoken": "t1"})
+        session.get(f"{url}?pagetoken=t1")
+        session.get(url, params={"pagetoken": "t1"})
+    assert network.call_count == 3
+
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["hits"] == 0
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    cache.set("k", "https://example.com/details/json", b"{}")
+
+    with patch("response_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("k") is None
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_bytes=25)
+    cache.set("old", "e", b"x" * 10)
+    time.sleep(0.01)
+    cache.set("used", "e", b"x" * 10)
+    time.sleep(0.01)
+    assert cache.get("old") is not None  # refresh "old"
+    time.sleep(0.01)
+    cache.set("new", "e", b"x" * 10)
+
+    assert cache.get("used") is None
+    assert cache.get("old") is not None
+    assert cache.get("new") is not None
+
+
+def test_scrapers_use_cached_session(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+
+    google = GooglePlacesScraper(api_key="test", cache=cache)
+    scraper = DataScraper(delay=0, cache=cache)
+
+    assert isinstance(google.session, CachedSession)
+    assert isinstance(scraper.session, CachedSession)
+    assert "User-Agent" in scraper.session.headers
+
+    uncached = GooglePlacesScraper(api_key="test")
+    assert not isinstance(uncached.session, CachedSession)
+
+
+def test_details_fetched_once_across_runs(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    payload = {
+        "status": "OK",
+        "result": {"website": "https://example.com", "reviews": [{"text": "Schön"}]},
+    }
+
+    with patch.object(
+        requests.Session, "request", return_value=_json_response(payload)
+    ) as network:
+        for _ in range(3):
+            scraper = DataScraper(delay=0, cache=cache)
+            details = scraper.get_place_details("place-1", api_key="secret")
+            assert details["website"] == "https://example.com"
+
+    assert network.call_count == 1
+    assert cache.stats()["hits"] == 2
@@ -169,9 +169,9 @@ class TestReviewDemandAnalyzer:
     def test_analyze_review_sentiment_with_mock_data(self, analyzer, sample_reviews):
         """Test sentiment analysis with mocked review data"""
 
-        # Mock the get_reviews_for_category method
+        # Mock the review stream
         with patch.object(
-            analyzer, "get_reviews_for_category", return_value=sample_reviews
+            analyzer, "iter_reviews_for_category", return_value=sample_reviews
         ):
             analysis = analyzer.analyze_review_sentiment(
                 category="parks",
@@ -200,7 +200,7 @@ class TestReviewDemandAnalyzer:
         """Test content idea generation"""
 
         with patch.object(
-            analyzer, "get_reviews_for_category", return_value=sample_reviews
+            analyzer, "iter_reviews_for_category", return_value=sample_reviews
         ):
             ideas = analyzer.generate_content_ideas(
                 category="parks", city="Berlin", max_places=2
@@ -238,7 +238,7 @@ class TestReviewDemandAnalyzer:
     def test_empty_reviews_handling(self, analyzer):
         """Test analyzer handles empty review lists gracefully"""
 
-        with patch.object(analyzer, "get_reviews_for_category", return_value=[]):
+        with patch.object(analyzer, "iter_reviews_for_category", return_value=[]):
             analysis = analyzer.analyze_review_sentiment(
                 category="parks", city="Berlin", min_reviews=1, max_places=5
             )
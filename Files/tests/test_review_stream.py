@@ -0,0 +1,129 @@
+"""Concurrent review fetching and streaming analysis in ReviewDemandAnalyzer."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from enhanced_scrapers import ScrapedLocation
+from niche_research import ReviewDemandAnalyzer
+
+
+def _analyzer(max_concurrency=4):
+    analyzer = ReviewDemandAnalyzer(api_key="test", delay=0)
+    analyzer.scraper.max_concurrency = max_concurrency
+    return analyzer
+
+
+def _places(count):
+    return [
+        ScrapedLocation(name=f"Park {i}", address="", city="Berlin", place_id=f"p{i}")
+        for i in range(count)
+    ]
+
+
+def _reviews(place_id):
+    number = int(place_id[1:])
+    return [
+        {
+            "rating": 1,
+            "text": f"Leider keine Toiletten im Park {number}",
+            "author": "a",
+            "time": 0,
+        },
+        {
+            "rating": 5,
+            "text": "Toller Spielplatz und viel Schatten",
+            "author": "b",
+            "time": 0,
+        },
+        {"rating": 3, "text": "Ganz okay", "author": "c", "time": 0},
+    ]
+
+
+def test_reviews_are_fetched_concurrently():
+    analyzer = _analyzer(max_concurrency=8)
+
+    def slow_reviews(place_id):
+        time.sleep(0.1)
+        return _reviews(place_id)
+
+    with patch.object(
+        analyzer.scraper, "search_places", return_value=_places(8)
+    ), patch.object(analyzer, "_get_place_reviews", side_effect=slow_reviews):
+        started = time.perf_counter()
+        reviews = analyzer.get_reviews_for_category("parks", "Berlin", max_places=8)
+        elapsed = time.perf_counter() - started
+
+    assert len(reviews) == 24
+    assert {r["place_id"] for r in reviews} == {f"p{i}" for i in range(8)}
+    assert all(r["place_name"] == f"Park {r['place_id'][1:]}" for r in reviews)
+    # Sequential fetching would take 0.8 s
+    assert elapsed < 0.5
+
+
+def test_reviews_are_yielded_before_all_places_finish():
+    analyzer = _analyzer(max_concurrency=2)
+    first_consumed = threading.Event()
+    waited = []
+
+    def reviews(place_id):
+        if place_id == "p1":
+            # Only finishes once the consumer has seen the first review
+            waited.append(first_consumed.wait(timeout=2))
+        return _reviews(place_id)
+
+    with patch.object(
+        analyzer.scraper, "search_places", return_value=_places(2)
+    ), patch.object(analyzer, "_get_place_reviews", side_effect=reviews):
+        stream = analyzer.iter_reviews_for_category("parks", "Berlin")
+        first = next(stream)
+        first_consumed.set()
+        rest = list(stream)
+
+    assert first["place_id"] == "p0"
+    assert waited == [True]
+    assert len(rest) == 5
+
+
+def test_stream_skips_places_without_id_and_respects_max_places():
+    analyzer = _analyzer()
+    places = _places(5)
+    places[1].place_id = None
+
+    with patch.object(
+        analyzer.scraper, "search_places", return_value=places
+    ), patch.object(analyzer, "_get_place_reviews", side_effect=_reviews) as fetch:
+        reviews = analyzer.get_reviews_for_category("parks", "Berlin", max_places=3)
+
+    assert sorted(call.args[0] for call in fetch.call_args_list) == ["p0", "p2"]
+    assert len(reviews) == 6
+
+
+def test_streaming_analysis_matches_list_based_extraction():
+    analyzer = _analyzer()
+    reviews = [r for i in range(20) for r in _reviews(f"p{i}")]
+
+    with patch.object(
+        analyzer, "iter_reviews_for_category", return_value=iter(reviews)
+    ):
+        analysis = analyzer.analyze_review_sentiment("parks", "Berlin", min_reviews=1)
+
+    complaints = [r["text"] for r in reviews if r["rating"] <= 2]
+    praise = [r["text"] for r in reviews if r["rating"] >= 4]
+
+    assert analysis["total_reviews_analyzed"] == 60
+    assert analysis["avg_rating"] == 3.0
+    assert analysis["sentiment_score"] == 0.6
+    assert (
+        analysis["top_complaints"]
+        == analyzer._extract_top_phrases(complaints, negative=True)[:15]
+    )
+    assert analysis["top_praise"] == analyzer._extract_top_phrases(praise)[:15]
+    # Every keyword is exclusive to one side here, so all of them are distinctive
+    assert sorted(analysis["complaint_keywords"]) == sorted(
+        analyzer._extract_keywords(complaints, negative=True)
+    )
+    assert sorted(analysis["praise_keywords"]) == sorted(
+        analyzer._extract_keywords(praise)
+    )
+    assert "toilets" in [feature for feature, _ in analysis["unmet_needs"]]
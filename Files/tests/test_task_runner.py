@@ -0,0 +1,215 @@
+"""TaskRunner: worker pool, UI event queue, progress and cancellation."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data_pipeline import DataScraper
+from enhanced_scrapers import ScrapedLocation
+from niche_research import ReviewDemandAnalyzer
+from task_runner import CancelToken, Progress, TaskCancelled, TaskRunner
+
+
+def _drain_until(runner, condition, timeout=3.0):
+    """Stand-in for the Tk mainloop: drain events until ``condition()``"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        runner.drain()
+        time.sleep(0.005)
+
+
+def test_results_and_callbacks_arrive_in_the_ui_thread():
+    runner = TaskRunner(max_workers=2)
+    ui_thread = threading.current_thread()
+    seen = []
+
+    def task(ctx, value):
+        assert threading.current_thread() is not ui_thread
+        ctx.call(lambda: seen.append(("call", threading.current_thread() is ui_thread)))
+        return value * 2
+
+    runner.submit(
+        "double", task, 21, on_done=lambda result: seen.append(("done", result))
+    )
+    _drain_until(runner, lambda: len(seen) == 2)
+
+    assert seen == [("call", True), ("done", 42)]
+    assert runner.running() == []
+
+
+def test_group_limits_concurrency_and_errors_are_reported():
+    runner = TaskRunner(max_workers=4)
+    release = threading.Event()
+    errors = []
+
+    first = runner.submit("collect", lambda ctx: release.wait(2), group="collect")
+    second = runner.submit("collect", lambda ctx: None, group="collect")
+    assert first is not None and second is None
+    assert runner.is_running("collect")
+
+    release.set()
+    _drain_until(runner, lambda: not runner.is_running("collect"))
+    assert runner.submit("collect", lambda ctx: None, group="collect") is not None
+
+    def fail(ctx):
+        raise ValueError("kaputt")
+
+    runner.submit("fail", fail, on_error=errors.append)
+    _drain_until(runner, lambda: errors)
+    assert str(errors[0]) == "kaputt"
+
+
+def test_cancel_stops_a_task_at_its_next_check():
+    runner = TaskRunner()
+    steps = []
+    cancelled = []
+
+    def task(ctx):
+        for i in range(1000):
+            ctx.check()
+            steps.append(i)
+            time.sleep(0.002)
+
+    handle = runner.submit(
+        "loop", task, group="loop", on_cancel=lambda: cancelled.append(True)
+    )
+    _drain_until(runner, lambda: len(steps) > 3)
+    assert runner.cancel("loop") is True
+    _drain_until(runner, lambda: cancelled)
+
+    assert len(steps) < 1000
+    assert handle.token.cancelled
+
+
+def test_progress_is_coalesced_and_estimates_eta():
+    runner = TaskRunner()
+    reports = []
+
+    def task(ctx):
+        for done in range(1, 101):
+            ctx.progress(done, 100, unit="Orte", bytes=done * 1024)
+        time.sleep(0.01)
+
+    runner.submit("collect", task, on_progress=reports.append)
+    _drain_until(runner, lambda: not runner.running())
+    runner.drain()
+
+    # 100 reports from the worker, far fewer events for Tk
+    assert 1 <= len(reports) < 100
+    last = reports[-1]
+    assert (last.done, last.total, last.unit) == (100, 100, "Orte")
+    assert last.eta == 0
+    assert last.describe() == "collect: 100/100 Orte · 100 KB · ETA 0:00"
+    assert Progress(1, "x", done=1, total=4).fraction == 0.25
+
+
+def test_closing_the_gui_cancels_running_tasks():
+    gui_app = pytest.importorskip("gui_app")
+    runner = TaskRunner()
+    started = threading.Event()
+
+    def task(ctx):
+        started.set()
+        while True:
+            ctx.check()
+            time.sleep(0.01)
+
+    handle = runner.submit("collect", task, group="collect")
+    assert started.wait(1)
+    root = MagicMock()
+
+    gui_app.ADSPillarGUI.on_close(SimpleNamespace(tasks=runner, root=root))
+
+    root.destroy.assert_called_once()
+    assert handle.token.cancelled
+    # The worker leaves at its next check, so interpreter exit does not wait
+    handle.future.result(timeout=1)
+    assert runner.running() == []
+
+
+def test_call_sync_returns_the_ui_result():
+    runner = TaskRunner()
+    answers = []
+
+    runner.submit(
+        "ask",
+        lambda ctx: ctx.call_sync(lambda question: question == "ok?", "ok?"),
+        on_done=answers.append,
+    )
+    _drain_until(runner, lambda: answers)
+    assert answers == [True]
+
+
+def test_shutdown_drops_queued_tasks():
+    runner = TaskRunner(max_workers=1)
+    release = threading.Event()
+    running = runner.submit("busy", lambda ctx: release.wait(1))
+    queued = runner.submit("later", lambda ctx: "never started")
+
+    runner.shutdown()
+    release.set()
+
+    running.future.result(timeout=1)
+    assert running.token.cancelled and queued.future.cancelled()
+    assert runner.running() == []
+
+
+def test_shutdown_releases_tasks_waiting_for_the_ui():
+    runner = TaskRunner()
+    # Nobody drains the queue any more: the window is already gone
+    blocked = runner.submit("ask", lambda ctx: ctx.call_sync(lambda: "never answered"))
+
+    runner.shutdown()
+
+    blocked.future.result(timeout=1)
+    assert runner.running() == []
+    # Calls from other threads after shutdown give up as well
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        late = pool.submit(runner.call_sync, print)
+        with pytest.raises(TaskCancelled):
+            late.result(timeout=1)
+
+
+def test_scrapers_honor_cancel_tokens():
+    token = CancelToken()
+    token.cancel()
+    scraper = DataScraper(delay=0)
+    with patch.object(scraper.session, "get") as get, pytest.raises(TaskCancelled):
+        scraper.scrape_google_places("parks", "Berlin", "AIzaKEY", cancel_token=token)
+    get.assert_not_called()
+
+    analyzer = ReviewDemandAnalyzer(api_key="test", delay=0)
+    token = CancelToken()
+    places = [
+        ScrapedLocation(name=f"Park {i}", address="", city="Berlin", place_id=f"p{i}")
+        for i in range(20)
+    ]
+    fetched = []
+    done = []
+
+    def slow_reviews(place_id):
+        fetched.append(place_id)
+        time.sleep(0.05)
+        return [{"rating": 5, "text": "schön", "author": place_id, "time": 0}]
+
+    def progress(count, total):
+        done.append((count, total))
+        if count == 2:
+            token.cancel()
+
+    with patch.object(
+        analyzer.scraper, "search_places", return_value=places
+    ), patch.object(analyzer, "_get_place_reviews", side_effect=slow_reviews):
+        with pytest.raises(TaskCancelled):
+            analyzer.analyze_review_sentiment(
+                "parks", "Berlin", min_reviews=1, cancel_token=token, progress=progress
+            )
+
+    assert done[:2] == [(1, 20), (2, 20)]
+    assert len(fetched) < 20
+    assert analyzer.analysis_cache.stats()["entries"] == 0